@@ -0,0 +1,363 @@
+"""Asyncio run mode for the collect/process/send pipeline."""
+
+import asyncio
+import imaplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from app.src.collectors.base import AsyncCollector, Collector, SyncCollectorAdapter
+from app.src.models import SourceItem
+from app.src.processors.base import AsyncProcessor, Processor, SyncProcessorAdapter
+from app.src.senders.base import AsyncSender, Sender, SyncSenderAdapter
+from app.src.utils.deadline import Deadline
+
+if TYPE_CHECKING:
+    from app.src.summarizer import NewsSummarizer
+
+
+class AsyncEngine:
+    """Runs all domains on one event loop with bounded concurrency.
+
+    Blocking collectors, processors and senders are adapted through the
+    loop's executor, so their I/O overlaps across domains and sources.
+    ``global.async_limits`` bounds concurrency per resource type. Domain
+    deadlines and collector timeouts cancel the work running in the
+    executor too, as in the threaded run mode.
+    """
+
+    DEFAULT_LIMITS = MappingProxyType(
+        {"domains": 8, "collect": 8, "process": 4, "send": 4},
+    )
+
+    def __init__(self, summarizer: "NewsSummarizer"):
+        """Initialize the engine.
+
+        Args:
+            summarizer: Summarizer providing configuration and factories
+        """
+        self.summarizer = summarizer
+        self.logger = summarizer.logger
+        self.settings = summarizer._global_settings()
+        self.limits = {
+            **self.DEFAULT_LIMITS,
+            **(self.settings.get("async_limits") or {}),
+        }
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def run(self, domains: list[dict]) -> list[tuple[str, str, float]]:
+        """Run all domains to completion.
+
+        Args:
+            domains: Domain configurations
+
+        Returns:
+            List of (domain name, status, wall time in seconds) in config order
+        """
+        return asyncio.run(self._run(domains))
+
+    async def _run(self, domains: list[dict]) -> list[tuple[str, str, float]]:
+        """Run all domains on the current event loop.
+
+        Args:
+            domains: Domain configurations
+
+        Returns:
+            List of (domain name, status, wall time in seconds) in config order
+        """
+        workers = sum(self.limits[key] for key in ("collect", "process", "send"))
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="async"),
+        )
+        self._semaphores = {
+            key: asyncio.Semaphore(max(1, int(limit)))
+            for key, limit in self.limits.items()
+        }
+        return list(await asyncio.gather(*(self._run_domain(d) for d in domains)))
+
+    async def _run_domain(self, domain: dict) -> tuple[str, str, float]:
+        """Run one domain under the domain limit and deadline.
+
+        Args:
+            domain: Domain configuration dictionary
+
+        Returns:
+            Tuple of (domain name, status, wall time in seconds)
+        """
+        domain_name = domain.get("name", "unknown")
+        deadline = Deadline(domain.get("timeout", self.settings.get("domain_timeout")))
+        timeout = deadline.timeout
+
+        async with self._semaphores["domains"]:
+            start = time.monotonic()
+            deadline.start()
+            try:
+                status = await asyncio.wait_for(
+                    self._process_domain(domain, deadline),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                # Stops work still running in the executor at its next
+                # checkpoint, before any send or acknowledgement
+                deadline.cancel()
+                self.logger.error(
+                    f"Domain {domain_name} missed its deadline of {timeout}s",
+                )
+                status = "timed out"
+            except Exception:
+                self.logger.exception(f"Domain {domain_name} failed")
+                status = "error"
+            return domain_name, status, time.monotonic() - start
+
+    async def _process_domain(self, domain: dict, deadline: Deadline) -> str:
+        """Collect, process and send a single domain.
+
+        Args:
+            domain: Domain configuration dictionary
+            deadline: Deadline of the domain run
+
+        Returns:
+            Short status of the domain run (e.g., "sent", "no items")
+        """
+        domain_name = domain.get("name", "unknown")
+        self.logger.info(f"Processing domain: {domain_name}")
+
+        stages = self.summarizer._create_stages(domain)
+        try:
+            collectors = [
+                self._as_async_collector(c)
+                for c in self.summarizer._create_collectors(domain)
+            ]
+            items, delivered = await self._collect_items(collectors, deadline)
+            items = await asyncio.to_thread(
+                self.summarizer._apply_stages,
+                items,
+                stages,
+            )
+            if not items:
+                self.logger.warning(f"No items collected for domain {domain_name}")
+                return "no items"
+
+            processed_content = await self._process_items(items, domain, deadline)
+            if not processed_content:
+                self.logger.error(f"Failed to process items for domain {domain_name}")
+                return "processing failed"
+
+            processed_content = self.summarizer._finalize_report(
+                processed_content,
+                stages,
+            )
+            if self.summarizer._deadline_expired(deadline, domain_name, "sending"):
+                return "timed out"
+            if not await self._send_report(processed_content, domain):
+                return "send failed"
+            if self.summarizer._deadline_expired(
+                deadline,
+                domain_name,
+                "acknowledging",
+            ):
+                return "timed out"
+            await self._acknowledge_collectors(delivered)
+            return "sent"
+
+        except TimeoutError:
+            self.logger.error(f"Domain {domain_name} ran out of time")
+            return "timed out"
+
+        except self.summarizer.DOMAIN_ERRORS:
+            self.logger.exception(f"Error processing domain {domain_name}")
+            return "error"
+
+        finally:
+            await asyncio.to_thread(self.summarizer._close_stages, stages)
+
+    async def _collect_items(
+        self,
+        collectors: list[AsyncCollector],
+        deadline: Deadline,
+    ) -> tuple[list[SourceItem], list[AsyncCollector]]:
+        """Run all collectors of a domain concurrently.
+
+        Args:
+            collectors: Async collector instances
+            deadline: Deadline of the domain run
+
+        Returns:
+            Tuple of (collected SourceItem objects, collectors that finished)
+        """
+        default_timeout = self.settings.get("collector_timeout", 600)
+        results = await asyncio.gather(
+            *(
+                self._collect_one(
+                    c,
+                    c.config.get("timeout", default_timeout),
+                    deadline,
+                )
+                for c in collectors
+            ),
+        )
+
+        all_items: list[SourceItem] = []
+        delivered: list[AsyncCollector] = []
+        for collector, items in zip(collectors, results):
+            if items is None:
+                continue
+            all_items.extend(items)
+            delivered.append(collector)
+            self.logger.info(f"Collector {collector.name} collected {len(items)} items")
+        return all_items, delivered
+
+    async def _collect_one(
+        self,
+        collector: AsyncCollector,
+        timeout: float | None,
+        deadline: Deadline,
+    ) -> list[SourceItem] | None:
+        """Run one collector under the collect limit and its timeout.
+
+        A collector that times out is cancelled, so it commits nothing,
+        unless it has already started committing; then its items are used.
+
+        Args:
+            collector: Async collector instance
+            timeout: Timeout in seconds, counted from when the collector starts
+            deadline: Deadline of the domain run, cutting the timeout short
+
+        Returns:
+            Collected items, or None if the collector failed or timed out
+        """
+        async with self._semaphores["collect"]:
+            self.logger.info(f"Running collector: {collector.name}")
+            task = asyncio.ensure_future(collector.collect())
+            try:
+                done, _ = await asyncio.wait({task}, timeout=deadline.bound(timeout))
+                if not done:
+                    if collector.cancel():
+                        task.cancel()
+                        self.logger.error(
+                            f"Collector {collector.name} timed out after {timeout}s",
+                        )
+                        return None
+                    self.logger.warning(
+                        f"Collector {collector.name} timed out while committing, "
+                        "using its items",
+                    )
+                return await task
+            except asyncio.CancelledError:
+                # The domain was cancelled; keep the executor thread from
+                # committing items nobody will send
+                collector.cancel()
+                task.cancel()
+                raise
+            except Exception:
+                self.logger.exception(f"Collector {collector.name} failed")
+            return None
+
+    async def _acknowledge_collectors(self, collectors: list[AsyncCollector]) -> None:
+        """Let collectors apply deferred side effects after a successful send.
+
+        Args:
+            collectors: Async collector instances of the domain
+        """
+        for collector in collectors:
+            try:
+                async with self._semaphores["collect"]:
+                    await collector.acknowledge()
+            except imaplib.IMAP4.error:
+                self.logger.exception(f"Collector {collector.name} ack failed")
+
+    async def _process_items(
+        self,
+        items: list[SourceItem],
+        domain: dict,
+        deadline: Deadline,
+    ) -> str | None:
+        """Process items using the configured processor.
+
+        Args:
+            items: List of SourceItem objects
+            domain: Domain configuration
+            deadline: Deadline of the domain run, bounding the processor
+
+        Returns:
+            Processed content or None
+        """
+        processor = self.summarizer._create_domain_processor(domain, deadline)
+        if processor is None:
+            return None
+
+        try:
+            async with self._semaphores["process"]:
+                return await self._as_async_processor(processor).process(items)
+        except self.summarizer.PROCESSING_ERRORS:
+            self.logger.exception("Processing failed")
+            return None
+
+    async def _send_report(self, content: str, domain: dict) -> bool:
+        """Send report using the configured sender.
+
+        Args:
+            content: Processed content to send
+            domain: Domain configuration
+
+        Returns:
+            True if send was successful
+        """
+        created = self.summarizer._create_domain_sender(domain)
+        if created is None:
+            return False
+        sender, subject = created
+
+        try:
+            async with self._semaphores["send"]:
+                success = await self._as_async_sender(sender).send(content, subject)
+            if success:
+                self.logger.info(f"Report sent successfully: {subject}")
+            return success
+        except self.summarizer.SEND_ERRORS:
+            self.logger.exception("Failed to send report")
+            return False
+
+    @staticmethod
+    def _as_async_collector(collector: Collector | AsyncCollector) -> AsyncCollector:
+        """Adapt a collector to the async interface.
+
+        Args:
+            collector: Blocking or async collector
+
+        Returns:
+            Async collector
+        """
+        if isinstance(collector, AsyncCollector):
+            return collector
+        return SyncCollectorAdapter(collector)
+
+    @staticmethod
+    def _as_async_processor(processor: Processor | AsyncProcessor) -> AsyncProcessor:
+        """Adapt a processor to the async interface.
+
+        Args:
+            processor: Blocking or async processor
+
+        Returns:
+            Async processor
+        """
+        if isinstance(processor, AsyncProcessor):
+            return processor
+        return SyncProcessorAdapter(processor)
+
+    @staticmethod
+    def _as_async_sender(sender: Sender | AsyncSender) -> AsyncSender:
+        """Adapt a sender to the async interface.
+
+        Args:
+            sender: Blocking or async sender
+
+        Returns:
+            Async sender
+        """
+        if isinstance(sender, AsyncSender):
+            return sender
+        return SyncSenderAdapter(sender)
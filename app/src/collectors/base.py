@@ -1,14 +1,17 @@
-"""Base collector abstract class."""
+"""Base collector abstract classes."""
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
 from app.src.models import SourceItem
 from app.src.utils.logger import get_logger
 
 
-class Collector(ABC):
-    """Abstract base class for all collectors."""
+class _CollectorBase(ABC):
+    """State shared by blocking and async collectors."""
 
     def __init__(self, config: dict[str, Any], name: str):
         """Initialize the collector.
@@ -20,6 +23,52 @@ class Collector(ABC):
         self.config = config
         self.name = name
         self.logger = get_logger(f"collector.{name}")
+        self._commit_lock = threading.Lock()
+        self._cancelled = False
+        self._committing = False
+
+    def cancel(self) -> bool:
+        """Give up on a running collection.
+
+        Called when the caller discards the items (e.g. on timeout), so the
+        collector must not commit side effects of the collection. Collectors
+        with such side effects call _begin_commit() before applying them.
+
+        Returns:
+            False if the collector had already started committing; its items
+            are final and should be used
+        """
+        with self._commit_lock:
+            if self._committing:
+                return False
+            self._cancelled = True
+            return True
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the collection was cancelled."""
+        return self._cancelled
+
+    def _begin_commit(self) -> bool:
+        """Claim the right to commit side effects of the collection.
+
+        Returns:
+            False if the collection was cancelled and nothing may be committed
+        """
+        with self._commit_lock:
+            if self._cancelled:
+                return False
+            self._committing = True
+            return True
+
+    @property
+    def source_type(self) -> str:
+        """Get the source type identifier."""
+        return self.config.get("type", "unknown")
+
+
+class Collector(_CollectorBase):
+    """Abstract base class for all collectors."""
 
     @abstractmethod
     def collect(self) -> list[SourceItem]:
@@ -30,7 +79,74 @@ class Collector(ABC):
         """
         pass
 
+    def iter_items(self) -> Iterator[SourceItem]:
+        """Yield items as soon as they are collected.
+
+        Used by the streaming pipeline. The default implementation yields
+        the result of collect(); collectors that produce items one by one
+        should override it.
+
+        Returns:
+            Iterator over SourceItem objects
+        """
+        yield from self.collect()
+
+    def acknowledge(self) -> None:
+        """Confirm that collected items were delivered.
+
+        Called after the domain report has been sent successfully. Collectors
+        that defer side effects (e.g. marking emails as read) apply them here.
+        """
+
+
+class AsyncCollector(_CollectorBase):
+    """Abstract base class for collectors running on an asyncio event loop."""
+
+    @abstractmethod
+    async def collect(self) -> list[SourceItem]:
+        """Collect items from the source.
+
+        Returns:
+            List of SourceItem objects
+        """
+
+    async def acknowledge(self) -> None:
+        """Confirm that collected items were delivered."""
+
+
+class SyncCollectorAdapter(AsyncCollector):
+    """Runs a blocking Collector in the event loop's default executor."""
+
+    def __init__(self, collector: Collector):
+        """Wrap a blocking collector.
+
+        Args:
+            collector: Collector to run in a worker thread
+        """
+        super().__init__(collector.config, collector.name)
+        self.collector = collector
+
+    async def collect(self) -> list[SourceItem]:
+        """Collect items on a worker thread.
+
+        Returns:
+            List of SourceItem objects
+        """
+        return await asyncio.to_thread(self.collector.collect)
+
+    async def acknowledge(self) -> None:
+        """Acknowledge delivery on a worker thread."""
+        await asyncio.to_thread(self.collector.acknowledge)
+
+    def cancel(self) -> bool:
+        """Cancel the wrapped collector.
+
+        Returns:
+            False if the wrapped collector had already started committing
+        """
+        return self.collector.cancel()
+
     @property
-    def source_type(self) -> str:
-        """Get the source type identifier."""
-        return self.config.get("type", "unknown")
+    def cancelled(self) -> bool:
+        """Whether the wrapped collector was cancelled."""
+        return self.collector.cancelled
@@ -1,7 +1,11 @@
 """Email collector using IMAP."""
 
 import email
+import hashlib
 import imaplib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
 from datetime import datetime, timedelta
 from email.header import decode_header
 from email.message import Message
@@ -9,12 +13,40 @@ from typing import Any
 
 from app.src.collectors.base import Collector
 from app.src.models import SourceItem
+from app.src.utils.clean_workers import (
+    Candidate,
+    clean_candidate_batch,
+    clean_candidates,
+    discard_clean_pool,
+    get_clean_pool,
+)
+from app.src.utils.disk_cache import DiskCache
 from app.src.utils.html_cleaner import HTMLCleaner
+from app.src.utils.imap_pool import get_imap_pool
+from app.src.utils.imap_utils import (
+    BodyPart,
+    chunked,
+    compress_message_set,
+    find_text_parts,
+    parse_bodystructure,
+    parse_fetch_response,
+    parse_status_value,
+)
+from app.src.utils.mail_filter import HeaderFilter
+from app.src.utils.sync_state import SyncStateStore
 
 
 class EmailCollector(Collector):
     """Collector that reads emails from an IMAP mailbox."""
 
+    # Header fields fetched when the full message is not downloaded
+    HEADER_FIELDS = "BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE MESSAGE-ID LIST-ID)]"
+    # Boundary of the multipart wrapper built around partially fetched bodies
+    PARTIAL_BOUNDARY = "=_news_summarizer_partial_fetch"
+
+    # Maximum UIDs per UID STORE command when flagging messages as read
+    STORE_BATCH_SIZE = 500
+
     def __init__(self, config: dict[str, Any], name: str):
         """Initialize the email collector.
 
@@ -30,62 +62,372 @@ class EmailCollector(Collector):
         self.mailbox = config.get("mailbox", "INBOX")
         self.mark_as_seen = config.get("mark_as_seen", True)
         self.time_range_days = config.get("time_range_days", 1)
+        self.fetch_batch_size = config.get("fetch_batch_size", 50)
+        self.sync_mode = config.get("sync_mode", "unseen")  # "unseen" or "uid"
+        self.sync_state = SyncStateStore(
+            config.get("state_file", "app/state/imap_sync.json"),
+        )
+        self._state_key = SyncStateStore.make_key(self.email_account, self.mailbox)
+        self._pool_key = (self.imap_server, self.imap_port, self.email_account)
+        # "on_collect" flags messages at the end of collect(), "after_send"
+        # waits for acknowledge() so a failed run leaves them unread
+        self.seen_flag_mode = config.get("seen_flag_mode", "on_collect")
+        # Rules applied to headers before bodies are downloaded (two-phase mode)
+        self.header_filter = HeaderFilter.from_config(config.get("header_filter"))
+        # Download only the text part selected from BODYSTRUCTURE
+        self.partial_fetch = config.get("partial_fetch", False)
+        # Extra line patterns removed by the HTML cleaner for this mailbox
+        self.filter_patterns = config.get("filter_patterns", [])
+        # HTML-to-text backend: "html2text" (fidelity) or "fast" (html.parser)
+        self.html_extractor = config.get("html_extractor", "html2text")
+        # Worker processes for HTML cleaning (0 cleans inline on this thread)
+        self.clean_workers = config.get("clean_workers", 0)
+        # Messages sent to a cleaning worker per task
+        self.clean_chunksize = max(1, config.get("clean_chunksize", 8))
+        # Cleaned bodies keyed by Message-ID (or content hash) so retries and
+        # reruns skip downloading and cleaning
+        self.body_cache = DiskCache.from_config(
+            config.get("body_cache"),
+            "app/state/body_cache.sqlite3",
+            default_ttl_hours=48,
+            default_max_mb=200,
+        )
+        self._uidvalidity: int | None = None
+        self._uidnext: int | None = None
+        self._pending_seen: list[int] = []
+        self._pending_watermark: tuple[list[bytes], set[int]] | None = None
 
     def collect(self) -> list[SourceItem]:
-        """Collect unread emails from the configured mailbox.
+        """Collect new emails from the configured mailbox.
 
         Returns:
             List of SourceItem objects
         """
+        items = list(self.iter_items())
+        self.logger.info(f"Collected {len(items)} items from email")
+        return items
+
+    def iter_items(self) -> Iterator[SourceItem]:
+        """Yield new emails from the configured mailbox as they are parsed.
+
+        Seen flags and the UID watermark are only committed once the mailbox
+        has been read completely; closing the iterator early or cancelling
+        the collection skips them.
+
+        Returns:
+            Iterator over SourceItem objects
+        """
         self.logger.info(f"Starting email collection from {self.email_account}")
 
-        items: list[SourceItem] = []
         mail = None
+        clean_pool = None
+        # Cleaning tasks in submission order; bounded so fetching cannot
+        # run arbitrarily far ahead of the workers
+        cleaning: deque[tuple[list, Future]] = deque()
         try:
-            mail = self._connect()
+            try:
+                mail = get_imap_pool().acquire(
+                    self._pool_key,
+                    self._connect,
+                    cancelled=lambda: self.cancelled,
+                )
+            except TimeoutError:
+                self.logger.warning(
+                    "Collection cancelled while waiting for an IMAP connection",
+                )
+                return
 
             # 使用 select + search 获取未读邮件
             status, msg_count = mail.select(self.mailbox)
 
             if status != "OK":
                 self.logger.error(f"Failed to select mailbox: {status}")
-                return items
+                return
 
             self.logger.info(f"Selected mailbox, {msg_count[0]} messages")
 
-            search_criteria = self._build_search_criteria()
-            _, message_ids = mail.search(None, search_criteria)
-            message_id_list = message_ids[0].split()
-
-            self.logger.info(f"Found {len(message_id_list)} emails to process")
-
-            for msg_id in message_id_list:
+            uid_list = self._search_uids(mail)
+
+            self.logger.info(f"Found {len(uid_list)} emails to process")
+
+            handled_uids: set[int] = set()
+            self._pending_seen = []
+            self._pending_watermark = None
+
+            fetch_uids = uid_list
+            if self.header_filter:
+                fetch_uids, rejected_uids = self._prefilter(mail, uid_list)
+                handled_uids.update(int(uid) for uid in rejected_uids)
+
+            if self.clean_workers > 0 and fetch_uids:
+                clean_pool = get_clean_pool(
+                    self.clean_workers,
+                    self.filter_patterns,
+                    self.html_extractor,
+                )
+            max_cleaning = self.clean_workers * 4
+
+            for batch in chunked(fetch_uids, self.fetch_batch_size):
+                if self.cancelled:
+                    self.logger.warning("Collection cancelled, stopping fetch")
+                    return
+                if self.body_cache:
+                    cached, batch = self._lookup_cached(mail, batch)
+                    handled_uids.update(int(uid) for uid, _ in cached)
+                    yield from self._accept(iter(cached))
+                    if not batch:
+                        continue
                 try:
-                    item = self._process_email(mail, msg_id)
-                    if item:
-                        items.append(item)
-                        if self.mark_as_seen:
-                            mail.store(msg_id, "+FLAGS", "\\Seen")
-                except (imaplib.IMAP4.error, email.message.MessageError) as e:  # noqa: PERF203
-                    self.logger.exception(f"Error processing email {msg_id}: {e}")
+                    if self.partial_fetch:
+                        fetched = self._fetch_partial_batch(mail, batch)
+                    else:
+                        fetched = self._fetch_batch(mail, batch)
+                except imaplib.IMAP4.error:
+                    self.logger.exception(f"Error fetching emails {batch}")
+                    continue
+
+                handled_uids.update(int(uid) for uid, _ in fetched)
+                if clean_pool:
+                    self._submit_cleaning(clean_pool, fetched, cleaning)
+                    parsed = self._drain_cleaning(clean_pool, cleaning, max_cleaning)
+                else:
+                    parsed = self._parse_fetched(fetched)
+                yield from self._accept(parsed)
+
+            yield from self._accept(self._drain_cleaning(clean_pool, cleaning, 0))
+
+            if self.sync_mode == "uid":
+                self._pending_watermark = (uid_list, handled_uids)
+
+            if self.seen_flag_mode != "after_send":
+                if not self._begin_commit():
+                    self.logger.warning(
+                        "Collection cancelled, leaving emails unflagged and the "
+                        "UID watermark unchanged",
+                    )
+                    return
+                self._commit(mail)
 
         except imaplib.IMAP4.error as e:
             self.logger.exception(f"Failed to collect emails: {e}")
 
         finally:
+            # The pool is shared; only drop this collection's queued tasks
+            for _, future in cleaning:
+                future.cancel()
+            if self.body_cache:
+                self.body_cache.close()
             if mail:
+                self._release_connection(mail)
+
+    def _accept(
+        self,
+        parsed: Iterator[tuple[bytes, SourceItem | None]],
+    ) -> Iterator[SourceItem]:
+        """Yield parsed items and remember their UIDs for the Seen flag.
+
+        Args:
+            parsed: (uid, item) pairs, item being None for unusable messages
+
+        Returns:
+            Iterator over SourceItem objects
+        """
+        for uid, item in parsed:
+            if item:
+                if self.mark_as_seen:
+                    self._pending_seen.append(int(uid))
+                yield item
+
+    def _parse_fetched(
+        self,
+        fetched: list[tuple[bytes, bytes]],
+    ) -> Iterator[tuple[bytes, SourceItem | None]]:
+        """Parse and clean fetched messages on the current thread.
+
+        Args:
+            fetched: (uid, raw message) pairs
+
+        Returns:
+            Iterator over (uid, item) pairs
+        """
+        for uid, raw_email in fetched:
+            try:
+                yield uid, self._parse_email(raw_email)
+            except (imaplib.IMAP4.error, email.errors.MessageError):
+                self.logger.exception(f"Error processing email {uid}")
+
+    def _submit_cleaning(
+        self,
+        clean_pool: ProcessPoolExecutor,
+        fetched: list[tuple[bytes, bytes]],
+        cleaning: deque[tuple[list, Future]],
+    ) -> None:
+        """Parse fetched messages and queue their content for the workers.
+
+        Args:
+            clean_pool: Pool of cleaning worker processes
+            fetched: (uid, raw message) pairs
+            cleaning: Queue of (messages, future) in submission order
+        """
+        messages = []
+        for uid, raw_email in fetched:
+            try:
+                msg = email.message_from_bytes(raw_email)
+                candidates = self._content_candidates(msg)
+            except email.errors.MessageError:
+                self.logger.exception(f"Error processing email {uid}")
+                continue
+            key = cached = None
+            if self.body_cache:
+                key = self._cache_key(msg, candidates)
+                cached = self.body_cache.get(key)
+            messages.append((uid, msg, candidates, key, cached))
+
+        for chunk in chunked(messages, self.clean_chunksize):
+            if all(cached is not None for *_, cached in chunk):
+                future: Future = Future()
+                future.set_result([cached for *_, cached in chunk])
+            else:
+                # Cached messages are not sent to the workers
+                batch = [
+                    [] if cached is not None else candidates
+                    for _, _, candidates, _, cached in chunk
+                ]
                 try:
-                    mail.close()
-                    mail.logout()
-                except imaplib.IMAP4.error as e:
-                    self.logger.warning(f"Error closing mail connection: {e}")
+                    future = clean_pool.submit(clean_candidate_batch, batch)
+                except BrokenExecutor as e:
+                    future = Future()
+                    future.set_exception(e)
+            cleaning.append((chunk, future))
 
-        self.logger.info(f"Collected {len(items)} items from email")
-        return items
+    def _drain_cleaning(
+        self,
+        clean_pool: ProcessPoolExecutor | None,
+        cleaning: deque[tuple[list, Future]],
+        keep: int,
+    ) -> Iterator[tuple[bytes, SourceItem | None]]:
+        """Yield cleaned messages in submission order.
+
+        Finished tasks at the head of the queue are always taken; the
+        generator blocks only while more than ``keep`` tasks are queued.
+
+        Args:
+            clean_pool: Pool the tasks were submitted to
+            cleaning: Queue of (messages, future) in submission order
+            keep: Number of tasks that may stay queued
+
+        Returns:
+            Iterator over (uid, item) pairs
+        """
+        while cleaning and (len(cleaning) > keep or cleaning[0][1].done()):
+            chunk, future = cleaning.popleft()
+            try:
+                contents = future.result()
+            except BrokenExecutor as e:
+                # A crashed worker breaks the whole pool; clean inline instead
+                self.logger.warning(f"Cleaning worker failed, cleaning inline: {e}")
+                if clean_pool is not None:
+                    discard_clean_pool(clean_pool)
+                contents = [
+                    clean_candidates(self._create_cleaner(), candidates)
+                    for _, _, candidates, _, _ in chunk
+                ]
+            for (uid, msg, _, key, cached), content in zip(chunk, contents):
+                if cached is not None:
+                    content = cached
+                elif key is not None:
+                    self.body_cache.set(key, content)
+                yield uid, self._build_item(msg, content)
+
+    def acknowledge(self) -> None:
+        """Apply deferred \\Seen flags and watermark after the report was sent."""
+        if self.seen_flag_mode != "after_send":
+            return
+        if not self._pending_seen and not self._pending_watermark:
+            return
+
+        mail = None
+        try:
+            mail = get_imap_pool().acquire(self._pool_key, self._connect)
+            status, _ = mail.select(self.mailbox)
+            if status != "OK":
+                self.logger.error(f"Failed to select mailbox: {status}")
+                return
+            self._commit(mail)
+        except imaplib.IMAP4.error:
+            self.logger.exception("Failed to acknowledge emails")
+        finally:
+            if mail:
+                self._release_connection(mail)
+
+    def _release_connection(self, mail: imaplib.IMAP4_SSL) -> None:
+        """Deselect the mailbox and return the connection to the pool.
+
+        Args:
+            mail: IMAP connection acquired from the pool
+        """
+        try:
+            if mail.state == "SELECTED":
+                mail.close()
+        except (imaplib.IMAP4.error, OSError) as e:
+            self.logger.warning(f"Error closing mailbox, dropping connection: {e}")
+            get_imap_pool().discard(self._pool_key, mail)
+            return
+        get_imap_pool().release(self._pool_key, mail)
+
+    def _commit(self, mail: imaplib.IMAP4_SSL) -> None:
+        """Flush pending \\Seen flags and the UID watermark.
+
+        Args:
+            mail: IMAP connection with the mailbox selected
+        """
+        if self._pending_seen:
+            self._store_seen(mail, self._pending_seen)
+            self._pending_seen = []
+
+        if self._pending_watermark:
+            self._save_watermark(*self._pending_watermark)
+            self._pending_watermark = None
+
+    def _store_seen(self, mail: imaplib.IMAP4_SSL, uids: list[int]) -> None:
+        """Mark messages as read with as few UID STORE commands as possible.
+
+        Args:
+            mail: IMAP connection with the mailbox selected
+            uids: Message UIDs to flag
+        """
+        unique_uids = sorted(set(uids))
+        stored = 0
+        for batch in chunked(unique_uids, self.STORE_BATCH_SIZE):
+            message_set = compress_message_set(batch)
+            try:
+                status, data = mail.uid(
+                    "STORE",
+                    message_set,
+                    "+FLAGS.SILENT",
+                    "(\\Seen)",
+                )
+            except imaplib.IMAP4.error:
+                self.logger.exception(f"Failed to mark emails {message_set} seen")
+                continue
+            if status != "OK":
+                self.logger.error(
+                    f"Failed to mark emails {message_set} seen: {status} {data}",
+                )
+                continue
+            stored += len(batch)
+        if stored < len(unique_uids):
+            self.logger.error(
+                f"Marked only {stored} of {len(unique_uids)} emails as seen",
+            )
+        else:
+            self.logger.info(f"Marked {stored} emails as seen")
 
     def _connect(self) -> imaplib.IMAP4_SSL:
         """Connect to IMAP server.
 
+        Used as the connection factory of the shared IMAP pool.
+
         Returns:
             IMAP connection
         """
@@ -120,39 +462,313 @@ class EmailCollector(Collector):
     def _build_search_criteria(self) -> str:
         """Build IMAP search criteria.
 
+        In UID sync mode the watermark replaces the UNSEEN filter, so the
+        criteria only bound the time window of a full rescan.
+
         Returns:
             Search criteria string
         """
         since_date = (datetime.now() - timedelta(days=self.time_range_days)).strftime(
             "%d-%b-%Y",
         )
+        if self.sync_mode == "uid":
+            return f'(SINCE "{since_date}")'
         return f'(UNSEEN SINCE "{since_date}")'
 
-    def _process_email(
+    def _search_uids(self, mail: imaplib.IMAP4_SSL) -> list[bytes]:
+        """Search the selected mailbox for message UIDs to process.
+
+        Args:
+            mail: IMAP connection with the mailbox selected
+
+        Returns:
+            List of message UIDs in ascending order
+        """
+        if self.sync_mode != "uid":
+            _, data = mail.uid("SEARCH", None, self._build_search_criteria())
+            return data[0].split()
+
+        self._load_uid_status(mail)
+        state = self.sync_state.get(self._state_key)
+
+        uidvalidity_matches = state and state.get("uidvalidity") == self._uidvalidity
+        if self._uidvalidity and uidvalidity_matches:
+            last_uid = int(state.get("last_uid", 0))
+            _, data = mail.uid("SEARCH", None, f"UID {last_uid + 1}:*")
+            # "n:*" always matches the highest UID, even when it is below n
+            return [uid for uid in data[0].split() if int(uid) > last_uid]
+
+        if state:
+            self.logger.info(
+                f"UIDVALIDITY changed for {self._state_key}, running full rescan",
+            )
+        _, data = mail.uid("SEARCH", None, self._build_search_criteria())
+        return data[0].split()
+
+    def _load_uid_status(self, mail: imaplib.IMAP4_SSL) -> None:
+        """Read UIDVALIDITY and UIDNEXT of the selected mailbox.
+
+        Args:
+            mail: IMAP connection with the mailbox selected
+        """
+        # SELECT leaves these as untagged responses on the connection
+        untagged = [
+            name.encode("ascii") + b" " + value
+            for name in ("UIDVALIDITY", "UIDNEXT")
+            for value in mail.response(name)[1]
+            if value
+        ]
+        self._uidvalidity = parse_status_value(untagged, "UIDVALIDITY")
+        self._uidnext = parse_status_value(untagged, "UIDNEXT")
+
+        if self._uidvalidity is None or self._uidnext is None:
+            _, data = mail.status(self.mailbox, "(UIDVALIDITY UIDNEXT)")
+            self._uidvalidity = self._uidvalidity or parse_status_value(
+                data,
+                "UIDVALIDITY",
+            )
+            self._uidnext = self._uidnext or parse_status_value(data, "UIDNEXT")
+
+    def _save_watermark(self, uid_list: list[bytes], handled_uids: set[int]) -> None:
+        """Advance the persisted UID watermark past handled messages.
+
+        The watermark stops below the first message that could not be
+        fetched, so it is retried on the next run.
+
+        Args:
+            uid_list: Candidate UIDs of this run
+            handled_uids: UIDs that were fetched and parsed
+        """
+        if self._uidvalidity is None:
+            self.logger.warning("No UIDVALIDITY reported, watermark not saved")
+            return
+
+        state = self.sync_state.get(self._state_key) or {}
+        last_uid = 0
+        if state.get("uidvalidity") == self._uidvalidity:
+            last_uid = int(state.get("last_uid", 0))
+
+        pending = sorted(int(uid) for uid in uid_list if int(uid) not in handled_uids)
+        if pending:
+            last_uid = max(last_uid, pending[0] - 1)
+        else:
+            candidates = [int(uid) for uid in uid_list]
+            if self._uidnext:
+                candidates.append(self._uidnext - 1)
+            last_uid = max([last_uid, *candidates])
+
+        self.sync_state.update(self._state_key, self._uidvalidity, last_uid)
+        self.logger.info(f"Saved UID watermark {last_uid} for {self._state_key}")
+
+    def _prefilter(
+        self,
+        mail: imaplib.IMAP4_SSL,
+        uids: list[bytes],
+    ) -> tuple[list[bytes], list[bytes]]:
+        """Fetch headers and sizes only, and apply the header filter.
+
+        Args:
+            mail: IMAP connection with the mailbox selected
+            uids: Candidate message UIDs
+
+        Returns:
+            Tuple of (UIDs to fetch in full, UIDs rejected by the filter)
+        """
+        accepted: list[bytes] = []
+        rejected: list[bytes] = []
+
+        for batch in chunked(uids, self.fetch_batch_size):
+            try:
+                _, msg_data = mail.uid(
+                    "FETCH",
+                    compress_message_set(batch),
+                    f"(UID RFC822.SIZE {self.HEADER_FIELDS})",
+                )
+            except imaplib.IMAP4.error:
+                # Keep the batch; the full fetch decides whether it is usable
+                self.logger.exception(f"Error fetching headers {batch}")
+                accepted.extend(batch)
+                continue
+
+            records = {r.uid: r for r in parse_fetch_response(msg_data)}
+            for uid in batch:
+                record = records.get(int(uid))
+                if record is None:
+                    accepted.append(uid)
+                    continue
+
+                headers = email.message_from_bytes(record.section("BODY[HEADER") or b"")
+                sender = f"{headers.get('From', '')} {headers.get('List-ID', '')}"
+                subject = self._decode_header(headers.get("Subject", ""))
+                reason = self.header_filter.check(
+                    self._decode_header(sender),
+                    subject,
+                    record.size,
+                )
+                if reason:
+                    self.logger.debug(f"Skipping email {uid} ({reason}): {subject}")
+                    rejected.append(uid)
+                else:
+                    accepted.append(uid)
+
+        self.logger.info(
+            f"Header filter kept {len(accepted)} of {len(uids)} emails",
+        )
+        return accepted, rejected
+
+    def _fetch_batch(
         self,
         mail: imaplib.IMAP4_SSL,
-        msg_id: bytes,
-    ) -> SourceItem | None:
-        """Process a single email message.
+        uids: list[bytes],
+    ) -> list[tuple[bytes, bytes]]:
+        """Fetch several messages with a single UID FETCH command.
 
         Args:
             mail: IMAP connection
-            msg_id: Message ID
+            uids: Message UIDs to fetch
 
         Returns:
-            SourceItem or None if processing fails
+            List of (UID, raw message bytes) tuples in request order
         """
-        _, msg_data = mail.fetch(msg_id, "BODY.PEEK[]")
+        message_set = compress_message_set(uids)
+        _, msg_data = mail.uid("FETCH", message_set, "(UID BODY.PEEK[])")
 
-        if not msg_data or not msg_data[0]:
-            return None
+        raw_by_uid: dict[int, bytes] = {}
+        for record in parse_fetch_response(msg_data):
+            raw_email = record.section("BODY[]")
+            if raw_email and record.uid is not None:
+                raw_by_uid[record.uid] = raw_email
+
+        return [(uid, raw_by_uid[int(uid)]) for uid in uids if int(uid) in raw_by_uid]
+
+    def _fetch_partial_batch(
+        self,
+        mail: imaplib.IMAP4_SSL,
+        uids: list[bytes],
+    ) -> list[tuple[bytes, bytes]]:
+        """Fetch only the readable text parts of each message.
+
+        BODYSTRUCTURE is fetched first to select the text/html section and
+        its text/plain alternative, which is used when the HTML cleans to
+        nothing. Messages sharing the same sections are then fetched
+        together. Messages without a selectable part are fetched in full.
 
-        raw_email = msg_data[0][1]
+        Args:
+            mail: IMAP connection
+            uids: Message UIDs to fetch
+
+        Returns:
+            List of (UID, message bytes) tuples in request order
+        """
+        message_set = compress_message_set(uids)
+        _, msg_data = mail.uid("FETCH", message_set, "(UID BODYSTRUCTURE)")
+
+        parts: dict[int, list[BodyPart]] = {}
+        for record in parse_fetch_response(msg_data):
+            found = find_text_parts(parse_bodystructure(record.attributes))
+            if found and record.uid is not None:
+                parts[record.uid] = found
+
+        full_uids = [uid for uid in uids if int(uid) not in parts]
+        raw_by_uid: dict[int, bytes] = {}
+        if full_uids:
+            raw_by_uid.update(
+                (int(uid), raw) for uid, raw in self._fetch_batch(mail, full_uids)
+            )
+
+        by_sections: dict[tuple[str, ...], list[bytes]] = {}
+        for uid in uids:
+            if int(uid) in parts:
+                sections = tuple(part.section for part in parts[int(uid)])
+                by_sections.setdefault(sections, []).append(uid)
+
+        for sections, section_uids in by_sections.items():
+            fetch_items = " ".join(f"BODY.PEEK[{section}]" for section in sections)
+            _, msg_data = mail.uid(
+                "FETCH",
+                compress_message_set(section_uids),
+                f"(UID {self.HEADER_FIELDS} {fetch_items})",
+            )
+            for record in parse_fetch_response(msg_data):
+                if record.uid not in parts:
+                    continue
+                payloads = [record.section(f"BODY[{section}]") for section in sections]
+                if any(payload is None for payload in payloads):
+                    continue
+                headers = record.section("BODY[HEADER") or b""
+                raw_by_uid[record.uid] = self._build_partial_message(
+                    headers,
+                    list(zip(parts[record.uid], payloads, strict=True)),
+                )
+
+        self.logger.debug(
+            f"Partial fetch: {len(parts)} text parts, {len(full_uids)} full messages",
+        )
+        return [(uid, raw_by_uid[int(uid)]) for uid in uids if int(uid) in raw_by_uid]
+
+    def _build_partial_message(
+        self,
+        headers: bytes,
+        sections: list[tuple[BodyPart, bytes]],
+    ) -> bytes:
+        """Wrap fetched body sections into a parseable message.
+
+        The sections are wrapped in a multipart message with their declared
+        types, charsets and transfer encodings, so they go through the same
+        decoding and cleaning as a fully downloaded message.
+
+        Args:
+            headers: Top-level header fields of the message
+            sections: (selected body part, raw still transfer-encoded
+                content) pairs in order of preference
+
+        Returns:
+            Message bytes
+        """
+        boundary = self.PARTIAL_BOUNDARY
+        chunks = [
+            headers.rstrip(b"\r\n"),
+            b"\r\nMIME-Version: 1.0",
+            f'\r\nContent-Type: multipart/mixed; boundary="{boundary}"\r\n'.encode(),
+        ]
+        for part, payload in sections:
+            content_type = part.content_type
+            if part.charset:
+                charset = part.charset.replace('"', "")
+                content_type += f'; charset="{charset}"'
+            chunks.append(
+                f"\r\n--{boundary}"
+                f"\r\nContent-Type: {content_type}"
+                f"\r\nContent-Transfer-Encoding: {part.encoding}\r\n\r\n".encode(),
+            )
+            chunks.append(payload)
+        chunks.append(f"\r\n--{boundary}--\r\n".encode("ascii"))
+        return b"".join(chunks)
+
+    def _parse_email(self, raw_email: bytes) -> SourceItem | None:
+        """Parse a raw email message into a SourceItem.
+
+        Args:
+            raw_email: Raw RFC 822 message bytes
+
+        Returns:
+            SourceItem or None if the message has no usable content
+        """
         msg = email.message_from_bytes(raw_email)
+        return self._build_item(msg, self._extract_content(msg))
+
+    def _build_item(self, msg: Message, content: str) -> SourceItem | None:
+        """Build a SourceItem from a parsed message and its cleaned content.
+
+        Args:
+            msg: Email message
+            content: Cleaned text content
 
+        Returns:
+            SourceItem or None if the content is empty
+        """
         subject = self._decode_header(msg.get("Subject", "No Subject"))
         source_name = self._extract_sender(msg)
-        content = self._extract_content(msg)
         published_at = self._extract_timestamp(msg)
 
         if not content.strip():
@@ -212,48 +828,137 @@ class EmailCollector(Collector):
         Returns:
             Extracted text content
         """
-        cleaner = HTMLCleaner()
+        candidates = self._content_candidates(msg)
+        if not self.body_cache:
+            return clean_candidates(self._create_cleaner(), candidates)
+
+        key = self._cache_key(msg, candidates)
+        content = self.body_cache.get(key)
+        if content is None:
+            content = clean_candidates(self._create_cleaner(), candidates)
+            self.body_cache.set(key, content)
+        return content
+
+    def _cache_key(
+        self,
+        msg: Message,
+        candidates: list[Candidate] | None = None,
+    ) -> str | None:
+        """Build the body cache key of a message.
 
-        if msg.is_multipart():
-            # First pass: only look for HTML
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/html":
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        charset = part.get_content_charset() or "utf-8"
-                        try:
-                            content = cleaner.clean(
-                                payload.decode(charset, errors="ignore"),
-                            )
-                            if content.strip():
-                                return content
-                        except Exception:
-                            pass
-
-            # Second pass: fallback to plain text if no HTML found
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        charset = part.get_content_charset() or "utf-8"
-                        try:
-                            content = cleaner.clean_simple(
-                                payload.decode(charset, errors="ignore"),
-                            )
-                            if content.strip():
-                                return content
-                        except Exception:
-                            pass
+        The Message-ID identifies the message before its body is downloaded;
+        messages without one are keyed by a hash of their decoded parts. The
+        cleaner settings are part of the key so changing them re-cleans.
+
+        Args:
+            msg: Email message (headers are enough if it has a Message-ID)
+            candidates: Content candidates, needed without a Message-ID
+
+        Returns:
+            Cache key, or None if the message cannot be identified yet
+        """
+        message_id = (msg.get("Message-ID") or "").strip()
+        if message_id:
+            identity = f"mid:{message_id}"
+        elif candidates is not None:
+            digest = hashlib.sha256()
+            for kind, text in candidates:
+                digest.update(f"{kind}\0{text}\0".encode("utf-8", errors="replace"))
+            identity = f"raw:{digest.hexdigest()}"
         else:
+            return None
+        patterns = "\0".join(self.filter_patterns)
+        return f"body:{identity}|{self.html_extractor}|{patterns}"
+
+    def _lookup_cached(
+        self,
+        mail: imaplib.IMAP4_SSL,
+        uids: list[bytes],
+    ) -> tuple[list[tuple[bytes, SourceItem | None]], list[bytes]]:
+        """Build items from cached bodies using only the message headers.
+
+        Args:
+            mail: IMAP connection with the mailbox selected
+            uids: Message UIDs about to be fetched
+
+        Returns:
+            Tuple of ((uid, item) pairs served from the cache, UIDs whose
+            body still has to be downloaded)
+        """
+        try:
+            _, msg_data = mail.uid(
+                "FETCH",
+                compress_message_set(uids),
+                f"(UID {self.HEADER_FIELDS})",
+            )
+        except imaplib.IMAP4.error:
+            self.logger.exception(f"Error fetching headers {uids}")
+            return [], uids
+
+        headers_by_uid = {
+            record.uid: email.message_from_bytes(record.section("BODY[HEADER") or b"")
+            for record in parse_fetch_response(msg_data)
+        }
+        cached: list[tuple[bytes, SourceItem | None]] = []
+        missing: list[bytes] = []
+        for uid in uids:
+            headers = headers_by_uid.get(int(uid))
+            key = self._cache_key(headers) if headers is not None else None
+            content = self.body_cache.get(key) if key else None
+            if content is None:
+                missing.append(uid)
+            else:
+                cached.append((uid, self._build_item(headers, content)))
+
+        if cached:
+            self.logger.info(f"Body cache served {len(cached)} of {len(uids)} emails")
+        return cached, missing
+
+    def _create_cleaner(self) -> HTMLCleaner:
+        """Create an HTML cleaner with this collector's settings.
+
+        Returns:
+            HTMLCleaner instance
+        """
+        return HTMLCleaner(
+            extra_patterns=self.filter_patterns,
+            extractor=self.html_extractor,
+        )
+
+    @staticmethod
+    def _content_candidates(msg: Message) -> list[Candidate]:
+        """Decode the message parts that may hold the content.
+
+        Args:
+            msg: Email message
+
+        Returns:
+            (kind, text) pairs in order of preference: HTML parts first, then
+            plain text parts
+        """
+        if not msg.is_multipart():
             # Single-part email
             payload = msg.get_payload(decode=True)
-            if payload:
-                charset = msg.get_content_charset() or "utf-8"
-                return cleaner.clean(payload.decode(charset, errors="ignore"))
-
-        return ""
+            if not payload:
+                return []
+            charset = msg.get_content_charset() or "utf-8"
+            return [("html", payload.decode(charset, errors="ignore"))]
+
+        candidates: list[Candidate] = []
+        # HTML first, plain text as the fallback
+        for content_type, kind in (("text/html", "html"), ("text/plain", "text")):
+            for part in msg.walk():
+                if part.get_content_type() != content_type:
+                    continue
+                payload = part.get_payload(decode=True)
+                if payload:
+                    charset = part.get_content_charset() or "utf-8"
+                    try:
+                        text = payload.decode(charset, errors="ignore")
+                    except LookupError:
+                        continue
+                    candidates.append((kind, text))
+        return candidates
 
     def _extract_timestamp(self, msg: Message) -> datetime | None:
         """Extract timestamp from email message.
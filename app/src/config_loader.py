@@ -7,6 +7,8 @@ from typing import Any
 
 import yaml
 
+from app.src.utils.logger import get_logger
+
 ENV_VAR_PATTERN = re.compile(r"\$\{([A-Za-z0-9_]+)\}")
 
 
@@ -116,3 +118,30 @@ def load_config(config_path: str | Path = "config.yaml") -> dict[str, Any]:
     """
     loader = ConfigLoader(config_path)
     return loader.load()
+
+
+def select_options(
+    config: dict[str, Any] | None,
+    options: tuple[str, ...],
+    section: str,
+) -> dict[str, Any]:
+    """Pick the known keys of a configuration section.
+
+    Unknown keys are ignored with a warning, so a typo does not stop the
+    component from being configured.
+
+    Args:
+        config: Configuration section (None is empty)
+        options: Accepted keys
+        section: Section name used in the warning
+
+    Returns:
+        Dictionary with only the accepted keys
+    """
+    config = config or {}
+    unknown = sorted(set(config) - set(options))
+    if unknown:
+        get_logger("config").warning(
+            f"Ignoring unknown {section} options: {', '.join(unknown)}",
+        )
+    return {key: config[key] for key in options if key in config}
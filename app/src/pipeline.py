@@ -0,0 +1,290 @@
+"""Streaming collection pipeline with a bounded item queue."""
+
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from app.src.collectors.base import Collector
+from app.src.models import SourceItem
+from app.src.stages.base import Stage
+from app.src.utils.deadline import Deadline
+from app.src.utils.logger import get_logger
+
+_END = object()
+
+
+class StreamingPipeline:
+    """Feeds items from concurrent collectors through stages as they arrive.
+
+    Collectors run on a bounded thread pool. Each collector's items are held
+    back until it finishes and then put into a bounded queue, so a collector
+    that times out or is cut short by the domain deadline contributes nothing
+    (as in the non-streaming path), while the items of collectors that are
+    done reach the stages and the processor as the others keep running. A
+    slow consumer (e.g. an LLM call already in progress) applies backpressure
+    through the queue. Items are yielded in arrival order.
+    """
+
+    # Seconds a blocked producer, or a consumer waiting for collectors that
+    # have not started yet, waits before re-checking
+    PUT_POLL_INTERVAL = 0.5
+
+    def __init__(
+        self,
+        collectors: list[Collector],
+        stages: list[Stage],
+        queue_size: int = 32,
+        max_workers: int = 4,
+        default_timeout: float | None = 600,
+        deadline: Deadline | None = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            collectors: Collectors feeding the pipeline
+            stages: Stages applied to every item in order
+            queue_size: Maximum number of items waiting to be consumed
+            max_workers: Maximum number of collectors running at once
+            default_timeout: Collector timeout in seconds unless the collector
+                config sets "timeout"
+            deadline: Deadline of the domain run, cutting collector
+                timeouts short
+        """
+        self.collectors = collectors
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.max_workers = max(1, min(len(collectors) or 1, max_workers))
+        self.default_timeout = default_timeout
+        self.deadline = deadline
+        self.logger = get_logger("pipeline")
+        self.delivered: list[Collector] = []
+        self._started_at: dict[int, float] = {}
+        self._collected: set[int] = set()
+        self._committing: set[int] = set()
+        self._collected_lock = threading.Lock()
+
+    def stream(self) -> Iterator[SourceItem]:
+        """Run the collectors and yield staged items as they arrive.
+
+        The wait for the next item is bounded by the earliest collector
+        timeout and the domain deadline; collectors past them are cancelled
+        and no longer waited for. After the iterator is exhausted,
+        ``delivered`` lists the collectors whose items were all yielded.
+
+        Returns:
+            Iterator over SourceItem objects
+        """
+        items: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        self._started_at = {}
+        self._collected = set()
+        self._committing = set()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="stream",
+        )
+        for index, collector in enumerate(self.collectors):
+            executor.submit(self._produce, index, collector, items, stop)
+
+        pending = set(range(len(self.collectors)))
+        delivered: set[int] = set()
+        try:
+            while pending:
+                try:
+                    index, entry = items.get(timeout=self._wait_timeout(pending))
+                except queue.Empty:
+                    pending -= self._cancel_overdue(pending)
+                    continue
+                if index not in pending:
+                    continue
+                if entry is _END:
+                    pending.discard(index)
+                    if index in self._collected:
+                        delivered.add(index)
+                    continue
+                item = self._apply_stages(entry)
+                if item is not None:
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.delivered = [
+            collector
+            for index, collector in enumerate(self.collectors)
+            if index in delivered
+        ]
+
+    def _timeout(self, collector: Collector) -> float | None:
+        """Get the timeout of a collector.
+
+        Args:
+            collector: Collector instance
+
+        Returns:
+            Timeout in seconds, or None if unbounded
+        """
+        return collector.config.get("timeout", self.default_timeout) or None
+
+    def _wait_timeout(self, pending: set[int]) -> float | None:
+        """Get how long the consumer may wait for the next entry.
+
+        Args:
+            pending: Indexes of collectors still being waited for
+
+        Returns:
+            Seconds until the earliest collector timeout or the domain
+            deadline, or None to wait indefinitely
+        """
+        running = pending - self._collected - self._committing
+        if not running:
+            # Only collectors that can no longer be cancelled are left
+            return None
+        remaining = None
+        for index in running:
+            timeout = self._timeout(self.collectors[index])
+            if timeout is None:
+                continue
+            start = self._started_at.get(index)
+            if start is None:
+                # Not running yet; check again once it may have started
+                left = self.PUT_POLL_INTERVAL
+            else:
+                left = max(0.0, start + timeout - time.monotonic())
+            remaining = left if remaining is None else min(remaining, left)
+        if self.deadline is not None:
+            remaining = self.deadline.bound(remaining)
+        return remaining
+
+    def _cancel_overdue(self, pending: set[int]) -> set[int]:
+        """Cancel collectors past their timeout or the domain deadline.
+
+        A collector that has already collected everything, or that started
+        committing side effects, is not cancelled and is still waited for.
+
+        Args:
+            pending: Indexes of collectors still being waited for
+
+        Returns:
+            Indexes of the cancelled collectors
+        """
+        deadline_expired = self.deadline is not None and self.deadline.expired
+        now = time.monotonic()
+        cancelled = set()
+        for index in pending - self._collected - self._committing:
+            collector = self.collectors[index]
+            timeout = self._timeout(collector)
+            start = self._started_at.get(index)
+            timed_out = (
+                timeout is not None and start is not None and now - start >= timeout
+            )
+            if not timed_out and not deadline_expired:
+                continue
+            with self._collected_lock:
+                if index in self._collected:
+                    continue
+                if not collector.cancel():
+                    # Past the point of no return: its flags are being
+                    # committed, so the items must be used
+                    self._committing.add(index)
+                    self.logger.warning(
+                        f"Collector {collector.name} timed out while committing, "
+                        "using its items",
+                    )
+                    continue
+            cancelled.add(index)
+            if timed_out:
+                self.logger.error(
+                    f"Collector {collector.name} timed out after {timeout}s",
+                )
+            else:
+                self.logger.error(
+                    f"Collector {collector.name} stopped at the domain deadline",
+                )
+        return cancelled
+
+    def _apply_stages(self, item: SourceItem) -> SourceItem | None:
+        """Run a single item through all stages.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            Staged item, or None if a stage dropped it
+        """
+        for stage in self.stages:
+            item = stage.process(item)
+            if item is None:
+                return None
+        return item
+
+    def _produce(
+        self,
+        index: int,
+        collector: Collector,
+        items: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """Run one collector and push its items into the queue once it is done.
+
+        Items are buffered until the collector finishes, so nothing from a
+        collector cancelled by the consumer reaches the queue. Cancellation
+        is checked between items; a collector blocked inside a single network
+        call cannot be interrupted.
+
+        Args:
+            index: Position of the collector in the domain configuration
+            collector: Collector to run
+            items: Shared queue of (index, item or end marker) entries
+            stop: Set when the consumer has gone away
+        """
+        self._started_at[index] = time.monotonic()
+        collected: list[SourceItem] = []
+        iterator = None
+        try:
+            if collector.cancelled:
+                return
+            self.logger.info(f"Running collector: {collector.name}")
+            iterator = collector.iter_items()
+            for item in iterator:
+                if stop.is_set() or collector.cancelled:
+                    return
+                collected.append(item)
+            with self._collected_lock:
+                if collector.cancelled:
+                    return
+                self._collected.add(index)
+            self.logger.info(
+                f"Collector {collector.name} collected {len(collected)} items",
+            )
+            for item in collected:
+                if not self._put(items, (index, item), stop):
+                    return
+        except Exception:
+            self.logger.exception(f"Collector {collector.name} failed")
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+            self._put(items, (index, _END), stop)
+
+    def _put(self, items: queue.Queue, entry: object, stop: threading.Event) -> bool:
+        """Put an entry into the queue, blocking while it is full.
+
+        Args:
+            items: Shared item queue
+            entry: Item or end marker
+            stop: Set when the consumer has gone away
+
+        Returns:
+            False if the pipeline was stopped before the entry was queued
+        """
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=self.PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -1,11 +1,34 @@
 """AI-powered processor using OpenAI-compatible APIs."""
 
+import dataclasses
+import json
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
+from app.src.config_loader import select_options
 from app.src.models import SourceItem
 from app.src.processors.base import Processor
-from openai import APIConnectionError, APIError, OpenAI, RateLimitError
+from app.src.processors.prompt_layout import PromptLayout, order_items
+from app.src.utils.disk_cache import DiskCache
+from app.src.utils.llm_executor import LLMRequestExecutor, get_llm_executor
+from app.src.utils.retry import RetryPolicy
+from app.src.utils.tokens import estimate_tokens
+from openai import (
+    APIConnectionError,
+    APIError,
+    APIStatusError,
+    BadRequestError,
+    OpenAI,
+    RateLimitError,
+    UnprocessableEntityError,
+)
+
+# (api_base, model) pairs whose streams cannot report usage
+_STREAM_USAGE_UNSUPPORTED: set[tuple[str, str]] = set()
 
 
 class AIProcessor(Processor):
@@ -26,16 +49,72 @@ class AIProcessor(Processor):
         self.prompt_file = config.get("prompt_file", "")
         self.max_tokens = config.get("max_tokens", 130000)  # Max output tokens
         self.temperature = config.get("temperature", 0)  # Control randomness (0-1)
+        # Order items by source, time and title so identical inputs produce
+        # identical prompts (and provider prefix caches keep hitting)
+        self.sort_items = config.get("sort_items", True)
+        # Map-reduce: summarize chunks of items in parallel, then combine the
+        # partial summaries with the domain prompt
+        self.map_reduce = config.get("map_reduce", False)
+        self.chunk_token_budget = config.get("chunk_token_budget", 30000)
+        self.map_workers = max(1, config.get("map_workers", 4))
+        self.map_max_tokens = config.get("map_max_tokens", 4000)
+        self.map_prompt_file = config.get("map_prompt_file", "")
+        # Limits shared by all processors using the same api_base and api_key
+        self.rate_limits = select_options(
+            config.get("rate_limits"),
+            LLMRequestExecutor.OPTIONS,
+            "rate_limits",
+        )
+        # Queue priority of this processor's calls (lower runs first)
+        self.priority = config.get("priority", 0)
+        # Backoff for transient API errors (429, 5xx, connection errors)
+        self.retry_policy = RetryPolicy.from_config(config.get("retry"))
+        # Completions of identical requests are reused from disk; unlike the
+        # collectors' body cache, it is off unless explicitly enabled
+        cache_config = config.get("response_cache") or {}
+        self.response_cache = DiskCache.from_config(
+            cache_config,
+            "app/state/llm_cache.sqlite3",
+            default_ttl_hours=24,
+            default_max_mb=100,
+            enabled_by_default=False,
+        )
+        # Skip cache lookups (fresh responses still refresh the cache)
+        self.cache_bypass = cache_config.get("bypass", False)
+        # Stream completions; stop early at stream_max_chars output characters
+        # or stream_deadline seconds (0 disables either limit)
+        self.stream = config.get("stream", False)
+        self.stream_max_chars = config.get("stream_max_chars", 0)
+        self.stream_deadline = config.get("stream_deadline", 0)
+        # Per-call streaming metrics (time to first token, tokens/sec)
+        self.stream_metrics: list[dict[str, Any]] = []
         self._client: OpenAI | None = None
+        self._executor: LLMRequestExecutor | None = None
         self._prompt_template: str | None = None
+        self._map_prompt: str | None = None
+        self._layouts: dict[str, PromptLayout] = {}
 
     @property
     def client(self) -> OpenAI:
         """Get or create OpenAI client."""
         if self._client is None:
-            self._client = OpenAI(api_key=self.api_key, base_url=self.api_base)
+            # Retries are handled by retry_policy, outside the rate limiter
+            self._client = OpenAI(
+                api_key=self.api_key,
+                base_url=self.api_base,
+                max_retries=0,
+            )
         return self._client
 
+    @property
+    def executor(self) -> LLMRequestExecutor:
+        """Get the shared request executor for this endpoint."""
+        if self._executor is None:
+            self._executor = get_llm_executor(self.api_base, self.api_key)
+            if self.rate_limits:
+                self._executor.configure(**self.rate_limits)
+        return self._executor
+
     def process(self, items: list[SourceItem]) -> str:
         """Process source items using AI.
 
@@ -51,38 +130,573 @@ class AIProcessor(Processor):
             self.logger.warning("No items to process")
             return "今日无新闻内容。"
 
-        prompt_template = self._load_prompt()
-        combined_content = self._combine_items(items)
+        return self._summarize(self._order_items(items))
 
-        # Use prompt as system_message, combined content as user_message
-        system_prompt = prompt_template
-        user_prompt = combined_content
+    def process_stream(self, items: Iterable[SourceItem]) -> str:
+        """Process streamed items, starting map calls as chunks fill up.
 
-        self.logger.debug(f"System prompt length: {len(system_prompt)} characters")
-        self.logger.debug(f"User prompt length: {len(user_prompt)} characters")
+        Only map-reduce overlaps LLM work with collection. A single-call
+        summary needs every item in one prompt (sorted, with sort_items),
+        so without map_reduce the stream is drained before the call starts;
+        stages still run while other collectors are in progress.
+
+        Args:
+            items: Iterable of SourceItem objects, consumed as they arrive
+
+        Returns:
+            AI-generated summary
+        """
+        if not self.map_reduce:
+            return super().process_stream(items)
+        return self._summarize(items)
+
+    def _summarize(self, items: Iterable[SourceItem]) -> str:
+        """Generate the summary in a single call or with map-reduce.
+
+        Args:
+            items: SourceItem objects
 
+        Returns:
+            AI-generated summary
+
+        Raises:
+            APIError: If the API still fails after all retries
+        """
         try:
-            # Build API parameters with separated messages
-            api_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "temperature": self.temperature,
-                "max_tokens": self.max_tokens,
-            }
-
-            response = self.client.chat.completions.create(**api_params)
-
-            summary = response.choices[0].message.content
-            summary = self._strip_code_block(summary)
+            if self.map_reduce:
+                summary = self._map_reduce(items)
+            else:
+                summary = self._complete(
+                    self._layout(self._load_prompt()),
+                    self._combine_items(items),
+                    self.max_tokens,
+                )
             self.logger.info("AI processing completed successfully")
             return summary or "生成摘要失败。"
 
         except (APIError, APIConnectionError, RateLimitError) as e:
-            self.logger.exception(f"AI processing failed: {e}")
-            return f"AI处理失败: {str(e)}"
+            # Raise instead of returning an error text, so the domain fails
+            # and nothing is sent or acknowledged
+            self.logger.error(f"AI processing failed: {e}")
+            raise
+
+        finally:
+            if self.response_cache:
+                self.response_cache.close()
+
+    def _complete(
+        self,
+        layout: PromptLayout,
+        content: str,
+        max_tokens: int,
+        priority: int | None = None,
+    ) -> str:
+        """Run one chat completion through the shared request executor.
+
+        Args:
+            layout: Prompt layout providing the system message
+            content: Combined content for the user message
+            max_tokens: Maximum output tokens
+            priority: Queue priority (defaults to the processor priority)
+
+        Returns:
+            Response text without a code block wrapper
+        """
+        system_prompt = layout.system_prompt
+        user_prompt = layout.user_prompt(content)
+        self.logger.debug(f"System prompt length: {len(system_prompt)} characters")
+        self.logger.debug(f"User prompt length: {len(user_prompt)} characters")
+
+        # Build API parameters with separated messages
+        api_params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": self.temperature,
+            "max_tokens": max_tokens,
+        }
+
+        cache_key = None
+        if self.response_cache:
+            cache_key = json.dumps(
+                [self.model, self.temperature, max_tokens, system_prompt, user_prompt],
+                ensure_ascii=False,
+            )
+            if not self.cache_bypass:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    self.logger.info("Using cached AI response")
+                    return cached
+
+        # Output is charged once the API reports the actual usage
+        estimated = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+        text, usage, complete = self.retry_policy.call(
+            lambda: self.executor.call(
+                lambda: self._request(api_params),
+                tokens=estimated,
+                priority=self.priority if priority is None else priority,
+                deadline=self.deadline,
+            ),
+            retryable=self._is_retryable,
+            retry_after=self._retry_after,
+            timeout=self.deadline.remaining() if self.deadline is not None else None,
+        )
+        if usage is not None and getattr(usage, "total_tokens", None):
+            self.executor.settle(estimated, usage.total_tokens)
+            self._log_cached_tokens(usage)
+        elif self.stream:
+            self.executor.settle(estimated, estimated + estimate_tokens(text))
+
+        content = self._strip_code_block(text)
+        if cache_key is not None and content and complete:
+            self.response_cache.set(cache_key, content)
+        return content
+
+    def _request(self, api_params: dict[str, Any]) -> tuple[str, Any, bool]:
+        """Send a chat completion request.
+
+        Args:
+            api_params: Parameters of the chat completion call
+
+        Returns:
+            Tuple of (response text, usage or None, whether the response is
+            complete)
+
+        Raises:
+            TimeoutError: If the run deadline has expired
+        """
+        remaining = self.deadline.remaining() if self.deadline is not None else None
+        if remaining is not None:
+            if remaining <= 0:
+                raise TimeoutError("Run deadline expired before the API call")
+            api_params = {**api_params, "timeout": remaining}
+        if self.stream:
+            return self._stream_completion(api_params)
+        response = self.client.chat.completions.create(**api_params)
+        text = response.choices[0].message.content or ""
+        return text, getattr(response, "usage", None), True
+
+    def _stream_completion(self, api_params: dict[str, Any]) -> tuple[str, Any, bool]:
+        """Stream a chat completion and assemble it incrementally.
+
+        The output ceiling and deadline are checked as chunks arrive; a
+        stalled connection is ended by the client's read timeout. Usage is
+        requested in the final chunk so the rate limiter is settled with
+        real token counts; streams stopped early fall back to estimates.
+
+        Args:
+            api_params: Parameters of the chat completion call
+
+        Returns:
+            Tuple of (assembled text, usage or None, False if stopped early)
+        """
+        started = time.monotonic()
+        first_token_at = None
+        parts: list[str] = []
+        length = 0
+        usage = None
+        stop_reason = None
+
+        stream = self._open_stream(api_params)
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.monotonic()
+                parts.append(delta)
+                length += len(delta)
+
+                if self.stream_max_chars and length >= self.stream_max_chars:
+                    stop_reason = f"{self.stream_max_chars} characters"
+                    break
+                if (
+                    self.stream_deadline
+                    and time.monotonic() - started > self.stream_deadline
+                ):
+                    stop_reason = f"deadline of {self.stream_deadline}s"
+                    break
+                if self.deadline is not None and self.deadline.expired:
+                    raise TimeoutError("Run deadline expired while streaming")
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+        text = "".join(parts)
+        self._record_stream_metrics(started, first_token_at, text, usage)
+        if stop_reason:
+            self.logger.warning(f"Stopped streaming completion at {stop_reason}")
+        return text, usage, stop_reason is None
+
+    def _open_stream(self, api_params: dict[str, Any]) -> Any:
+        """Start a streamed completion that reports usage in its last chunk.
+
+        Endpoints that reject ``stream_options`` are retried without it and
+        remembered, so later calls to them skip the option.
+
+        Args:
+            api_params: Parameters of the chat completion call
+
+        Returns:
+            Stream of completion chunks
+        """
+        endpoint = (self.api_base, self.model)
+        if endpoint in _STREAM_USAGE_UNSUPPORTED:
+            return self.client.chat.completions.create(**api_params, stream=True)
+        try:
+            return self.client.chat.completions.create(
+                **api_params,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+        except (BadRequestError, UnprocessableEntityError) as e:
+            stream = self.client.chat.completions.create(**api_params, stream=True)
+            # Only an endpoint that accepts the request without the option
+            # is marked; other bad requests fail again above
+            _STREAM_USAGE_UNSUPPORTED.add(endpoint)
+            self.logger.info(
+                f"Endpoint rejected stream_options, streaming without usage: {e}",
+            )
+            return stream
+
+    def _record_stream_metrics(
+        self,
+        started: float,
+        first_token_at: float | None,
+        text: str,
+        usage: Any,
+    ) -> None:
+        """Record and log time to first token and output rate of a stream.
+
+        Args:
+            started: Monotonic time the request was sent
+            first_token_at: Monotonic time of the first content chunk
+            text: Assembled output
+            usage: Usage reported by the API, if any
+        """
+        finished = time.monotonic()
+        output_tokens = getattr(usage, "completion_tokens", None)
+        if not output_tokens:
+            output_tokens = estimate_tokens(text)
+        ttft = first_token_at - started if first_token_at is not None else None
+        generating = finished - first_token_at if first_token_at is not None else 0
+        metrics = {
+            "ttft": ttft,
+            "duration": finished - started,
+            "output_tokens": output_tokens,
+            "tokens_per_second": output_tokens / generating if generating > 0 else None,
+        }
+        self.stream_metrics.append(metrics)
+
+        rate = metrics["tokens_per_second"]
+        self.logger.info(
+            f"Streamed {output_tokens} tokens in {metrics['duration']:.1f}s"
+            + (f", first token after {ttft:.1f}s" if ttft is not None else "")
+            + (f", {rate:.1f} tokens/s" if rate else ""),
+        )
+
+    def _log_cached_tokens(self, usage: Any) -> None:
+        """Log how many prompt tokens the provider served from its cache.
+
+        Args:
+            usage: Usage reported by the API
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        if isinstance(details, dict):
+            cached = details.get("cached_tokens")
+        else:
+            cached = getattr(details, "cached_tokens", None)
+        if cached is None:
+            return
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+        share = f" ({cached / prompt_tokens:.0%})" if prompt_tokens else ""
+        self.logger.info(
+            f"Prompt cache: {cached} of {prompt_tokens} prompt tokens cached{share}",
+        )
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Check whether an API error is transient.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            True for connection errors, timeouts, 408, 409, 429 and 5xx
+        """
+        if isinstance(error, APIConnectionError):
+            return True
+        if isinstance(error, APIStatusError):
+            return error.status_code in (408, 409, 429) or error.status_code >= 500
+        return False
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float | None:
+        """Read the delay requested by the server.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            Seconds from retry-after-ms or Retry-After, or None
+        """
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        headers = response.headers
+
+        try:
+            if headers.get("retry-after-ms"):
+                return max(0.0, float(headers["retry-after-ms"]) / 1000)
+            value = headers.get("retry-after")
+            if not value:
+                return None
+            if value.strip().isdigit():
+                return float(value)
+            # HTTP date
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _map_reduce(self, items: Iterable[SourceItem]) -> str:
+        """Summarize chunks of items in parallel and combine the results.
+
+        Chunks are submitted as soon as they are full, so with a streamed
+        input the first map calls overlap with collection. If everything fits
+        into one chunk, a single call with the domain prompt is made instead.
+
+        Args:
+            items: SourceItem objects
+
+        Returns:
+            Final summary
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.map_workers,
+            thread_name_prefix="map",
+        )
+        try:
+            futures: list[Future] = []
+            for chunk, is_last in self._pack_chunks(items):
+                # Streamed chunks arrive in collection order
+                chunk = self._order_items(chunk)
+                if is_last and not futures:
+                    return self._complete(
+                        self._layout(self._load_prompt()),
+                        self._combine_items(chunk),
+                        self.max_tokens,
+                    )
+                futures.append(
+                    executor.submit(
+                        self._complete,
+                        self._layout(self._load_map_prompt()),
+                        self._combine_items(chunk),
+                        self.map_max_tokens,
+                        # Final calls of other domains go first
+                        self.priority + 1,
+                    ),
+                )
+            if not futures:
+                return "今日无新闻内容。"
+
+            self.logger.info(f"Map-reduce: summarizing {len(futures)} chunks")
+            partials = [future.result() for future in futures]
+            return self._reduce(partials, executor)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _reduce(self, partials: list[str], executor: ThreadPoolExecutor) -> str:
+        """Combine partial summaries with the domain prompt.
+
+        Partial summaries that together exceed the token budget are first
+        merged in groups with the map prompt, until they fit.
+
+        Args:
+            partials: Partial summaries in chunk order
+            executor: Executor for the intermediate merge calls
+
+        Returns:
+            Final summary
+        """
+        while len(partials) > 1 and (
+            estimate_tokens(self._combine_partials(partials)) > self.chunk_token_budget
+        ):
+            groups = self._group_partials(partials)
+            self.logger.info(
+                f"Map-reduce: merging {len(partials)} partial summaries "
+                f"into {len(groups)}",
+            )
+            partials = list(
+                executor.map(
+                    lambda group: self._complete(
+                        self._layout(self._load_map_prompt()),
+                        self._combine_partials(group),
+                        self.map_max_tokens,
+                        self.priority + 1,
+                    ),
+                    groups,
+                ),
+            )
+
+        return self._complete(
+            self._layout(self._load_prompt()),
+            self._combine_partials(partials),
+            self.max_tokens,
+        )
+
+    def _pack_chunks(
+        self,
+        items: Iterable[SourceItem],
+    ) -> Iterator[tuple[list[SourceItem], bool]]:
+        """Pack items in order into chunks under the token budget.
+
+        A chunk is yielded as soon as the next item does not fit, so every
+        chunk except the last is complete when it is yielded.
+
+        Args:
+            items: SourceItem objects
+
+        Returns:
+            Iterator over (chunk, is last chunk)
+        """
+        chunk: list[SourceItem] = []
+        chunk_tokens = 0
+        for item in items:
+            for part in self._split_item(item):
+                tokens = estimate_tokens(part.to_str())
+                if chunk and chunk_tokens + tokens > self.chunk_token_budget:
+                    yield chunk, False
+                    chunk, chunk_tokens = [], 0
+                chunk.append(part)
+                chunk_tokens += tokens
+        if chunk:
+            yield chunk, True
+
+    def _split_item(self, item: SourceItem) -> list[SourceItem]:
+        """Split an item that alone exceeds the token budget.
+
+        Args:
+            item: SourceItem object
+
+        Returns:
+            The item, or parts of it each under the budget
+        """
+        if estimate_tokens(item.to_str()) <= self.chunk_token_budget:
+            return [item]
+
+        # A character is at most one estimated token
+        max_chars = max(1, self.chunk_token_budget - estimate_tokens(item.source_title))
+        pieces: list[str] = []
+        current = ""
+        for line in item.content.split("\n"):
+            while len(line) > max_chars:
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(line[:max_chars])
+                line = line[max_chars:]
+            candidate = f"{current}\n{line}" if current else line
+            if estimate_tokens(candidate) > max_chars:
+                pieces.append(current)
+                candidate = line
+            current = candidate
+        if current:
+            pieces.append(current)
+
+        self.logger.info(
+            f"Splitting oversized item into {len(pieces)} parts: {item.source_title}",
+        )
+        return [
+            dataclasses.replace(
+                item,
+                source_title=f"{item.source_title} ({index}/{len(pieces)})",
+                content=piece,
+            )
+            for index, piece in enumerate(pieces, 1)
+        ]
+
+    def _group_partials(self, partials: list[str]) -> list[list[str]]:
+        """Group partial summaries under the token budget.
+
+        Every group holds at least two summaries so each round shrinks.
+
+        Args:
+            partials: Partial summaries
+
+        Returns:
+            Groups of partial summaries in order
+        """
+        groups: list[list[str]] = []
+        group: list[str] = []
+        group_tokens = 0
+        for partial in partials:
+            tokens = estimate_tokens(partial)
+            if len(group) >= 2 and group_tokens + tokens > self.chunk_token_budget:
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(partial)
+            group_tokens += tokens
+        if len(group) == 1 and groups:
+            groups[-1].append(group[0])
+        elif group:
+            groups.append(group)
+        return groups
+
+    def _order_items(self, items: list[SourceItem]) -> list[SourceItem]:
+        """Order items deterministically unless sort_items is disabled.
+
+        Args:
+            items: SourceItem objects
+
+        Returns:
+            Items in prompt order
+        """
+        return order_items(items) if self.sort_items else items
+
+    def _layout(self, template: str) -> PromptLayout:
+        """Get the cached prompt layout of a template.
+
+        Args:
+            template: Prompt template text
+
+        Returns:
+            PromptLayout instance
+        """
+        layout = self._layouts.get(template)
+        if layout is None:
+            layout = self._layouts[template] = PromptLayout(template)
+        return layout
+
+    def _load_map_prompt(self) -> str:
+        """Load the prompt used for chunk summaries.
+
+        Returns:
+            Map prompt string
+        """
+        if self._map_prompt is not None:
+            return self._map_prompt
+
+        self._map_prompt = self._get_default_map_prompt()
+        if self.map_prompt_file:
+            prompt_path = Path(self.map_prompt_file)
+            if not prompt_path.is_absolute():
+                prompt_path = Path.cwd() / prompt_path
+            try:
+                self._map_prompt = prompt_path.read_text(encoding="utf-8")
+            except OSError as e:
+                self.logger.warning(
+                    f"Failed to read map prompt file: {prompt_path}, "
+                    f"using default: {e}",
+                )
+        return self._map_prompt
 
     def _load_prompt(self) -> str:
         """Load prompt template from file.
@@ -134,6 +748,22 @@ class AIProcessor(Processor):
 
         return "\n".join(combined)
 
+    @staticmethod
+    def _combine_partials(partials: list[str]) -> str:
+        """Combine partial summaries into formatted content.
+
+        Args:
+            partials: Partial summaries
+
+        Returns:
+            Combined content string
+        """
+        combined = []
+        for i, partial in enumerate(partials, 1):
+            combined.append(f"--- 部分摘要 {i} ---\n{partial}")
+
+        return "\n".join(combined)
+
     @staticmethod
     def _get_default_prompt() -> str:
         """Get default prompt template.
@@ -153,6 +783,21 @@ class AIProcessor(Processor):
 
 今日摘要："""
 
+    @staticmethod
+    def _get_default_map_prompt() -> str:
+        """Get default prompt for chunk summaries in map-reduce mode.
+
+        Returns:
+            Default map prompt string
+        """
+        return """你是一位新闻信息整理助手。下方是今日新闻内容的一部分，请提取其中所有独立的新闻事件。
+
+要求：
+- 不要筛选或评论，不要遗漏任何事件
+- 同一事件只保留一条，合并各来源的关键信息
+- 每条事件包含：标题、来源、关键事实（人物、公司、产品、数字）、原文链接
+- 以 Markdown 列表输出，保持简洁"""
+
     @staticmethod
     def _strip_code_block(content: str) -> str:
         """Remove markdown code block wrapper from AI output.
@@ -1,14 +1,17 @@
-"""Base processor abstract class."""
+"""Base processor abstract classes."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
 from app.src.models import SourceItem
+from app.src.utils.deadline import Deadline
 from app.src.utils.logger import get_logger
 
 
-class Processor(ABC):
-    """Abstract base class for all processors."""
+class _ProcessorBase(ABC):
+    """State shared by blocking and async processors."""
 
     def __init__(self, config: dict[str, Any], name: str):
         """Initialize the processor.
@@ -20,6 +23,13 @@ class Processor(ABC):
         self.config = config
         self.name = name
         self.logger = get_logger(f"processor.{name}")
+        # Deadline of the current run, set by the caller; processors bound
+        # their API calls by it
+        self.deadline: Deadline | None = None
+
+
+class Processor(_ProcessorBase):
+    """Abstract base class for all processors."""
 
     @abstractmethod
     def process(self, items: list[SourceItem]) -> str:
@@ -32,3 +42,56 @@ class Processor(ABC):
             Processed summary text
         """
         pass
+
+    def process_stream(self, items: Iterable[SourceItem]) -> str:
+        """Process items that arrive while other collectors are still running.
+
+        The default implementation waits for the stream to end and calls
+        process(); processors that can start work early should override it.
+
+        Args:
+            items: Iterable of SourceItem objects, consumed as they arrive
+
+        Returns:
+            Processed summary text
+        """
+        return self.process(list(items))
+
+
+class AsyncProcessor(_ProcessorBase):
+    """Abstract base class for processors running on an asyncio event loop."""
+
+    @abstractmethod
+    async def process(self, items: list[SourceItem]) -> str:
+        """Process source items and generate summary.
+
+        Args:
+            items: List of SourceItem objects
+
+        Returns:
+            Processed summary text
+        """
+
+
+class SyncProcessorAdapter(AsyncProcessor):
+    """Runs a blocking Processor in the event loop's default executor."""
+
+    def __init__(self, processor: Processor):
+        """Wrap a blocking processor.
+
+        Args:
+            processor: Processor to run in a worker thread
+        """
+        super().__init__(processor.config, processor.name)
+        self.processor = processor
+
+    async def process(self, items: list[SourceItem]) -> str:
+        """Process items on a worker thread.
+
+        Args:
+            items: List of SourceItem objects
+
+        Returns:
+            Processed summary text
+        """
+        return await asyncio.to_thread(self.processor.process, items)
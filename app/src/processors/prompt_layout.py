@@ -0,0 +1,66 @@
+"""Prompt assembly with a stable, cache-friendly prefix."""
+
+from datetime import datetime, timezone
+
+from app.src.models import SourceItem
+
+# Marks where per-day content goes in a prompt template
+CONTENT_PLACEHOLDER = "{combined_content}"
+
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class PromptLayout:
+    """Splits a prompt template into static instructions and per-day content.
+
+    Everything before ``{combined_content}`` becomes the system message and
+    is byte-identical between runs, so providers with prefix caching can
+    reuse it. Text after the placeholder (e.g. a closing instruction) goes
+    after the content in the user message. Templates without the
+    placeholder are used whole as the system message.
+    """
+
+    def __init__(self, template: str):
+        """Initialize the layout.
+
+        Args:
+            template: Prompt template text
+        """
+        # Line endings and trailing whitespace must not vary between runs
+        template = template.replace("\r\n", "\n").replace("\r", "\n")
+        prefix, placeholder, suffix = template.partition(CONTENT_PLACEHOLDER)
+        self.system_prompt = "\n".join(line.rstrip() for line in prefix.split("\n"))
+        self.system_prompt = self.system_prompt.strip()
+        self.suffix = suffix.strip() if placeholder else ""
+
+    def user_prompt(self, content: str) -> str:
+        """Build the user message for the per-day content.
+
+        Args:
+            content: Combined item content
+
+        Returns:
+            User message text
+        """
+        if not self.suffix:
+            return content
+        return f"{content}\n\n{self.suffix}"
+
+
+def order_items(items: list[SourceItem]) -> list[SourceItem]:
+    """Order items deterministically by source, time and title.
+
+    Args:
+        items: SourceItem objects in collection order
+
+    Returns:
+        Sorted copy of the list
+    """
+
+    def key(item: SourceItem) -> tuple:
+        published_at = item.published_at or _EPOCH
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=timezone.utc)
+        return (item.source_name, published_at, item.source_title, item.content)
+
+    return sorted(items, key=key)
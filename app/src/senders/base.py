@@ -1,13 +1,14 @@
-"""Base sender abstract class."""
+"""Base sender abstract classes."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
 from app.src.utils.logger import get_logger
 
 
-class Sender(ABC):
-    """Abstract base class for all senders."""
+class _SenderBase(ABC):
+    """State shared by blocking and async senders."""
 
     def __init__(self, config: dict[str, Any], name: str):
         """Initialize the sender.
@@ -20,6 +21,10 @@ class Sender(ABC):
         self.name = name
         self.logger = get_logger(f"sender.{name}")
 
+
+class Sender(_SenderBase):
+    """Abstract base class for all senders."""
+
     @abstractmethod
     def send(self, content: str, subject: str) -> bool:
         """Send content with given subject.
@@ -32,3 +37,44 @@ class Sender(ABC):
             True if send was successful
         """
         pass
+
+
+class AsyncSender(_SenderBase):
+    """Abstract base class for senders running on an asyncio event loop."""
+
+    @abstractmethod
+    async def send(self, content: str, subject: str) -> bool:
+        """Send content with given subject.
+
+        Args:
+            content: Content to send
+            subject: Subject line
+
+        Returns:
+            True if send was successful
+        """
+
+
+class SyncSenderAdapter(AsyncSender):
+    """Runs a blocking Sender in the event loop's default executor."""
+
+    def __init__(self, sender: Sender):
+        """Wrap a blocking sender.
+
+        Args:
+            sender: Sender to run in a worker thread
+        """
+        super().__init__(sender.config, sender.name)
+        self.sender = sender
+
+    async def send(self, content: str, subject: str) -> bool:
+        """Send on a worker thread.
+
+        Args:
+            content: Content to send
+            subject: Subject line
+
+        Returns:
+            True if send was successful
+        """
+        return await asyncio.to_thread(self.sender.send, content, subject)
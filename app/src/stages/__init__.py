@@ -0,0 +1 @@
+# stages
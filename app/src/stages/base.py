@@ -0,0 +1,73 @@
+"""Base stage abstract class."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from app.src.models import SourceItem
+from app.src.utils.logger import get_logger
+
+
+class Stage(ABC):
+    """Abstract base class for item stages between collection and processing.
+
+    Stages see each item once, either one at a time in the streaming
+    pipeline (process()) or as a whole list (process_batch()).
+    """
+
+    def __init__(self, config: dict[str, Any], name: str):
+        """Initialize the stage.
+
+        Args:
+            config: Stage configuration dictionary
+            name: Unique name for this stage instance
+        """
+        self.config = config
+        self.name = name
+        self.logger = get_logger(f"stage.{name}")
+
+    @abstractmethod
+    def process(self, item: SourceItem) -> SourceItem | None:
+        """Transform a single item.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            Transformed item, or None to drop it
+        """
+
+    def process_batch(self, items: list[SourceItem]) -> list[SourceItem]:
+        """Transform a complete list of items.
+
+        Stages that need to see all items at once (e.g. to compare them)
+        override this; the default applies process() to each item.
+
+        Args:
+            items: Collected items
+
+        Returns:
+            Transformed items
+        """
+        results = []
+        for item in items:
+            result = self.process(item)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def finalize_report(self, content: str) -> str:
+        """Post-process the report before it is sent.
+
+        Stages that replace content with placeholders (e.g. link
+        references) restore it here; the default returns it unchanged.
+
+        Args:
+            content: Processed report content
+
+        Returns:
+            Report content
+        """
+        return content
+
+    def close(self) -> None:
+        """Release resources or persist state at the end of a domain run."""
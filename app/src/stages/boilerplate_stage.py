@@ -0,0 +1,62 @@
+"""Stage removing recurring newsletter boilerplate per sender."""
+
+import dataclasses
+from typing import Any
+
+from app.src.models import SourceItem
+from app.src.stages.base import Stage
+from app.src.utils.boilerplate import BoilerplateModel
+
+
+class BoilerplateStage(Stage):
+    """Strips lines and blocks that recur across issues of the same source.
+
+    The model is keyed by ``source_name``; each item is stripped with what
+    was learned from earlier issues and then added to the model, which is
+    persisted when the stage is closed.
+    """
+
+    def __init__(self, config: dict[str, Any], name: str):
+        """Initialize the boilerplate stage.
+
+        Args:
+            config: Stage configuration (model_file, min_issues, max_age_days,
+                max_fingerprints)
+            name: Unique name for this stage instance
+        """
+        super().__init__(config, name)
+        self.model = BoilerplateModel(
+            config.get("model_file", "app/state/boilerplate.json"),
+            min_issues=config.get("min_issues", 3),
+            max_age_days=config.get("max_age_days", 30),
+            max_fingerprints=config.get("max_fingerprints", 5000),
+        )
+        self.chars_in = 0
+        self.chars_out = 0
+
+    def process(self, item: SourceItem) -> SourceItem | None:
+        """Strip learned boilerplate from an item and learn from it.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            Item with boilerplate removed
+        """
+        content = self.model.strip(item.source_name, item.content)
+        self.model.learn(item.source_name, item.content)
+        self.chars_in += len(item.content)
+        self.chars_out += len(content)
+        if content == item.content:
+            return item
+        return dataclasses.replace(item, content=content)
+
+    def close(self) -> None:
+        """Persist the model and log how much content was removed."""
+        if self.chars_in:
+            removed = self.chars_in - self.chars_out
+            self.logger.info(
+                f"Removed {removed} of {self.chars_in} characters "
+                f"({removed / self.chars_in:.0%}) as boilerplate",
+            )
+        self.model.save()
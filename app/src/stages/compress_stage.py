@@ -0,0 +1,61 @@
+"""Stage shrinking long items by extractive summarization."""
+
+import dataclasses
+from typing import Any
+
+from app.src.models import SourceItem
+from app.src.stages.base import Stage
+from app.src.utils.extractive import compress
+from app.src.utils.tokens import estimate_tokens
+
+
+class CompressStage(Stage):
+    """Trims item content to a size budget without an LLM call.
+
+    Keeps headlines, sentences with links and the sentences most
+    representative of the item, in their original order. The budget is
+    ``max_tokens`` estimated tokens if set, else ``max_chars`` characters.
+    """
+
+    def __init__(self, config: dict[str, Any], name: str):
+        """Initialize the compression stage.
+
+        Args:
+            config: Stage configuration (max_chars, max_tokens)
+            name: Unique name for this stage instance
+        """
+        super().__init__(config, name)
+        self.max_tokens = config.get("max_tokens", 0)
+        self.max_chars = config.get("max_chars", 2000)
+        self.chars_in = 0
+        self.chars_out = 0
+        self.compressed_items = 0
+
+    def process(self, item: SourceItem) -> SourceItem | None:
+        """Compress the content of an item over the budget.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            Item with compressed content
+        """
+        if self.max_tokens:
+            content = compress(item.content, self.max_tokens, estimate_tokens)
+        else:
+            content = compress(item.content, self.max_chars)
+        self.chars_in += len(item.content)
+        self.chars_out += len(content)
+        if content == item.content:
+            return item
+        self.compressed_items += 1
+        return dataclasses.replace(item, content=content)
+
+    def close(self) -> None:
+        """Log how much content was removed."""
+        if self.chars_in:
+            removed = self.chars_in - self.chars_out
+            self.logger.info(
+                f"Compressed {self.compressed_items} items, removing {removed} of "
+                f"{self.chars_in} characters ({removed / self.chars_in:.0%})",
+            )
@@ -0,0 +1,137 @@
+"""Stage removing exact and near-duplicate items."""
+
+from typing import Any
+
+from app.src.models import SourceItem
+from app.src.stages.base import Stage
+from app.src.utils.simhash import SimHashIndex, content_hash, simhash, tokenize
+
+
+class DedupStage(Stage):
+    """Drops items whose content duplicates another item of the domain run.
+
+    Exact duplicates are found by a normalized content hash, near duplicates
+    by SimHash over word shingles. In batch mode each cluster keeps its
+    longest (most complete) item; in streaming mode the first item wins.
+    """
+
+    def __init__(self, config: dict[str, Any], name: str):
+        """Initialize the dedup stage.
+
+        Args:
+            config: Stage configuration (max_distance, shingle_size,
+                min_tokens)
+            name: Unique name for this stage instance
+        """
+        super().__init__(config, name)
+        self.max_distance = config.get("max_distance", 6)
+        self.shingle_size = config.get("shingle_size", 3)
+        # Shorter texts only get exact matching; their SimHash is unstable
+        self.min_tokens = config.get("min_tokens", 30)
+        self._hashes: set[str] = set()
+        self._index = SimHashIndex(self.max_distance)
+        self._seen = 0
+        self.removed_items = 0
+        self.removed_chars = 0
+
+    def process(self, item: SourceItem) -> SourceItem | None:
+        """Drop an item if it duplicates an earlier one.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            The item, or None if it is a duplicate
+        """
+        digest, fingerprint = self._fingerprints(item)
+        duplicate = digest in self._hashes or (
+            fingerprint is not None and bool(self._index.query(fingerprint))
+        )
+        if duplicate:
+            self._count_removed(item)
+            return None
+
+        self._hashes.add(digest)
+        if fingerprint is not None:
+            self._index.add(self._seen, fingerprint)
+        self._seen += 1
+        return item
+
+    def process_batch(self, items: list[SourceItem]) -> list[SourceItem]:
+        """Cluster duplicates and keep the longest item of each cluster.
+
+        Args:
+            items: Collected items
+
+        Returns:
+            Representatives in their original order
+        """
+        parent = list(range(len(items)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        by_hash: dict[str, int] = {}
+        index = SimHashIndex(self.max_distance)
+        for i, item in enumerate(items):
+            digest, fingerprint = self._fingerprints(item)
+            matches = [by_hash[digest]] if digest in by_hash else []
+            if fingerprint is not None:
+                matches.extend(index.query(fingerprint))
+                index.add(i, fingerprint)
+            by_hash.setdefault(digest, i)
+            for j in matches:
+                parent[find(j)] = find(i)
+
+        best: dict[int, int] = {}
+        for i, item in enumerate(items):
+            root = find(i)
+            if root not in best or len(item.content) > len(items[best[root]].content):
+                best[root] = i
+
+        keep = set(best.values())
+        for i, item in enumerate(items):
+            if i not in keep:
+                self._count_removed(item)
+        self._report()
+        return [item for i, item in enumerate(items) if i in keep]
+
+    def close(self) -> None:
+        """Report removed duplicates of a streaming run."""
+        if self._seen:
+            self._report()
+
+    def _fingerprints(self, item: SourceItem) -> tuple[str, int | None]:
+        """Compute the exact and near-duplicate fingerprints of an item.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            Tuple of (content hash, SimHash or None for short content)
+        """
+        tokens = tokenize(item.content)
+        fingerprint = None
+        if len(tokens) >= self.min_tokens:
+            fingerprint = simhash(tokens, self.shingle_size)
+        return content_hash(item.content), fingerprint
+
+    def _count_removed(self, item: SourceItem) -> None:
+        """Record a removed duplicate.
+
+        Args:
+            item: Removed item
+        """
+        self.removed_items += 1
+        self.removed_chars += len(item.content)
+        self.logger.debug(f"Duplicate item removed: {item.source_title}")
+
+    def _report(self) -> None:
+        """Log how many items and characters were removed."""
+        self.logger.info(
+            f"Removed {self.removed_items} duplicate items "
+            f"({self.removed_chars} characters)",
+        )
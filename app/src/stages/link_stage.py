@@ -0,0 +1,83 @@
+"""Stage canonicalizing and compacting links in item content."""
+
+import dataclasses
+import re
+from typing import Any
+
+from app.src.models import SourceItem
+from app.src.stages.base import Stage
+from app.src.utils.links import URL_PATTERN, LinkTable, canonicalize_url, split_url
+
+
+class LinkStage(Stage):
+    """Unwraps redirectors, strips tracking parameters and shortens URLs.
+
+    With ``link_refs`` enabled every URL is replaced by a short reference
+    that finalize_report() expands back to the full URL in the summary.
+    """
+
+    def __init__(self, config: dict[str, Any], name: str):
+        """Initialize the link stage.
+
+        Args:
+            config: Stage configuration (link_refs, strip_params)
+            name: Unique name for this stage instance
+        """
+        super().__init__(config, name)
+        self.link_refs = config.get("link_refs", False)
+        self.strip_params = {p.lower() for p in config.get("strip_params", [])}
+        self.links = LinkTable()
+        self.chars_in = 0
+        self.chars_out = 0
+
+    def process(self, item: SourceItem) -> SourceItem | None:
+        """Rewrite the URLs of an item.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            Item with canonical (or referenced) URLs
+        """
+        content = URL_PATTERN.sub(self._rewrite, item.content)
+        self.chars_in += len(item.content)
+        self.chars_out += len(content)
+        if content == item.content:
+            return item
+        return dataclasses.replace(item, content=content)
+
+    def finalize_report(self, content: str) -> str:
+        """Expand link references in the processed report.
+
+        Args:
+            content: Processed report content
+
+        Returns:
+            Report with full URLs
+        """
+        if not self.link_refs:
+            return content
+        return self.links.expand(content)
+
+    def close(self) -> None:
+        """Log how much the links were shortened."""
+        if self.chars_in:
+            self.logger.info(
+                f"Links shortened content from {self.chars_in} to "
+                f"{self.chars_out} characters ({len(self.links)} references)",
+            )
+
+    def _rewrite(self, match: re.Match) -> str:
+        """Rewrite a single URL match.
+
+        Args:
+            match: URL_PATTERN match
+
+        Returns:
+            Replacement text
+        """
+        url, trailing = split_url(match.group(0))
+        url = canonicalize_url(url, self.strip_params)
+        if self.link_refs:
+            url = self.links.ref(url)
+        return url + trailing
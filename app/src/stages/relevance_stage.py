@@ -0,0 +1,211 @@
+"""Stage dropping off-topic items before they reach the processor."""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+from app.src.models import SourceItem
+from app.src.stages.base import Stage
+from app.src.utils.relevance import (
+    RelevanceModel,
+    item_text,
+    load_examples,
+    train_from_history,
+)
+
+# Content kept per item in the audit log
+AUDIT_CONTENT_CHARS = 2000
+
+
+class RelevanceStage(Stage):
+    """Filters items by keyword rules and a local relevance classifier.
+
+    Rules are case-insensitive regular expressions matched against title
+    and content: ``include`` matches are always kept, ``exclude`` matches
+    are dropped. Remaining items are scored by a TF-IDF logistic regression
+    trained on a labeled JSONL history and dropped below ``threshold``.
+    Dropped items are appended to an audit log in the history format, so
+    wrong decisions can be relabeled and fed back into training.
+    """
+
+    def __init__(self, config: dict[str, Any], name: str):
+        """Initialize the relevance stage.
+
+        Args:
+            config: Stage configuration (include, exclude, model_file,
+                training_file, min_examples, threshold, audit_file, dry_run)
+            name: Unique name for this stage instance
+        """
+        super().__init__(config, name)
+        self.include = self._compile(config.get("include"))
+        self.exclude = self._compile(config.get("exclude"))
+        self.threshold = config.get("threshold", 0.3)
+        self.audit_file = config.get("audit_file", "app/state/relevance_audit.jsonl")
+        # Log and audit decisions without dropping anything
+        self.dry_run = config.get("dry_run", False)
+        self.model = self._load_model(
+            config.get("model_file", "app/state/relevance.json"),
+            config.get("training_file", ""),
+            config.get("min_examples", 10),
+        )
+        self._audit: IO[str] | None = None
+        self.seen_items = 0
+        self.dropped_items = 0
+        self.dropped_chars = 0
+
+    def process(self, item: SourceItem) -> SourceItem | None:
+        """Drop an item if the rules or the classifier reject it.
+
+        Args:
+            item: Collected item
+
+        Returns:
+            The item, or None if it is off-topic
+        """
+        self.seen_items += 1
+        text = item_text(item.to_dict())
+        if self._matches(self.include, text):
+            return item
+
+        score = None
+        pattern = self._matches(self.exclude, text)
+        if pattern:
+            reason = f"exclude rule: {pattern}"
+        elif self.model is not None:
+            score = self.model.score(text)
+            if score >= self.threshold:
+                return item
+            reason = f"score {score:.2f} below {self.threshold}"
+        else:
+            return item
+
+        self.dropped_items += 1
+        self.dropped_chars += len(item.content)
+        self.logger.debug(f"Off-topic item ({reason}): {item.source_title}")
+        self._write_audit(item, reason, score)
+        return item if self.dry_run else None
+
+    def close(self) -> None:
+        """Close the audit log and report dropped items."""
+        if self._audit is not None:
+            self._audit.close()
+            self._audit = None
+        if self.seen_items:
+            action = "Would drop" if self.dry_run else "Dropped"
+            self.logger.info(
+                f"{action} {self.dropped_items} of {self.seen_items} items as "
+                f"off-topic ({self.dropped_chars} characters)",
+            )
+
+    def _load_model(
+        self,
+        model_file: str,
+        training_file: str,
+        min_examples: int,
+    ) -> RelevanceModel | None:
+        """Load the classifier, retraining it when the history is newer.
+
+        Args:
+            model_file: Path of the saved model
+            training_file: Labeled JSONL history (optional)
+            min_examples: Minimum examples per class needed for training
+
+        Returns:
+            RelevanceModel, or None if neither a model nor enough history
+            is available (only keyword rules apply then)
+        """
+        model_path = Path(model_file)
+        training_path = Path(training_file) if training_file else None
+        if (
+            training_path is not None
+            and training_path.exists()
+            and (
+                not model_path.exists()
+                or training_path.stat().st_mtime > model_path.stat().st_mtime
+            )
+        ):
+            try:
+                model = train_from_history(load_examples(training_path), min_examples)
+            except OSError as e:
+                self.logger.warning(f"Failed to read training file: {e}")
+                model = None
+            if model is not None:
+                self.logger.info(f"Trained relevance model from {training_path}")
+                try:
+                    model.save(model_path)
+                except OSError as e:
+                    self.logger.warning(
+                        f"Failed to save relevance model, using it unsaved: {e}",
+                    )
+                return model
+            self.logger.warning(
+                f"Not enough labeled items in {training_path} "
+                f"(need {min_examples} of each class)",
+            )
+
+        if not model_path.exists():
+            return None
+        try:
+            return RelevanceModel.load(model_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to load relevance model: {e}")
+            return None
+
+    def _write_audit(self, item: SourceItem, reason: str, score: float | None) -> None:
+        """Append a dropped item to the audit log.
+
+        Args:
+            item: Dropped item
+            reason: Why it was dropped
+            score: Classifier score, if computed
+        """
+        if not self.audit_file:
+            return
+        record = {
+            "dropped_at": datetime.now().isoformat(timespec="seconds"),
+            "stage": self.name,
+            "reason": reason,
+            "score": score,
+            "label": None,
+            "source_name": item.source_name,
+            "source_title": item.source_title,
+            "content": item.content[:AUDIT_CONTENT_CHARS],
+        }
+        try:
+            if self._audit is None:
+                path = Path(self.audit_file)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._audit = path.open("a", encoding="utf-8")
+            self._audit.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.logger.warning(f"Failed to write relevance audit log: {e}")
+
+    @staticmethod
+    def _compile(patterns: list[str] | None) -> list[re.Pattern]:
+        """Compile case-insensitive patterns.
+
+        Args:
+            patterns: Regular expressions
+
+        Returns:
+            Compiled patterns
+        """
+        return [re.compile(pattern, re.IGNORECASE) for pattern in patterns or []]
+
+    @staticmethod
+    def _matches(patterns: list[re.Pattern], text: str) -> str | None:
+        """Find the first pattern matching text.
+
+        Args:
+            patterns: Compiled patterns
+            text: Text to search
+
+        Returns:
+            The matching pattern, or None
+        """
+        for pattern in patterns:
+            if pattern.search(text):
+                return pattern.pattern
+        return None
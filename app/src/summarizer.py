@@ -1,12 +1,29 @@
+import concurrent.futures
 import imaplib
+import itertools
 import smtplib
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
+from app.src.async_engine import AsyncEngine
+from app.src.collectors.base import Collector
 from app.src.collectors.email_collector import EmailCollector
-from app.src.config_loader import ConfigLoader
+from app.src.config_loader import ConfigLoader, select_options
 from app.src.models import SourceItem
+from app.src.pipeline import StreamingPipeline
 from app.src.processors.ai_processor import AIProcessor
 from app.src.senders.email_sender import EmailSender
+from app.src.stages.base import Stage
+from app.src.stages.boilerplate_stage import BoilerplateStage
+from app.src.stages.compress_stage import CompressStage
+from app.src.stages.dedup_stage import DedupStage
+from app.src.stages.link_stage import LinkStage
+from app.src.stages.relevance_stage import RelevanceStage
+from app.src.utils.deadline import Deadline
+from app.src.utils.imap_pool import IMAPConnectionPool, get_imap_pool
 from app.src.utils.logger import setup_logger
 from openai import APIConnectionError, APIError, RateLimitError
 
@@ -14,6 +31,18 @@ from openai import APIConnectionError, APIError, RateLimitError
 class NewsSummarizer:
     """Main controller for the news summarization process."""
 
+    # Errors that end a domain run, a processor run or a send, shared with
+    # the async engine
+    DOMAIN_ERRORS = (
+        imaplib.IMAP4.error,
+        smtplib.SMTPException,
+        KeyError,
+        TypeError,
+        AttributeError,
+    )
+    PROCESSING_ERRORS = (APIError, APIConnectionError, RateLimitError)
+    SEND_ERRORS = (smtplib.SMTPException,)
+
     def __init__(self, config_path: str = "app/conf/config.yaml"):
         """Initialize the news summarizer.
 
@@ -39,11 +68,133 @@ class NewsSummarizer:
             self.logger.warning("No domains configured")
             return
 
-        for domain in domains:
-            self._process_domain(domain)
+        imap_pool = get_imap_pool()
+        imap_pool.configure(
+            **select_options(
+                self._global_settings().get("imap_pool"),
+                IMAPConnectionPool.OPTIONS,
+                "imap_pool",
+            ),
+        )
+        try:
+            if self._global_settings().get("run_mode") == "async":
+                results = AsyncEngine(self).run(domains)
+            else:
+                results = self._run_domains(domains)
+        finally:
+            imap_pool.close_all()
+        self._log_domain_summary(results)
 
         self.logger.info("News summarization completed")
 
+    def _run_domains(self, domains: list[dict]) -> list[tuple[str, str, float]]:
+        """Run all domains on a bounded worker pool.
+
+        ``global.domain_workers`` sets how many domains run at the same time
+        (1 keeps the serial behaviour). Each domain may have a deadline
+        (``timeout`` on the domain, else ``global.domain_timeout``), counted
+        from when the domain starts. A domain that misses it is cancelled:
+        it sends and acknowledges nothing, and its remaining collector and
+        processor calls are bounded by what was left of the budget.
+
+        Args:
+            domains: Domain configurations
+
+        Returns:
+            List of (domain name, status, wall time in seconds) in config order
+        """
+        settings = self._global_settings()
+        max_workers = max(1, min(len(domains), settings.get("domain_workers", 1)))
+        default_timeout = settings.get("domain_timeout")
+
+        started_at: dict[int, float] = {}
+        deadlines = [
+            Deadline(domain.get("timeout", default_timeout)) for domain in domains
+        ]
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="domain",
+        )
+        futures = [
+            executor.submit(self._run_domain, domain, index, started_at, deadline)
+            for index, (domain, deadline) in enumerate(zip(domains, deadlines))
+        ]
+
+        results: list[tuple[str, str, float]] = []
+        try:
+            for index, (domain, future) in enumerate(zip(domains, futures)):
+                domain_name = domain.get("name", "unknown")
+                timeout = deadlines[index].timeout
+                try:
+                    status, elapsed = self._wait_for_result(
+                        future,
+                        index,
+                        started_at,
+                        timeout,
+                    )
+                except TimeoutError:
+                    # Stops the worker at its next checkpoint, before any
+                    # send or acknowledgement
+                    deadlines[index].cancel()
+                    self.logger.error(
+                        f"Domain {domain_name} missed its deadline of {timeout}s",
+                    )
+                    status, elapsed = "timed out", float(timeout)
+                results.append((domain_name, status, elapsed))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def _run_domain(
+        self,
+        domain: dict,
+        index: int,
+        started_at: dict[int, float],
+        deadline: Deadline,
+    ) -> tuple[str, float]:
+        """Process a domain on a worker thread and time it.
+
+        Args:
+            domain: Domain configuration dictionary
+            index: Position of the domain in the configuration
+            started_at: Shared map of domain index to start time
+            deadline: Deadline of the domain, started here
+
+        Returns:
+            Tuple of (status, wall time in seconds)
+        """
+        started_at[index] = time.monotonic()
+        deadline.start()
+        try:
+            status = self._process_domain(domain, deadline)
+        except Exception:
+            # Keep one broken domain from hiding the summary of the others
+            self.logger.exception(f"Domain {domain.get('name', 'unknown')} failed")
+            status = "error"
+        return status, time.monotonic() - started_at[index]
+
+    def _log_domain_summary(self, results: list[tuple[str, str, float]]) -> None:
+        """Log per-domain status and wall time.
+
+        Args:
+            results: List of (domain name, status, wall time in seconds)
+        """
+        if not results:
+            return
+        lines = [
+            f"  {name}: {status} in {elapsed:.1f}s" for name, status, elapsed in results
+        ]
+        self.logger.info("Domain summary:\n" + "\n".join(lines))
+
+    def _global_settings(self) -> dict:
+        """Get the ``global`` section of the configuration.
+
+        Returns:
+            Global settings dictionary (empty if not configured)
+        """
+        return (self.config or {}).get("global") or {}
+
     def _load_config(self) -> dict:
         """Load configuration from file.
 
@@ -53,69 +204,420 @@ class NewsSummarizer:
         loader = ConfigLoader(self.config_path)
         return loader.load()
 
-    def _process_domain(self, domain: dict) -> None:
+    def _process_domain(self, domain: dict, deadline: Deadline | None = None) -> str:
         """Process a single domain.
 
         Args:
             domain: Domain configuration dictionary
+            deadline: Deadline of the domain run (None is unbounded)
+
+        Returns:
+            Short status of the domain run (e.g., "sent", "no items")
         """
         domain_name = domain.get("name", "unknown")
         self.logger.info(f"Processing domain: {domain_name}")
 
+        stages = self._create_stages(domain)
+        stream = None
         try:
-            items = self._collect_items(domain)
+            collectors = self._create_collectors(domain)
+            if domain.get("streaming", False):
+                pipeline = self._create_pipeline(collectors, stages, deadline)
+                stream = pipeline.stream()
+                items = self._peek_stream(stream)
+            else:
+                pipeline = None
+                items, delivered = self._collect_items(collectors, deadline)
+                items = self._apply_stages(items, stages)
             if not items:
                 self.logger.warning(f"No items collected for domain {domain_name}")
-                return
+                return "no items"
 
-            processed_content = self._process_items(items, domain)
+            processed_content = self._process_items(items, domain, deadline)
             if not processed_content:
                 self.logger.error(f"Failed to process items for domain {domain_name}")
-                return
+                return "processing failed"
+
+            processed_content = self._finalize_report(processed_content, stages)
+            if self._deadline_expired(deadline, domain_name, "sending"):
+                return "timed out"
+            if not self._send_report(processed_content, domain):
+                return "send failed"
+            if self._deadline_expired(deadline, domain_name, "acknowledging"):
+                return "timed out"
+            self._acknowledge_collectors(pipeline.delivered if pipeline else delivered)
+            return "sent"
+
+        except TimeoutError:
+            self.logger.error(f"Domain {domain_name} ran out of time")
+            return "timed out"
+
+        except self.DOMAIN_ERRORS as e:
+            self.logger.exception(f"Error processing domain {domain_name}: {e}")
+            return "error"
 
-            self._send_report(processed_content, domain)
+        finally:
+            if stream is not None:
+                stream.close()
+            self._close_stages(stages)
 
-        except (
-            imaplib.IMAP4.error,
-            smtplib.SMTPException,
-            KeyError,
-            TypeError,
-            AttributeError,
-        ) as e:
-            self.logger.exception(f"Error processing domain {domain_name}: {e}")
+    def _deadline_expired(
+        self,
+        deadline: Deadline | None,
+        domain_name: str,
+        step: str,
+    ) -> bool:
+        """Check the domain deadline before a step with side effects.
+
+        Args:
+            deadline: Deadline of the domain run
+            domain_name: Domain name for logging
+            step: Step about to run, for logging
+
+        Returns:
+            True if the deadline has expired and the step must be skipped
+        """
+        if deadline is None or not deadline.expired:
+            return False
+        self.logger.error(
+            f"Domain {domain_name} missed its deadline, skipped {step} the report",
+        )
+        return True
+
+    def _create_stages(self, domain: dict) -> list[Stage]:
+        """Create the item stages configured for a domain.
+
+        Args:
+            domain: Domain configuration
+
+        Returns:
+            Stage instances in the order they are applied
+        """
+        stages = []
+        for stage_config in domain.get("stages", []):
+            stage = self._create_stage(stage_config)
+            if stage is not None:
+                stages.append(stage)
+        return stages
 
-    def _collect_items(self, domain: dict) -> list[SourceItem]:
-        """Collect items from all enabled collectors in domain.
+    def _create_stage(self, config: dict) -> Stage | None:
+        """Create a stage instance based on configuration.
+
+        Args:
+            config: Stage configuration
+
+        Returns:
+            Stage instance or None
+        """
+        stage_type = config.get("type", "")
+        name = config.get("name", stage_type or "unknown")
+
+        if stage_type == "boilerplate":
+            return BoilerplateStage(config, name)
+        if stage_type == "links":
+            return LinkStage(config, name)
+        if stage_type == "dedup":
+            return DedupStage(config, name)
+        if stage_type == "relevance":
+            return RelevanceStage(config, name)
+        if stage_type == "compress":
+            return CompressStage(config, name)
+
+        self.logger.warning(f"Unknown stage type: {stage_type}")
+        return None
+
+    def _apply_stages(
+        self,
+        items: list[SourceItem],
+        stages: list[Stage],
+    ) -> list[SourceItem]:
+        """Run collected items through all stages.
+
+        Args:
+            items: Collected items
+            stages: Stage instances
+
+        Returns:
+            Items remaining after all stages
+        """
+        for stage in stages:
+            count = len(items)
+            items = stage.process_batch(items)
+            if len(items) != count:
+                self.logger.info(
+                    f"Stage {stage.name} kept {len(items)} of {count} items",
+                )
+        return items
+
+    @staticmethod
+    def _finalize_report(content: str, stages: list[Stage]) -> str:
+        """Let stages post-process the report before it is sent.
+
+        Args:
+            content: Processed report content
+            stages: Stage instances
+
+        Returns:
+            Final report content
+        """
+        for stage in stages:
+            content = stage.finalize_report(content)
+        return content
+
+    def _close_stages(self, stages: list[Stage]) -> None:
+        """Close all stages of a domain run.
+
+        Args:
+            stages: Stage instances
+        """
+        for stage in stages:
+            try:
+                stage.close()
+            except OSError:
+                self.logger.exception(f"Failed to close stage {stage.name}")
+
+    def _create_pipeline(
+        self,
+        collectors: list[Collector],
+        stages: list[Stage],
+        deadline: Deadline | None = None,
+    ) -> StreamingPipeline:
+        """Create a streaming pipeline for a domain.
+
+        Args:
+            collectors: Collector instances
+            stages: Stage instances
+            deadline: Deadline of the domain run, bounding collector timeouts
+
+        Returns:
+            StreamingPipeline instance
+        """
+        settings = self._global_settings()
+        return StreamingPipeline(
+            collectors,
+            stages,
+            queue_size=settings.get("stream_queue_size", 32),
+            max_workers=settings.get("collector_workers", 4),
+            default_timeout=settings.get("collector_timeout", 600),
+            deadline=deadline,
+        )
+
+    @staticmethod
+    def _peek_stream(stream: Iterator[SourceItem]) -> Iterator[SourceItem] | None:
+        """Wait for the first streamed item.
+
+        Args:
+            stream: Item stream of a pipeline
+
+        Returns:
+            Stream including the first item, or None if the stream is empty
+        """
+        first = next(stream, None)
+        if first is None:
+            return None
+        return itertools.chain([first], stream)
+
+    def _create_collectors(self, domain: dict) -> list[Collector]:
+        """Create all enabled collectors of a domain.
 
         Args:
             domain: Domain configuration
 
         Returns:
-            List of collected SourceItem objects
+            List of collector instances
         """
         collectors_config = domain.get("collectors", [])
         if not collectors_config:
             self.logger.warning("No collectors configured")
             return []
 
-        all_items: list[SourceItem] = []
-
+        collectors = []
         for collector_config in collectors_config:
             collector = self._create_collector(collector_config)
-            if collector is None:
-                continue
+            if collector is not None:
+                collectors.append(collector)
+        return collectors
+
+    def _collect_items(
+        self,
+        collectors: list[Collector],
+        deadline: Deadline | None = None,
+    ) -> tuple[list[SourceItem], list[Collector]]:
+        """Collect items from all collectors of a domain concurrently.
+
+        Collectors run on a bounded thread pool (``global.collector_workers``).
+        Each collector gets its own timeout, counted from the moment it starts
+        running (``timeout`` on the collector, else ``global.collector_timeout``)
+        and cut short by the domain deadline. Results are merged in
+        configuration order so the processor input is stable between runs.
+
+        Args:
+            collectors: Collector instances
+            deadline: Deadline of the domain run
+
+        Returns:
+            Tuple of (collected SourceItem objects, collectors that finished)
+        """
+        if not collectors:
+            return [], []
+
+        settings = self._global_settings()
+        max_workers = max(1, min(len(collectors), settings.get("collector_workers", 4)))
+        default_timeout = settings.get("collector_timeout", 600)
+
+        started_at: dict[int, float] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="collector",
+        )
+        futures = [
+            executor.submit(self._run_collector, collector, index, started_at)
+            for index, collector in enumerate(collectors)
+        ]
+
+        all_items: list[SourceItem] = []
+        delivered: list[Collector] = []
+        try:
+            for index, (collector, future) in enumerate(zip(collectors, futures)):
+                timeout = collector.config.get("timeout", default_timeout)
+                try:
+                    items = self._wait_for_result(
+                        future,
+                        index,
+                        started_at,
+                        timeout,
+                        deadline,
+                    )
+                except Exception as e:
+                    if not isinstance(e, TimeoutError) or future.done():
+                        self.logger.exception(f"Collector {collector.name} failed")
+                        continue
+                    items = self._cancel_collector(collector, future, timeout)
+                    if items is None:
+                        continue
 
-            try:
-                self.logger.info(f"Running collector: {collector.name}")
-                items = collector.collect()
                 all_items.extend(items)
+                delivered.append(collector)
                 self.logger.info(
                     f"Collector {collector.name} collected {len(items)} items",
                 )
-            except imaplib.IMAP4.error as e:
-                self.logger.exception(f"Collector {collector.name} failed: {e}")
+        finally:
+            # Timed-out collectors are cancelled and stop at their next check
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return all_items, delivered
+
+    def _cancel_collector(
+        self,
+        collector: Collector,
+        future: Future,
+        timeout: float | None,
+    ) -> list[SourceItem] | None:
+        """Cancel a collector that timed out.
+
+        Args:
+            collector: Collector instance
+            future: Future of the collector run
+            timeout: Timeout that was exceeded
+
+        Returns:
+            None if the collector was cancelled, or its items if it had
+            already started committing them
+        """
+        if collector.cancel():
+            self.logger.error(f"Collector {collector.name} timed out after {timeout}s")
+            return None
+        # Past the point of no return: its flags are being committed, so the
+        # items must be used
+        self.logger.warning(
+            f"Collector {collector.name} timed out while committing, using its items",
+        )
+        try:
+            return future.result()
+        except Exception:
+            self.logger.exception(f"Collector {collector.name} failed")
+            return None
+
+    def _run_collector(
+        self,
+        collector: Collector,
+        index: int,
+        started_at: dict[int, float],
+    ) -> list[SourceItem]:
+        """Run a single collector on a worker thread.
 
-        return all_items
+        Args:
+            collector: Collector instance
+            index: Position of the collector in the domain configuration
+            started_at: Shared map of collector index to start time
+
+        Returns:
+            Items returned by the collector
+        """
+        started_at[index] = time.monotonic()
+        self.logger.info(f"Running collector: {collector.name}")
+        return collector.collect()
+
+    @staticmethod
+    def _wait_for_result(
+        future: Future,
+        index: int,
+        started_at: dict[int, float],
+        timeout: float | None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        """Wait for a pooled task, measuring the timeout from when it started.
+
+        Args:
+            future: Future of the task
+            index: Key of the task in started_at
+            started_at: Shared map of task index to start time
+            timeout: Timeout in seconds (None waits indefinitely)
+            deadline: Overall deadline that also ends the wait
+
+        Returns:
+            Result of the task
+
+        Raises:
+            TimeoutError: If the task ran longer than the timeout or the
+                deadline expired
+        """
+        if timeout is None and (deadline is None or deadline.timeout is None):
+            return future.result()
+
+        while True:
+            if future.done():
+                return future.result()
+            start = started_at.get(index)
+            remaining = None
+            if timeout is not None:
+                remaining = timeout
+                if start is not None:
+                    remaining = start + timeout - time.monotonic()
+            if deadline is not None:
+                remaining = deadline.bound(remaining)
+            if remaining is None:
+                return future.result()
+            if remaining <= 0:
+                raise TimeoutError
+            try:
+                return future.result(timeout=remaining)
+            except concurrent.futures.TimeoutError:
+                if future.done():
+                    raise
+                # Still queued behind other tasks, or really timed out
+
+    def _acknowledge_collectors(self, collectors: list[Collector]) -> None:
+        """Let collectors apply deferred side effects after a successful send.
+
+        Args:
+            collectors: Collector instances of the domain
+        """
+        for collector in collectors:
+            try:
+                collector.acknowledge()
+            except imaplib.IMAP4.error:
+                self.logger.exception(f"Collector {collector.name} ack failed")
 
     def _create_collector(self, config: dict) -> EmailCollector | None:
         """Create a collector instance based on configuration.
@@ -135,31 +637,58 @@ class NewsSummarizer:
         self.logger.warning(f"Unknown collector type: {collector_type}")
         return None
 
-    def _process_items(self, items: list[SourceItem], domain: dict) -> str | None:
+    def _process_items(
+        self,
+        items: list[SourceItem] | Iterator[SourceItem],
+        domain: dict,
+        deadline: Deadline | None = None,
+    ) -> str | None:
         """Process items using configured processor.
 
         Args:
-            items: List of SourceItem objects
+            items: List of SourceItem objects, or a stream of them
             domain: Domain configuration
+            deadline: Deadline of the domain run, bounding the processor
 
         Returns:
             Processed content or None
         """
-        processor_config = domain.get("processor", {})
-        if not processor_config:
-            self.logger.warning("No processor configured")
-            return None
-
-        processor = self._create_processor(processor_config)
+        processor = self._create_domain_processor(domain, deadline)
         if processor is None:
             return None
 
         try:
-            return processor.process(items)
-        except (APIError, APIConnectionError, RateLimitError) as e:
+            if isinstance(items, list):
+                return processor.process(items)
+            return processor.process_stream(items)
+        except self.PROCESSING_ERRORS as e:
             self.logger.exception(f"Processing failed: {e}")
             return None
 
+    def _create_domain_processor(
+        self,
+        domain: dict,
+        deadline: Deadline | None = None,
+    ) -> AIProcessor | None:
+        """Create the processor of a domain, bounded by the domain deadline.
+
+        Args:
+            domain: Domain configuration
+            deadline: Deadline of the domain run
+
+        Returns:
+            Processor instance or None
+        """
+        processor_config = domain.get("processor", {})
+        if not processor_config:
+            self.logger.warning("No processor configured")
+            return None
+
+        processor = self._create_processor(processor_config)
+        if processor is not None:
+            processor.deadline = deadline
+        return processor
+
     def _create_processor(self, config: dict) -> AIProcessor | None:
         """Create a processor instance based on configuration.
 
@@ -188,28 +717,53 @@ class NewsSummarizer:
         Returns:
             True if send was successful
         """
-        sender_config = domain.get("sender", {})
-        if not sender_config:
-            self.logger.warning("No sender configured")
-            return False
-
-        sender = self._create_sender(sender_config)
-        if sender is None:
+        created = self._create_domain_sender(domain)
+        if created is None:
             return False
-
-        subject_prefix = sender_config.get("subject_prefix", "日报")
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        subject = f"{subject_prefix} {date_str}"
+        sender, subject = created
 
         try:
             success = sender.send(content, subject)
             if success:
                 self.logger.info(f"Report sent successfully: {subject}")
             return success
-        except smtplib.SMTPException as e:
+        except self.SEND_ERRORS as e:
             self.logger.exception(f"Failed to send report: {e}")
             return False
 
+    def _create_domain_sender(self, domain: dict) -> tuple[EmailSender, str] | None:
+        """Create the sender of a domain and the subject of its report.
+
+        Args:
+            domain: Domain configuration
+
+        Returns:
+            Tuple of (sender, subject), or None if no sender is configured
+        """
+        sender_config = domain.get("sender", {})
+        if not sender_config:
+            self.logger.warning("No sender configured")
+            return None
+
+        sender = self._create_sender(sender_config)
+        if sender is None:
+            return None
+        return sender, self._build_subject(sender_config)
+
+    @staticmethod
+    def _build_subject(sender_config: dict) -> str:
+        """Build the report subject line.
+
+        Args:
+            sender_config: Sender configuration
+
+        Returns:
+            Subject with prefix and today's date
+        """
+        subject_prefix = sender_config.get("subject_prefix", "日报")
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        return f"{subject_prefix} {date_str}"
+
     def _create_sender(self, config: dict) -> EmailSender | None:
         """Create a sender instance based on configuration.
 
@@ -0,0 +1,220 @@
+"""Per-sender boilerplate model learned from past newsletter issues."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.src.utils.logger import get_logger
+
+_MODEL_LOCK = threading.Lock()
+
+# Digits are masked so dated headers ("Oct 18, 2026") match across issues
+_DIGIT_PATTERN = re.compile(r"\d+")
+_SPACE_PATTERN = re.compile(r"\s+")
+_BLOCK_SEPARATOR = re.compile(r"\n\s*\n")
+
+
+def fingerprint(text: str) -> str:
+    """Fingerprint a line or block independent of case, spacing and digits.
+
+    Args:
+        text: Line or block of text
+
+    Returns:
+        Short hex digest
+    """
+    normalized = _SPACE_PATTERN.sub(" ", _DIGIT_PATTERN.sub("0", text.lower())).strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class BoilerplateModel:
+    """Line and block fingerprints counted across issues of each source.
+
+    A fingerprint seen in at least ``min_issues`` earlier issues of the same
+    source (headers, footers, sponsor blocks, navigation) is boilerplate and
+    removed from new issues. Counts are updated incrementally after each
+    issue and fingerprints not seen for ``max_age_days`` are forgotten.
+    """
+
+    # Issue hashes remembered per source so re-collected issues are not
+    # counted twice
+    RECENT_ISSUES = 50
+
+    def __init__(
+        self,
+        model_file: str | Path,
+        min_issues: int = 3,
+        max_age_days: float = 30,
+        max_fingerprints: int = 5000,
+    ):
+        """Initialize the model.
+
+        Args:
+            model_file: Path to the JSON model file
+            min_issues: Issues a fingerprint must appear in to be boilerplate
+            max_age_days: Days after which unseen fingerprints are dropped
+            max_fingerprints: Maximum fingerprints kept per source
+        """
+        self.model_file = Path(model_file)
+        self.min_issues = max(1, min_issues)
+        self.max_age_seconds = max_age_days * 86400
+        self.max_fingerprints = max_fingerprints
+        self.logger = get_logger("boilerplate")
+        self._sources: dict[str, dict[str, Any]] | None = None
+        self._dirty: set[str] = set()
+
+    def strip(self, source: str, text: str) -> str:
+        """Remove learned boilerplate blocks and lines from an issue.
+
+        Args:
+            source: Source name (e.g. sender address)
+            text: Issue content
+
+        Returns:
+            Content without boilerplate, or the original content if nothing
+            would be left
+        """
+        counts = self._source(source)["fingerprints"]
+        if not counts:
+            return text
+
+        def is_boilerplate(unit: str) -> bool:
+            entry = counts.get(fingerprint(unit))
+            return entry is not None and entry[0] >= self.min_issues
+
+        blocks = []
+        for block in _BLOCK_SEPARATOR.split(text):
+            if not block.strip() or is_boilerplate(block):
+                continue
+            lines = [
+                line
+                for line in block.split("\n")
+                if not line.strip() or not is_boilerplate(line)
+            ]
+            if any(line.strip() for line in lines):
+                blocks.append("\n".join(lines))
+
+        stripped = "\n\n".join(blocks).strip()
+        return stripped or text
+
+    def learn(self, source: str, text: str) -> None:
+        """Count the lines and blocks of an issue.
+
+        Args:
+            source: Source name (e.g. sender address)
+            text: Issue content (before stripping)
+        """
+        issue = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+        state = self._source(source)
+        if issue in state["recent"]:
+            return
+
+        units = set()
+        for block in _BLOCK_SEPARATOR.split(text):
+            if not block.strip():
+                continue
+            units.add(fingerprint(block))
+            units.update(
+                fingerprint(line) for line in block.split("\n") if line.strip()
+            )
+
+        now = int(time.time())
+        counts = state["fingerprints"]
+        for unit in units:
+            entry = counts.setdefault(unit, [0, now])
+            entry[0] += 1
+            entry[1] = now
+
+        state["recent"] = [*state["recent"], issue][-self.RECENT_ISSUES :]
+        self._prune(counts, now)
+        self._dirty.add(source)
+
+    def save(self) -> None:
+        """Merge learned sources into the model file."""
+        if not self._dirty or self._sources is None:
+            return
+        with _MODEL_LOCK:
+            model = self._read()
+            for source in self._dirty:
+                model[source] = self._sources[source]
+            self._write(model)
+        self._dirty.clear()
+
+    def _source(self, source: str) -> dict[str, Any]:
+        """Get the model state of a source, loading the file on first use.
+
+        Args:
+            source: Source name
+
+        Returns:
+            Dictionary with "fingerprints" ({fingerprint: [issues, last seen]})
+            and "recent" (recent issue hashes)
+        """
+        if self._sources is None:
+            with _MODEL_LOCK:
+                self._sources = self._read()
+        state = self._sources.setdefault(source, {})
+        state.setdefault("fingerprints", {})
+        state.setdefault("recent", [])
+        return state
+
+    def _prune(self, counts: dict[str, list[int]], now: int) -> None:
+        """Drop stale fingerprints and cap the number kept.
+
+        Args:
+            counts: Fingerprint counts of a source
+            now: Current Unix time
+        """
+        cutoff = now - self.max_age_seconds
+        for unit in [u for u, (_, last_seen) in counts.items() if last_seen < cutoff]:
+            del counts[unit]
+
+        excess = len(counts) - self.max_fingerprints
+        if excess > 0:
+            # Rare and old fingerprints go first
+            for unit in sorted(counts, key=lambda u: tuple(counts[u]))[:excess]:
+                del counts[unit]
+
+    def _read(self) -> dict[str, Any]:
+        """Read the model file.
+
+        Returns:
+            Model dictionary (empty if the file is missing or invalid)
+        """
+        if not self.model_file.exists():
+            return {}
+        try:
+            with open(self.model_file, encoding="utf-8") as f:
+                model = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"Failed to read boilerplate model {self.model_file}: {e}",
+            )
+            return {}
+        return model if isinstance(model, dict) else {}
+
+    def _write(self, model: dict[str, Any]) -> None:
+        """Atomically write the model file.
+
+        Args:
+            model: Model dictionary to persist
+        """
+        self.model_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.model_file.parent,
+            prefix=".boilerplate",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(model, f, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp_path, self.model_file)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
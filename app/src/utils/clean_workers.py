@@ -0,0 +1,137 @@
+"""Process pool workers for CPU-bound HTML cleaning."""
+
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from app.src.utils.html_cleaner import HTMLCleaner
+from app.src.utils.logger import get_logger
+
+# A content candidate is (kind, decoded text), kind being "html" or "text"
+Candidate = tuple[str, str]
+
+_logger = get_logger("clean_workers")
+
+_worker_settings: tuple[list[str] | None, str] = (None, "html2text")
+
+# Shared pools of the parent process, keyed by worker settings
+_pools: dict[tuple[int, tuple[str, ...], str], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def clean_candidates(cleaner: HTMLCleaner, candidates: list[Candidate]) -> str:
+    """Clean content candidates in order and return the first non-empty text.
+
+    Args:
+        cleaner: HTML cleaner to use
+        candidates: (kind, text) pairs in order of preference
+
+    Returns:
+        Cleaned text, or an empty string if no candidate has content
+    """
+    for kind, text in candidates:
+        try:
+            if kind == "html":
+                content = cleaner.clean(text)
+            else:
+                content = cleaner.clean_simple(text)
+        except Exception:
+            # A parser failure on one part should not lose the message
+            _logger.warning(
+                f"Failed to clean {kind} part, trying the next one",
+                exc_info=True,
+            )
+            continue
+        if content.strip():
+            return content
+    return ""
+
+
+def get_clean_pool(
+    workers: int,
+    extra_patterns: list[str] | None = None,
+    extractor: str = "html2text",
+) -> ProcessPoolExecutor:
+    """Get the shared process pool of warm cleaning workers.
+
+    Pools are created on first use and kept for the life of the process, one
+    per combination of settings, so collections do not pay for spawning and
+    warming up workers again. Workers are spawned rather than forked because
+    collectors run on threads of the parent process.
+
+    Args:
+        workers: Number of worker processes
+        extra_patterns: Additional line filter patterns
+        extractor: HTML-to-text backend
+
+    Returns:
+        ProcessPoolExecutor running clean_candidate_batch
+    """
+    key = (workers, tuple(extra_patterns or ()), extractor)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(extra_patterns, extractor),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def discard_clean_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut down a broken pool so the next collection gets a new one.
+
+    Args:
+        pool: Pool returned by get_clean_pool()
+    """
+    with _pools_lock:
+        for key, shared in list(_pools.items()):
+            if shared is pool:
+                del _pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_clean_pools() -> None:
+    """Shut down all shared pools; registered to run at interpreter exit."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def clean_candidate_batch(batch: list[list[Candidate]]) -> list[str]:
+    """Clean a chunk of messages inside a worker process.
+
+    Args:
+        batch: Content candidates of each message
+
+    Returns:
+        Cleaned text of each message, in input order
+    """
+    extra_patterns, extractor = _worker_settings
+    # html2text keeps per-document state, so every message gets a fresh
+    # cleaner; the line filter and parser modules are already warm
+    return [
+        clean_candidates(HTMLCleaner(extra_patterns, extractor), candidates)
+        for candidates in batch
+    ]
+
+
+def _init_worker(extra_patterns: list[str] | None, extractor: str) -> None:
+    """Store cleaner settings and warm up a worker process.
+
+    Args:
+        extra_patterns: Additional line filter patterns
+        extractor: HTML-to-text backend
+    """
+    global _worker_settings
+    _worker_settings = (extra_patterns, extractor)
+    HTMLCleaner(extra_patterns, extractor).clean("<p>warm up</p>")
+
+
+atexit.register(shutdown_clean_pools)
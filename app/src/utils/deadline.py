@@ -0,0 +1,66 @@
+"""Cancellable time budget shared by the steps of a run."""
+
+import threading
+import time
+
+
+class Deadline:
+    """Time budget of a unit of work that its owner can also cancel.
+
+    The clock starts with start(), so work queued behind other tasks is not
+    charged for the wait. Workers check ``expired`` before side effects and
+    use bound() to cap the timeouts of the steps they run.
+    """
+
+    def __init__(self, timeout: float | None = None):
+        """Initialize the deadline.
+
+        Args:
+            timeout: Budget in seconds (None is unbounded)
+        """
+        self.timeout = timeout
+        self._expires_at: float | None = None
+        self._cancelled = threading.Event()
+
+    def start(self) -> None:
+        """Start the clock."""
+        if self.timeout is not None:
+            self._expires_at = time.monotonic() + self.timeout
+
+    def cancel(self) -> None:
+        """Expire the deadline immediately."""
+        self._cancelled.set()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up or the deadline was cancelled."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def remaining(self) -> float | None:
+        """Seconds left in the budget.
+
+        Returns:
+            Remaining seconds (0 once expired), or None if unbounded
+        """
+        if self._cancelled.is_set():
+            return 0.0
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def bound(self, timeout: float | None) -> float | None:
+        """Cap a step's timeout by the remaining budget.
+
+        Args:
+            timeout: Timeout of the step in seconds (None is unbounded)
+
+        Returns:
+            The smaller of timeout and the remaining budget
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
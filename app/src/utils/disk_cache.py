@@ -0,0 +1,221 @@
+"""Persistent key-value cache with TTL and size-based LRU eviction."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.src.utils.logger import get_logger
+
+
+class DiskCache:
+    """Small SQLite-backed string cache shared across runs and processes.
+
+    Keys are hashed, so any string (e.g. a Message-ID plus settings) can be
+    used. Entries expire after ``ttl_seconds``; when the stored values exceed
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    # Writes between two eviction passes
+    EVICT_INTERVAL = 64
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: Lifetime of an entry (None keeps entries until evicted)
+            max_bytes: Maximum total size of stored values (None is unbounded)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.logger = get_logger("disk_cache")
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._writes = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict[str, Any] | None,
+        default_path: str,
+        default_ttl_hours: float,
+        default_max_mb: float,
+        enabled_by_default: bool = True,
+    ) -> "DiskCache | None":
+        """Create a cache from a configuration section.
+
+        Args:
+            config: Cache section (enabled, path, ttl_hours, max_mb); a
+                missing or empty section disables the cache
+            default_path: Database path if the section has none
+            default_ttl_hours: Entry lifetime if the section has none
+                (0 keeps entries until evicted)
+            default_max_mb: Size limit if the section has none (0 is
+                unbounded)
+            enabled_by_default: Whether a section without ``enabled``
+                turns the cache on
+
+        Returns:
+            DiskCache instance, or None if caching is disabled
+        """
+        if not config or not config.get("enabled", enabled_by_default):
+            return None
+        ttl_hours = config.get("ttl_hours", default_ttl_hours)
+        max_mb = config.get("max_mb", default_max_mb)
+        return cls(
+            config.get("path", default_path),
+            ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+        )
+
+    def get(self, key: str) -> str | None:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        digest = self._digest(key)
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT value, created_at FROM cache WHERE key = ?",
+                    (digest,),
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created_at = row
+                if self.ttl_seconds is not None and created_at < now - self.ttl_seconds:
+                    connection.execute("DELETE FROM cache WHERE key = ?", (digest,))
+                    connection.commit()
+                    return None
+                connection.execute(
+                    "UPDATE cache SET accessed_at = ? WHERE key = ?",
+                    (now, digest),
+                )
+                connection.commit()
+                return value
+        except sqlite3.Error as e:
+            self.logger.warning(f"Cache read failed ({self.path}): {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO cache "
+                    "(key, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self._digest(key), value, len(value.encode("utf-8")), now, now),
+                )
+                connection.commit()
+                self._writes += 1
+                if self._writes % self.EVICT_INTERVAL == 0:
+                    self._evict(connection)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Cache write failed ({self.path}): {e}")
+
+    def close(self) -> None:
+        """Evict outdated entries and close the database."""
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._evict(self._connection)
+            except sqlite3.Error as e:
+                self.logger.warning(f"Cache eviction failed ({self.path}): {e}")
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use.
+
+        Must be called with the cache lock held.
+
+        Returns:
+            SQLite connection
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path,
+                timeout=30,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)",
+            )
+            connection.commit()
+            self._connection = connection
+            self._evict(connection)
+        return self._connection
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete expired entries, then least recently used ones over max_bytes.
+
+        Must be called with the cache lock held.
+
+        Args:
+            connection: SQLite connection
+        """
+        if self.ttl_seconds is not None:
+            connection.execute(
+                "DELETE FROM cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+        if self.max_bytes is not None:
+            (total,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache",
+            ).fetchone()
+            excess = total - self.max_bytes
+            if excess > 0:
+                evicted = 0
+                keys = []
+                for key, size in connection.execute(
+                    "SELECT key, size FROM cache ORDER BY accessed_at",
+                ):
+                    if evicted >= excess:
+                        break
+                    keys.append((key,))
+                    evicted += size
+                connection.executemany("DELETE FROM cache WHERE key = ?", keys)
+        connection.commit()
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        """Hash a cache key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Hex digest used as the stored key
+        """
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
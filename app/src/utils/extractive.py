@@ -0,0 +1,159 @@
+"""Extractive compression of item content by sentence scoring."""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Callable
+
+from app.src.utils.links import URL_PATTERN, LinkTable
+from app.src.utils.simhash import tokenize
+
+# Sentence ends: Latin punctuation followed by whitespace, or CJK punctuation
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=\S)|(?<=[。！？；])")
+_LINK_REF_PATTERN = re.compile(rf"\b{LinkTable.PREFIX}\d+\b")
+_BOLD_LINE = re.compile(r"^\*\*[^*]+\*\*:?$")
+# Short lines without closing punctuation are treated as headlines
+HEADLINE_MAX_CHARS = 80
+_SENTENCE_END = tuple(".!?。！？；:：")
+
+
+def is_headline(line: str) -> bool:
+    """Check whether a line looks like a heading or headline.
+
+    Args:
+        line: Stripped line of text
+
+    Returns:
+        True for Markdown headings, bold lines and short unpunctuated lines
+    """
+    if line.startswith("#") or _BOLD_LINE.match(line):
+        return True
+    return len(line) <= HEADLINE_MAX_CHARS and not line.endswith(_SENTENCE_END)
+
+
+def has_link(text: str) -> bool:
+    """Check whether text contains a URL or a link reference.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        True if a link would be lost by dropping the text
+    """
+    return bool(URL_PATTERN.search(text) or _LINK_REF_PATTERN.search(text))
+
+
+def split_sentences(line: str) -> list[str]:
+    """Split a line into sentences.
+
+    Args:
+        line: Line of text
+
+    Returns:
+        Non-empty sentences in order
+    """
+    return [s.strip() for s in _SENTENCE_SPLIT.split(line) if s.strip()]
+
+
+def compress(text: str, budget: int, measure: Callable[[str], int] = len) -> str:
+    """Shrink text to a budget by keeping its most central sentences.
+
+    Headlines and sentences containing links are always kept. The other
+    sentences are ranked by the cosine similarity of their TF-IDF vector to
+    the vector of the whole text, slightly favoring earlier sentences, and
+    added greedily while they fit. Kept text stays in its original order
+    and line structure.
+
+    Args:
+        text: Text to compress
+        budget: Maximum size of the result, in units of ``measure``
+        measure: Size function (characters by default, or a token estimate)
+
+    Returns:
+        Compressed text; may exceed the budget if headlines and links alone
+        do
+    """
+    if measure(text) <= budget:
+        return text
+
+    # (line index, sentence, protected)
+    units: list[tuple[int, str, bool]] = []
+    lines = text.split("\n")
+    for line_index, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        if is_headline(line):
+            units.append((line_index, line, True))
+            continue
+        for sentence in split_sentences(line):
+            units.append((line_index, sentence, has_link(sentence)))
+
+    keep = {i for i, (_, _, protected) in enumerate(units) if protected}
+    remaining = budget - sum(measure(units[i][1]) + 1 for i in keep)
+    candidates = [i for i in range(len(units)) if i not in keep]
+    scores = _score_sentences([units[i][1] for i in candidates])
+    ranked = sorted(
+        zip(candidates, scores, strict=True),
+        key=lambda pair: pair[1],
+        reverse=True,
+    )
+    for i, _ in ranked:
+        size = measure(units[i][1]) + 1
+        if size <= remaining:
+            keep.add(i)
+            remaining -= size
+
+    kept_lines: dict[int, list[str]] = {}
+    for i in sorted(keep):
+        line_index, sentence, _ = units[i]
+        kept_lines.setdefault(line_index, []).append(sentence)
+
+    result: list[str] = []
+    for line_index in range(len(lines)):
+        if line_index in kept_lines:
+            result.append(" ".join(kept_lines[line_index]))
+        elif not lines[line_index].strip() and result and result[-1]:
+            result.append("")
+    return "\n".join(result).strip()
+
+
+def _score_sentences(sentences: list[str]) -> list[float]:
+    """Score sentences by centrality within their text.
+
+    Args:
+        sentences: Sentences in order
+
+    Returns:
+        Score per sentence (higher is more representative)
+    """
+    token_lists = [tokenize(sentence) for sentence in sentences]
+    df: Counter = Counter()
+    for tokens in token_lists:
+        df.update(set(tokens))
+    idf = {
+        token: math.log((1 + len(sentences)) / (1 + count)) + 1
+        for token, count in df.items()
+    }
+
+    vectors = []
+    centroid: Counter = Counter()
+    for tokens in token_lists:
+        vector = {
+            token: (1 + math.log(count)) * idf[token]
+            for token, count in Counter(tokens).items()
+        }
+        vectors.append(vector)
+        centroid.update(vector)
+    centroid_norm = math.sqrt(sum(value * value for value in centroid.values()))
+
+    scores = []
+    for position, vector in enumerate(vectors):
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        if not norm or not centroid_norm:
+            scores.append(0.0)
+            continue
+        similarity = sum(value * centroid[token] for token, value in vector.items())
+        # Newsletters lead with the essentials
+        scores.append(similarity / (norm * centroid_norm) / (1 + 0.05 * position))
+    return scores
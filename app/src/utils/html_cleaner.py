@@ -3,6 +3,28 @@
 import html2text
 import quopri
 import re
+from functools import lru_cache
+
+from app.src.utils.html_extractor import extract_text
+
+# Table cells html2text renders as "| |" and empty link brackets
+_ARTIFACT_PATTERN = re.compile(r"\|\s*\|\s*\||\|\s*\||\[\s*\]")
+# Horizontal rules, matched against a single line
+_HORIZONTAL_LINE_PATTERN = r"^\s*[-=]{3,}\s*$"
+
+
+@lru_cache(maxsize=32)
+def _compile_line_filter(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile line filter patterns into a single alternation.
+
+    Args:
+        patterns: Regular expressions that mark a line for removal
+
+    Returns:
+        Case-insensitive pattern matching any of them within one line
+    """
+    alternatives = [_HORIZONTAL_LINE_PATTERN, *(f"(?:{p})" for p in patterns)]
+    return re.compile("|".join(alternatives), re.IGNORECASE)
 
 
 class HTMLCleaner:
@@ -29,14 +51,45 @@ class HTMLCleaner:
         r"©",
     ]
 
-    def __init__(self):
-        """Initialize HTML cleaner with default settings."""
-        self._converter = html2text.HTML2Text()
-        self._converter.ignore_links = False
-        self._converter.ignore_images = True
-        self._converter.ignore_emphasis = False
-        self._converter.body_width = 0
-        self._converter.unicode_snob = True
+    # Available HTML-to-text backends
+    EXTRACTORS = ("html2text", "fast")
+
+    def __init__(
+        self,
+        extra_patterns: list[str] | None = None,
+        extractor: str = "html2text",
+    ):
+        """Initialize HTML cleaner with default settings.
+
+        Args:
+            extra_patterns: Additional line filter patterns (e.g. per collector)
+            extractor: HTML-to-text backend, "html2text" (highest fidelity) or
+                "fast" (stdlib streaming parser, much faster on table layouts)
+        """
+        if extractor not in self.EXTRACTORS:
+            raise ValueError(f"Unknown HTML extractor: {extractor}")
+        self.extractor = extractor
+        self._line_filter = _compile_line_filter(
+            (*self.NEWSLETTER_FILTER_PATTERNS, *(extra_patterns or [])),
+        )
+        self._converter = None
+        if extractor == "html2text":
+            self._converter = self._create_converter()
+
+    @staticmethod
+    def _create_converter() -> html2text.HTML2Text:
+        """Create the html2text converter.
+
+        Returns:
+            Configured HTML2Text instance
+        """
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = True
+        converter.ignore_emphasis = False
+        converter.body_width = 0
+        converter.unicode_snob = True
+        return converter
 
     def clean(self, html_content: str) -> str:
         """Convert HTML to clean plain text.
@@ -50,7 +103,10 @@ class HTMLCleaner:
         if not html_content:
             return ""
 
-        text = self._converter.handle(html_content)
+        if self._converter is None:
+            text = extract_text(html_content)
+        else:
+            text = self._converter.handle(html_content)
         text = self._remove_newsletter_artifacts(text)
         text = self._normalize_whitespace(text)
         return text.strip()
@@ -85,23 +141,15 @@ class HTMLCleaner:
             Text with artifacts removed
         """
         # Remove table artifacts (html2text converts empty cells to | |)
-        text = re.sub(r"\|\s*\|\s*\|", "", text)
-        text = re.sub(r"\|\s*\|", "", text)
-
-        # Remove empty brackets
-        text = re.sub(r"\[\s*\]", "", text)
-
-        # Remove horizontal lines
-        text = re.sub(r"^\s*[-=]{3,}\s*$", "", text, flags=re.MULTILINE)
-
-        # Remove navigation/footer patterns (case-insensitive, whole line)
-        for pattern in self.NEWSLETTER_FILTER_PATTERNS:
-            # Match whole lines containing the pattern
-            text = re.sub(
-                rf"^.*{pattern}.*$", "", text, flags=re.IGNORECASE | re.MULTILINE,
-            )
-
-        return text
+        # and empty brackets in one pass
+        text = _ARTIFACT_PATTERN.sub("", text)
+
+        # Blank out horizontal lines and navigation/footer lines in one pass
+        # over the lines, using a single pre-compiled alternation
+        line_filter = self._line_filter
+        return "\n".join(
+            "" if line_filter.search(line) else line for line in text.split("\n")
+        )
 
     def _decode_quoted_printable(self, text: str) -> str:
         """Decode quoted-printable encoding if detected.
@@ -0,0 +1,187 @@
+"""Fast streaming HTML-to-text extractor built on the standard library."""
+
+import re
+from html.parser import HTMLParser
+
+# Elements whose content is never shown
+SKIPPED_TAGS = {"head", "noscript", "script", "style", "svg", "template", "title"}
+# Elements without an end tag
+VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+# Elements that start a new line
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "center",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "li",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tbody",
+    "tfoot",
+    "thead",
+    "tr",
+    "ul",
+}
+# Inline styles that hide an element (preheaders, tracking blocks, ...)
+HIDDEN_STYLE_PATTERN = re.compile(
+    r"display\s*:\s*none|visibility\s*:\s*hidden|mso-hide\s*:\s*all",
+    re.IGNORECASE,
+)
+_SPACE_PATTERN = re.compile(r"[ \t\r\f\v\n ]+")
+
+
+class FastHTMLExtractor(HTMLParser):
+    """Single-pass HTML to Markdown-like text converter.
+
+    Skips style/script/head content and hidden elements, flattens layout
+    tables into lines, renders headings and list items, and keeps links as
+    ``[text](url)``. Images are dropped.
+    """
+
+    def __init__(self):
+        """Initialize the extractor."""
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        # Open elements as (tag, suppresses content)
+        self._stack: list[tuple[str, bool]] = []
+        self._suppressed = 0
+        self._links: list[tuple[str, int]] = []
+        self._pre = 0
+
+    def extract(self, html_content: str) -> str:
+        """Convert HTML to text.
+
+        Args:
+            html_content: HTML document or fragment
+
+        Returns:
+            Extracted text with one block per line
+        """
+        self.feed(html_content)
+        self.close()
+        text = "".join(self._parts)
+        lines = [line.strip() for line in text.split("\n")]
+        return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Handle an opening tag."""
+        if tag in VOID_TAGS:
+            if not self._suppressed and tag in ("br", "hr"):
+                self._parts.append("\n")
+            return
+
+        attributes = dict(attrs)
+        suppress = (
+            tag in SKIPPED_TAGS
+            or "hidden" in attributes
+            or bool(HIDDEN_STYLE_PATTERN.search(attributes.get("style") or ""))
+        )
+        self._stack.append((tag, suppress))
+        if suppress:
+            self._suppressed += 1
+        if self._suppressed:
+            return
+
+        if tag in BLOCK_TAGS:
+            self._parts.append("\n")
+        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._parts.append("#" * int(tag[1]) + " ")
+        elif tag == "li":
+            self._parts.append("* ")
+        elif tag in ("td", "th"):
+            self._parts.append(" ")
+        elif tag == "pre":
+            self._pre += 1
+        elif tag == "a":
+            href = (attributes.get("href") or "").strip()
+            self._links.append((href, len(self._parts)))
+
+    def handle_endtag(self, tag: str) -> None:
+        """Handle a closing tag, tolerating unclosed children."""
+        if tag in VOID_TAGS or not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+
+        while self._stack:
+            open_tag, suppress = self._stack.pop()
+            if not self._suppressed:
+                self._close_element(open_tag)
+            if suppress:
+                self._suppressed -= 1
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        """Handle text content."""
+        if self._suppressed:
+            return
+        if self._pre:
+            self._parts.append(data)
+        else:
+            self._parts.append(_SPACE_PATTERN.sub(" ", data))
+
+    def _close_element(self, tag: str) -> None:
+        """Emit output for a closed visible element.
+
+        Args:
+            tag: Tag name of the element
+        """
+        if tag == "a" and self._links:
+            href, start = self._links.pop()
+            text = "".join(self._parts[start:]).strip()
+            del self._parts[start:]
+            if text and href.startswith(("http://", "https://")):
+                self._parts.append(f"[{text}]({href})")
+            elif text:
+                self._parts.append(text)
+        elif tag == "pre":
+            self._pre = max(0, self._pre - 1)
+        if tag in BLOCK_TAGS:
+            self._parts.append("\n")
+
+
+def extract_text(html_content: str) -> str:
+    """Convenience function to extract text with FastHTMLExtractor.
+
+    Args:
+        html_content: HTML content
+
+    Returns:
+        Extracted text
+    """
+    return FastHTMLExtractor().extract(html_content)
@@ -0,0 +1,247 @@
+"""Process-wide pool of authenticated IMAP connections."""
+
+import imaplib
+import threading
+import time
+from collections.abc import Callable
+
+from app.src.utils.logger import get_logger
+
+PoolKey = tuple[str, int, str]
+
+# Seconds between checks of the cancel callback while waiting for a slot
+_CANCEL_POLL_INTERVAL = 0.5
+
+
+class IMAPConnectionPool:
+    """Thread-safe pool of logged-in IMAP connections.
+
+    Connections are keyed by (server, port, account) so collectors reading
+    different mailboxes of the same account share them. Idle connections are
+    health-checked with NOOP before reuse and evicted after max_idle_seconds.
+    By default the number of open connections is not capped, so parallel
+    collectors never queue for one; max_size caps it for servers that limit
+    concurrent logins.
+    """
+
+    # Keys accepted in the configuration section
+    OPTIONS = ("max_size", "max_idle_seconds")
+
+    def __init__(self, max_size: int | None = None, max_idle_seconds: float = 300):
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum open connections per key, idle and in use
+                (None or 0 is unbounded)
+            max_idle_seconds: Idle time before a connection is closed
+                (0 closes connections as soon as they are released)
+        """
+        self.max_size = max_size or None
+        self.max_idle_seconds = max_idle_seconds
+        self.logger = get_logger("imap_pool")
+        self._condition = threading.Condition()
+        self._idle: dict[PoolKey, list[tuple[imaplib.IMAP4, float]]] = {}
+        self._open_count: dict[PoolKey, int] = {}
+
+    def configure(
+        self,
+        max_size: int | None = None,
+        max_idle_seconds: float | None = None,
+    ) -> None:
+        """Update pool limits.
+
+        Args:
+            max_size: Maximum open connections per key (0 is unbounded)
+            max_idle_seconds: Idle time before a connection is closed
+        """
+        with self._condition:
+            if max_size is not None:
+                self.max_size = max(0, int(max_size)) or None
+            if max_idle_seconds is not None:
+                self.max_idle_seconds = max_idle_seconds
+            self._condition.notify_all()
+
+    def acquire(
+        self,
+        key: PoolKey,
+        factory: Callable[[], imaplib.IMAP4],
+        timeout: float | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> imaplib.IMAP4:
+        """Get an authenticated connection, reusing an idle one if possible.
+
+        With max_size set, blocks while that many connections for the key
+        are in use, until one is released, the timeout expires or the
+        caller is cancelled.
+
+        Args:
+            key: Pool key (server, port, account)
+            factory: Creates and logs in a new connection
+            timeout: Seconds to wait for a free slot (None waits indefinitely)
+            cancelled: Polled while waiting; returning True gives up
+
+        Returns:
+            IMAP connection in authenticated state
+
+        Raises:
+            TimeoutError: No slot became free in time, or the caller was
+                cancelled while waiting
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                self._evict_idle()
+                idle = self._idle.get(key)
+                open_count = self._open_count.get(key, 0)
+                if idle:
+                    connection, _ = idle.pop()
+                elif self.max_size is None or open_count < self.max_size:
+                    self._open_count[key] = open_count + 1
+                    connection = None
+                else:
+                    self._wait_for_slot(key, deadline, cancelled)
+                    continue
+
+            if connection is None:
+                try:
+                    return factory()
+                except BaseException:
+                    self._forget(key)
+                    raise
+
+            if self._is_healthy(connection):
+                return connection
+            self.logger.debug(f"Dropping stale IMAP connection for {key[2]}")
+            self.discard(key, connection)
+
+    def release(self, key: PoolKey, connection: imaplib.IMAP4) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            key: Pool key the connection was acquired with
+            connection: Connection in authenticated (not selected) state
+        """
+        if self.max_idle_seconds <= 0:
+            self.discard(key, connection)
+            return
+        with self._condition:
+            self._idle.setdefault(key, []).append((connection, time.monotonic()))
+            self._condition.notify_all()
+
+    def discard(self, key: PoolKey, connection: imaplib.IMAP4) -> None:
+        """Close a connection and free its slot.
+
+        Args:
+            key: Pool key the connection was acquired with
+            connection: Connection to close
+        """
+        self._logout(connection)
+        self._forget(key)
+
+    def close_all(self) -> None:
+        """Log out all idle connections."""
+        with self._condition:
+            idle = self._idle
+            self._idle = {}
+            for key, connections in idle.items():
+                self._open_count[key] = self._open_count.get(key, 0) - len(connections)
+            self._condition.notify_all()
+
+        for connections in idle.values():
+            for connection, _ in connections:
+                self._logout(connection)
+
+    def _wait_for_slot(
+        self,
+        key: PoolKey,
+        deadline: float | None,
+        cancelled: Callable[[], bool] | None,
+    ) -> None:
+        """Wait until a connection of the key may have been released.
+
+        Must be called with the pool lock held.
+
+        Args:
+            key: Pool key
+            deadline: time.monotonic() value to give up at (None is never)
+            cancelled: Returns True once the caller gave up
+
+        Raises:
+            TimeoutError: The deadline passed or the caller was cancelled
+        """
+        if cancelled is not None and cancelled():
+            raise TimeoutError(f"Cancelled waiting for an IMAP connection ({key[2]})")
+        wait = _CANCEL_POLL_INTERVAL if cancelled is not None else None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Timed out waiting for an IMAP connection ({key[2]})"
+                )
+            wait = remaining if wait is None else min(wait, remaining)
+        self._condition.wait(wait)
+
+    def _forget(self, key: PoolKey) -> None:
+        """Free a connection slot for a key.
+
+        Args:
+            key: Pool key
+        """
+        with self._condition:
+            self._open_count[key] = max(0, self._open_count.get(key, 0) - 1)
+            self._condition.notify_all()
+
+    def _evict_idle(self) -> None:
+        """Close connections idle for longer than max_idle_seconds.
+
+        Must be called with the pool lock held.
+        """
+        cutoff = time.monotonic() - self.max_idle_seconds
+        for key, connections in self._idle.items():
+            expired = [c for c, idle_since in connections if idle_since < cutoff]
+            if not expired:
+                continue
+            connections[:] = [(c, t) for c, t in connections if t >= cutoff]
+            self._open_count[key] = self._open_count.get(key, 0) - len(expired)
+            for connection in expired:
+                # logout is a quick round-trip; stale sockets fail fast
+                self._logout(connection)
+
+    @staticmethod
+    def _is_healthy(connection: imaplib.IMAP4) -> bool:
+        """Check a connection with NOOP.
+
+        Args:
+            connection: Connection to check
+
+        Returns:
+            True if the server answered OK
+        """
+        try:
+            status, _ = connection.noop()
+        except (imaplib.IMAP4.error, OSError):
+            return False
+        return status == "OK"
+
+    def _logout(self, connection: imaplib.IMAP4) -> None:
+        """Log out a connection, ignoring errors.
+
+        Args:
+            connection: Connection to log out
+        """
+        try:
+            connection.logout()
+        except (imaplib.IMAP4.error, OSError) as e:
+            self.logger.debug(f"Error logging out IMAP connection: {e}")
+
+
+_POOL = IMAPConnectionPool()
+
+
+def get_imap_pool() -> IMAPConnectionPool:
+    """Get the process-wide IMAP connection pool.
+
+    Returns:
+        Shared IMAPConnectionPool instance
+    """
+    return _POOL
@@ -0,0 +1,320 @@
+"""IMAP protocol helpers shared by mail collectors."""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+_FETCH_START_PATTERN = re.compile(rb"^(\d+) \(")
+_SECTION_LITERAL_PATTERN = re.compile(
+    rb"((?:BODY|BINARY)\[[^\]]*\](?:<\d+>)?|RFC822(?:\.HEADER|\.TEXT)?) \{\d+\}$",
+    re.IGNORECASE,
+)
+_LITERAL_PATTERN = re.compile(rb"\{\d+\}$")
+_UID_PATTERN = re.compile(rb"\bUID (\d+)", re.IGNORECASE)
+_SIZE_PATTERN = re.compile(rb"\bRFC822\.SIZE (\d+)", re.IGNORECASE)
+_BODYSTRUCTURE_PATTERN = re.compile(rb"\bBODYSTRUCTURE \(", re.IGNORECASE)
+_LIST_TOKEN_PATTERN = re.compile(rb'\(|\)|"((?:[^"\\]|\\.)*)"|([^\s()"]+)')
+
+
+@dataclass
+class FetchRecord:
+    """Parsed FETCH response for a single message.
+
+    Attributes:
+        seq: Message sequence number reported by the server
+        attributes: Non-literal response text (UID, FLAGS, RFC822.SIZE, ...)
+        sections: Literal payloads keyed by the section name echoed by the server
+    """
+
+    seq: int
+    attributes: bytes = b""
+    sections: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def uid(self) -> int | None:
+        """Get the message UID if it was part of the response."""
+        match = _UID_PATTERN.search(self.attributes)
+        return int(match.group(1)) if match else None
+
+    @property
+    def size(self) -> int | None:
+        """Get the RFC822.SIZE of the message if it was part of the response."""
+        match = _SIZE_PATTERN.search(self.attributes)
+        return int(match.group(1)) if match else None
+
+    def section(self, prefix: str) -> bytes | None:
+        """Get the first literal payload whose section name starts with prefix.
+
+        Args:
+            prefix: Section name prefix (e.g., "BODY[]", "BODY[HEADER")
+
+        Returns:
+            Payload bytes or None if the section is missing
+        """
+        prefix = prefix.upper()
+        for name, payload in self.sections.items():
+            if name.upper().startswith(prefix):
+                return payload
+        return None
+
+
+@dataclass
+class BodyPart:
+    """Single MIME part described by a BODYSTRUCTURE response.
+
+    Attributes:
+        section: IMAP section specifier (e.g., "1.2")
+        content_type: Lower-case MIME type (e.g., "text/html")
+        charset: Declared charset, if any
+        encoding: Declared Content-Transfer-Encoding
+        size: Encoded size of the part in bytes
+    """
+
+    section: str
+    content_type: str
+    charset: str | None = None
+    encoding: str = "7bit"
+    size: int = 0
+
+
+def parse_fetch_response(data: list) -> list[FetchRecord]:
+    """Split a multi-message FETCH response into per-message records.
+
+    imaplib returns FETCH data as a flat list where every literal is a
+    ``(prefix, payload)`` tuple and the remaining response text is plain
+    bytes (including the closing ``)`` of each message).
+
+    Args:
+        data: Data list returned by ``IMAP4.fetch`` or ``IMAP4.uid("FETCH", ...)``
+
+    Returns:
+        List of FetchRecord objects in response order
+    """
+    records: list[FetchRecord] = []
+    current: FetchRecord | None = None
+
+    for element in data or []:
+        if element is None:
+            continue
+        prefix = element[0] if isinstance(element, tuple) else element
+        if not isinstance(prefix, bytes):
+            continue
+
+        match = _FETCH_START_PATTERN.match(prefix)
+        if match:
+            current = FetchRecord(seq=int(match.group(1)))
+            records.append(current)
+        if current is None:
+            continue
+
+        if not isinstance(element, tuple):
+            current.attributes += prefix
+            continue
+
+        payload = element[1] or b""
+        section_match = _SECTION_LITERAL_PATTERN.search(prefix)
+        if section_match:
+            name = section_match.group(1).decode("ascii", errors="ignore")
+            current.sections[name] = payload
+            current.attributes += prefix[: section_match.start()]
+        else:
+            # Literal inside a structure (e.g. a BODYSTRUCTURE parameter)
+            quoted = payload.replace(b"\\", b"\\\\").replace(b'"', b'\\"')
+            current.attributes += _LITERAL_PATTERN.sub(b"", prefix)
+            current.attributes += b'"' + quoted + b'"'
+
+    return records
+
+
+def parse_status_value(data: list, name: str) -> int | None:
+    """Extract a numeric item from a STATUS or untagged SELECT response.
+
+    Args:
+        data: Response data list (e.g. from ``IMAP4.status``)
+        name: Item name such as "UIDVALIDITY" or "UIDNEXT"
+
+    Returns:
+        Integer value or None if the item is missing
+    """
+    pattern = re.compile(
+        rb"\b" + re.escape(name.encode("ascii")) + rb" (\d+)",
+        re.IGNORECASE,
+    )
+    for element in data or []:
+        if isinstance(element, bytes):
+            match = pattern.search(element)
+            if match:
+                return int(match.group(1))
+    return None
+
+
+def parse_bodystructure(attributes: bytes) -> list | None:
+    """Parse the BODYSTRUCTURE item of a FETCH response into nested lists.
+
+    Strings are decoded to ``str`` and ``NIL`` becomes ``None``.
+
+    Args:
+        attributes: FetchRecord attributes containing a BODYSTRUCTURE item
+
+    Returns:
+        Nested list structure, or None if no BODYSTRUCTURE is present
+    """
+    match = _BODYSTRUCTURE_PATTERN.search(attributes)
+    if not match:
+        return None
+
+    stack: list[list] = []
+    for token in _LIST_TOKEN_PATTERN.finditer(attributes, match.end() - 1):
+        if token.group(0) == b"(":
+            stack.append([])
+            continue
+        if token.group(0) == b")":
+            finished = stack.pop()
+            if not stack:
+                return finished
+            stack[-1].append(finished)
+            continue
+
+        if token.group(1) is not None:
+            value = re.sub(rb"\\(.)", rb"\1", token.group(1))
+            stack[-1].append(value.decode("utf-8", errors="replace"))
+        elif token.group(2).upper() == b"NIL":
+            stack[-1].append(None)
+        else:
+            stack[-1].append(token.group(2).decode("ascii", errors="replace"))
+
+    return None
+
+
+def find_text_parts(structure: list | None) -> list[BodyPart]:
+    """Pick the parts that hold the readable body of a multipart message.
+
+    Mirrors the preference of the full-message parser: the first inline
+    text/html part, then the first inline text/plain part as the fallback
+    for HTML that cleans to nothing. Single-part messages and attached
+    messages are not descended into.
+
+    Args:
+        structure: Parsed BODYSTRUCTURE from parse_bodystructure()
+
+    Returns:
+        BodyParts of the selected sections in order of preference (empty if
+        there is no usable part)
+    """
+    if not structure or not isinstance(structure[0], list):
+        return []
+
+    parts = list(_iter_leaf_parts(structure, ""))
+    selected = []
+    for wanted in ("text/html", "text/plain"):
+        for part in parts:
+            if part.content_type == wanted:
+                selected.append(part)
+                break
+    return selected
+
+
+def _iter_leaf_parts(structure: list, prefix: str) -> Iterator[BodyPart]:
+    """Walk a multipart BODYSTRUCTURE depth-first.
+
+    Args:
+        structure: Multipart body structure
+        prefix: Section prefix of this multipart ("" at the top level)
+
+    Returns:
+        Iterator over inline non-multipart parts
+    """
+    # Only the leading lists are child parts; the rest is subtype/extension data
+    children: list[list] = []
+    for child in structure:
+        if not isinstance(child, list):
+            break
+        children.append(child)
+
+    for index, child in enumerate(children, 1):
+        section = f"{prefix}{index}"
+        if child and isinstance(child[0], list):
+            yield from _iter_leaf_parts(child, f"{section}.")
+            continue
+        if len(child) < 7 or not isinstance(child[0], str):
+            continue
+        if _is_attachment(child):
+            continue
+
+        params = child[2] if isinstance(child[2], list) else []
+        param_map = {
+            str(key).lower(): value for key, value in zip(params[::2], params[1::2])
+        }
+        try:
+            size = int(child[6])
+        except (TypeError, ValueError):
+            size = 0
+        yield BodyPart(
+            section=section,
+            content_type=f"{child[0]}/{child[1]}".lower(),
+            charset=param_map.get("charset"),
+            encoding=(child[5] or "7bit").lower(),
+            size=size,
+        )
+
+
+def _is_attachment(part: list) -> bool:
+    """Check the extension data of a part for an attachment disposition.
+
+    Args:
+        part: Non-multipart body structure
+
+    Returns:
+        True if the part is declared as an attachment
+    """
+    for extension in part[7:]:
+        if (
+            isinstance(extension, list)
+            and extension
+            and isinstance(extension[0], str)
+            and extension[0].lower() == "attachment"
+        ):
+            return True
+    return False
+
+
+def compress_message_set(ids: Iterable[int | bytes | str]) -> str:
+    """Build a compact IMAP message set from message numbers or UIDs.
+
+    Consecutive numbers are collapsed into ranges, e.g. ``[1, 2, 3, 7]``
+    becomes ``"1:3,7"``.
+
+    Args:
+        ids: Message sequence numbers or UIDs
+
+    Returns:
+        IMAP message set string
+    """
+    numbers = sorted({int(i) for i in ids})
+    ranges: list[str] = []
+    start = prev = None
+    for number in numbers:
+        if prev is not None and number == prev + 1:
+            prev = number
+            continue
+        if start is not None:
+            ranges.append(str(start) if start == prev else f"{start}:{prev}")
+        start = prev = number
+    if start is not None:
+        ranges.append(str(start) if start == prev else f"{start}:{prev}")
+    return ",".join(ranges)
+
+
+def chunked(items: list, size: int) -> Iterator[list]:
+    """Yield successive chunks of a list.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk size (values below 1 are treated as 1)
+
+    Returns:
+        Iterator over list chunks
+    """
+    size = max(1, int(size))
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -0,0 +1,206 @@
+"""URL canonicalization and short link references."""
+
+import re
+from urllib.parse import parse_qsl, unquote, unquote_plus, urlsplit, urlunsplit
+
+URL_PATTERN = re.compile(r"https?://[^\s<>()\[\]\"'`]+")
+# Punctuation that ends a sentence rather than the URL
+_TRAILING_PUNCTUATION = ".,;:!?*_"
+
+# Query parameters that only identify the campaign or the reader
+TRACKING_PARAMS = {
+    "__s",
+    "_hsenc",
+    "_hsmi",
+    "ck_subscriber_id",
+    "dclid",
+    "fbclid",
+    "gclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "mkt_tok",
+    "msclkid",
+    "oly_anon_id",
+    "oly_enc_id",
+    "ref_src",
+    "s_cid",
+    "vero_conv",
+    "vero_id",
+    "wickedid",
+    "yclid",
+}
+TRACKING_PREFIXES = ("utm_",)
+# Known click-tracking wrappers: host (or parent domain) to path to the
+# query parameters that hold the target URL. A path ending in "/" matches
+# everything below it.
+REDIRECTORS: dict[str, dict[str, tuple[str, ...]]] = {
+    "google.com": {"/url": ("q", "url")},
+    "facebook.com": {"/l.php": ("u",)},
+    "messenger.com": {"/l.php": ("u",)},
+    "l.instagram.com": {"/": ("u",)},
+    "youtube.com": {"/redirect": ("q",)},
+    "linkedin.com": {"/redir/redirect": ("url",)},
+    "slack-redir.net": {"/link": ("url",)},
+    "safelinks.protection.outlook.com": {"/": ("url",)},
+    "out.reddit.com": {"/": ("url",)},
+    "steamcommunity.com": {"/linkfilter/": ("url", "u")},
+    "vk.com": {"/away.php": ("to",)},
+    "duckduckgo.com": {"/l/": ("uddg",)},
+}
+# Wrappers are unwrapped at most this many times
+MAX_UNWRAP = 3
+
+
+def canonicalize_url(url: str, extra_params: set[str] | None = None) -> str:
+    """Unwrap redirectors and strip tracking parameters from a URL.
+
+    Only the known redirectors in REDIRECTORS are unwrapped; opaque
+    click-tracking IDs are left as they are. A URL without tracking
+    parameters keeps its query exactly as written.
+
+    Args:
+        url: Absolute http(s) URL
+        extra_params: Additional query parameters to strip
+
+    Returns:
+        Canonical URL
+    """
+    for _ in range(MAX_UNWRAP):
+        target = _redirect_target(url)
+        if target is None:
+            break
+        url = target
+
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    strip = TRACKING_PARAMS | (extra_params or set())
+    # Kept fields are copied as written; re-encoding them would change
+    # their meaning for servers that tell "+" from "%20"
+    fields = parts.query.split("&")
+    kept = [field for field in fields if not _is_tracking(field, strip)]
+    if len(kept) == len(fields):
+        return url
+    return urlunsplit(parts._replace(query="&".join(kept)))
+
+
+def _is_tracking(field: str, strip: set[str]) -> bool:
+    """Check whether a raw query field is a tracking parameter.
+
+    Args:
+        field: ``key=value`` field as written in the query
+        strip: Lowercase parameter names to strip
+
+    Returns:
+        True if the field should be removed
+    """
+    key = unquote_plus(field.split("=", 1)[0]).lower()
+    return key in strip or key.startswith(TRACKING_PREFIXES)
+
+
+def _redirect_target(url: str) -> str | None:
+    """Get the target of a redirector URL.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Target URL, or None if the URL is not a known redirector
+    """
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+    except ValueError:
+        return None
+    keys = _redirect_params(host, parts.path or "/")
+    if not keys:
+        return None
+    # parse_qsl already decodes the value once; only a target that was
+    # encoded twice by the wrapper needs another pass
+    params = dict(parse_qsl(parts.query))
+    for key in keys:
+        value = params.get(key, "")
+        if not value.startswith(("http://", "https://")):
+            value = unquote(value)
+        if value.startswith(("http://", "https://")):
+            return value
+    return None
+
+
+def _redirect_params(host: str, path: str) -> tuple[str, ...]:
+    """Look up the target parameters of a redirector.
+
+    Args:
+        host: Lowercase host name
+        path: URL path
+
+    Returns:
+        Query parameters holding the target URL (empty if not a redirector)
+    """
+    for domain, paths in REDIRECTORS.items():
+        if host != domain and not host.endswith(f".{domain}"):
+            continue
+        for prefix, keys in paths.items():
+            if path == prefix or (prefix.endswith("/") and path.startswith(prefix)):
+                return keys
+    return ()
+
+
+def split_url(match: str) -> tuple[str, str]:
+    """Split trailing sentence punctuation from a matched URL.
+
+    Args:
+        match: Text matched by URL_PATTERN
+
+    Returns:
+        Tuple of (url, trailing punctuation)
+    """
+    url = match.rstrip(_TRAILING_PUNCTUATION)
+    return url, match[len(url) :]
+
+
+class LinkTable:
+    """Maps URLs to short references (``lnk1``, ``lnk2``, ...) and back."""
+
+    PREFIX = "lnk"
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._ids: dict[str, str] = {}
+        self._urls: dict[str, str] = {}
+        self._pattern = re.compile(rf"\b{self.PREFIX}(\d+)\b")
+
+    def __len__(self) -> int:
+        """Number of distinct URLs in the table."""
+        return len(self._urls)
+
+    def ref(self, url: str) -> str:
+        """Get the reference for a URL, adding it if needed.
+
+        Args:
+            url: URL to reference
+
+        Returns:
+            Short reference
+        """
+        ref = self._ids.get(url)
+        if ref is None:
+            ref = f"{self.PREFIX}{len(self._ids) + 1}"
+            self._ids[url] = ref
+            self._urls[ref] = url
+        return ref
+
+    def expand(self, text: str) -> str:
+        """Replace known references in text with their URLs.
+
+        Args:
+            text: Text containing references
+
+        Returns:
+            Text with references expanded; unknown references are kept
+        """
+        return self._pattern.sub(
+            lambda m: self._urls.get(m.group(0), m.group(0)),
+            text,
+        )
@@ -0,0 +1,259 @@
+"""Shared, rate-limited executor for LLM API requests."""
+
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from app.src.utils.deadline import Deadline
+from app.src.utils.logger import get_logger
+
+T = TypeVar("T")
+
+# Seconds between checks of the run deadline while waiting for capacity
+_DEADLINE_POLL_INTERVAL = 0.5
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float | None):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Capacity and refill per minute (None is unlimited)
+        """
+        self.per_minute = per_minute
+        self.level = float(per_minute or 0)
+        self._updated = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken.
+
+        Args:
+            amount: Units needed (clamped to the capacity)
+
+        Returns:
+            0 if available now, else the expected wait
+        """
+        if not self.per_minute:
+            return 0.0
+        self._refill()
+        missing = min(amount, self.per_minute) - self.level
+        return max(0.0, missing * 60 / self.per_minute)
+
+    def set_rate(self, per_minute: float | None) -> None:
+        """Change the rate, keeping the current fill level.
+
+        Args:
+            per_minute: New capacity and refill per minute (None is unlimited)
+        """
+        if per_minute == self.per_minute:
+            return
+        if self.per_minute and per_minute:
+            self._refill()
+            self.level = min(self.level, float(per_minute))
+        else:
+            # Switching from or to unlimited starts a full bucket
+            self.level = float(per_minute or 0)
+            self._updated = time.monotonic()
+        self.per_minute = per_minute
+
+    def take(self, amount: float) -> None:
+        """Take units from the bucket.
+
+        Args:
+            amount: Units to take (may drive the level negative)
+        """
+        if self.per_minute:
+            self._refill()
+            self.level -= amount
+
+    def _refill(self) -> None:
+        """Add the units accrued since the last update."""
+        now = time.monotonic()
+        self.level = min(
+            float(self.per_minute),
+            self.level + (now - self._updated) * self.per_minute / 60,
+        )
+        self._updated = now
+
+
+class LLMRequestExecutor:
+    """Admits LLM calls under in-flight, requests/min and tokens/min limits.
+
+    Callers block in a priority queue (lower value first, FIFO within a
+    priority) until a slot and enough bucket capacity are available; the
+    call then runs on the caller's thread.
+    """
+
+    # Keys accepted in a processor's rate_limits section
+    OPTIONS = ("max_in_flight", "requests_per_minute", "tokens_per_minute")
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            max_in_flight: Maximum concurrent requests
+            requests_per_minute: Request rate limit (None is unlimited)
+            tokens_per_minute: Token rate limit (None is unlimited)
+        """
+        self.logger = get_logger("llm_executor")
+        self._condition = threading.Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._in_flight = 0
+        self.max_in_flight = max(1, max_in_flight)
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+
+    def configure(
+        self,
+        max_in_flight: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        """Update limits.
+
+        Every processor of an endpoint applies its configured limits, so
+        unchanged rates leave the buckets alone and changed rates keep the
+        current fill level; reconfiguring never refills a bucket.
+
+        Args:
+            max_in_flight: Maximum concurrent requests
+            requests_per_minute: Request rate limit
+            tokens_per_minute: Token rate limit
+        """
+        with self._condition:
+            if max_in_flight is not None:
+                self.max_in_flight = max(1, int(max_in_flight))
+            if requests_per_minute is not None:
+                self._requests.set_rate(requests_per_minute)
+            if tokens_per_minute is not None:
+                self._tokens.set_rate(tokens_per_minute)
+            self._condition.notify_all()
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        tokens: int = 0,
+        priority: int = 0,
+        deadline: Deadline | None = None,
+    ) -> T:
+        """Run a request once the limits admit it.
+
+        Args:
+            fn: Function performing the request
+            tokens: Estimated tokens the request consumes
+            priority: Queue priority (lower runs first)
+            deadline: Deadline of the run; the call stops waiting for
+                capacity once it expires
+
+        Returns:
+            Result of fn
+
+        Raises:
+            TimeoutError: If the deadline expired before the request was admitted
+        """
+        ticket = (priority, next(self._counter))
+        with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            started = time.monotonic()
+            try:
+                while True:
+                    delay = None
+                    if (
+                        self._waiting[0] == ticket
+                        and self._in_flight < self.max_in_flight
+                    ):
+                        delay = max(
+                            self._requests.wait_time(1),
+                            self._tokens.wait_time(tokens),
+                        )
+                        if delay <= 0:
+                            break
+                    self._wait(delay, deadline)
+            except TimeoutError:
+                # Leave the queue so the calls behind this one can proceed
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._requests.take(1)
+            self._tokens.take(tokens)
+            self._in_flight += 1
+            self._condition.notify_all()
+
+        waited = time.monotonic() - started
+        if waited > 1:
+            self.logger.debug(f"LLM request waited {waited:.1f}s for capacity")
+        try:
+            return fn()
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _wait(self, delay: float | None, deadline: Deadline | None) -> None:
+        """Wait for a change of the limits or the queue.
+
+        Must be called with the condition held.
+
+        Args:
+            delay: Seconds until bucket capacity is expected (None is until
+                notified)
+            deadline: Deadline of the run
+
+        Raises:
+            TimeoutError: If the deadline has expired
+        """
+        if deadline is not None:
+            if deadline.expired:
+                raise TimeoutError(
+                    "Run deadline expired while waiting for LLM capacity"
+                )
+            poll = deadline.bound(_DEADLINE_POLL_INTERVAL)
+            delay = poll if delay is None else min(delay, poll)
+        self._condition.wait(delay)
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket with the usage reported by the API.
+
+        Args:
+            estimated: Tokens charged when the request was admitted
+            actual: Tokens the provider counted
+        """
+        with self._condition:
+            self._tokens.take(actual - estimated)
+            self._condition.notify_all()
+
+
+_EXECUTORS: dict[str, LLMRequestExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def get_llm_executor(api_base: str, api_key: str) -> LLMRequestExecutor:
+    """Get the process-wide executor for an API endpoint and key.
+
+    Args:
+        api_base: API base URL
+        api_key: API key (only a hash is kept)
+
+    Returns:
+        Shared LLMRequestExecutor instance
+    """
+    key = hashlib.sha256(f"{api_base}\0{api_key}".encode()).hexdigest()
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(key)
+        if executor is None:
+            executor = _EXECUTORS[key] = LLMRequestExecutor()
+        return executor
@@ -0,0 +1,111 @@
+"""Header-based allow/deny rules for email collection."""
+
+import re
+from typing import Any
+
+
+class HeaderFilter:
+    """Decides from headers and size alone whether a message is worth fetching.
+
+    Rules are case-insensitive regular expressions. Sender rules are matched
+    against the From and List-ID headers, subject rules against the decoded
+    subject. An empty allow list allows everything; deny rules always win.
+    """
+
+    def __init__(
+        self,
+        sender_allow: list[str] | None = None,
+        sender_deny: list[str] | None = None,
+        subject_allow: list[str] | None = None,
+        subject_deny: list[str] | None = None,
+        min_size: int = 0,
+        max_size: int = 0,
+    ):
+        """Initialize the header filter.
+
+        Args:
+            sender_allow: Patterns of senders to keep
+            sender_deny: Patterns of senders to skip
+            subject_allow: Patterns of subjects to keep
+            subject_deny: Patterns of subjects to skip
+            min_size: Minimum message size in bytes (0 disables)
+            max_size: Maximum message size in bytes (0 disables)
+        """
+        self.sender_allow = self._compile(sender_allow)
+        self.sender_deny = self._compile(sender_deny)
+        self.subject_allow = self._compile(subject_allow)
+        self.subject_deny = self._compile(subject_deny)
+        self.min_size = min_size
+        self.max_size = max_size
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> "HeaderFilter | None":
+        """Create a filter from a collector's ``header_filter`` section.
+
+        Args:
+            config: Filter configuration dictionary
+
+        Returns:
+            HeaderFilter instance, or None if no rules are configured
+        """
+        if not config:
+            return None
+        return cls(
+            sender_allow=config.get("sender_allow"),
+            sender_deny=config.get("sender_deny"),
+            subject_allow=config.get("subject_allow"),
+            subject_deny=config.get("subject_deny"),
+            min_size=config.get("min_size", 0),
+            max_size=config.get("max_size", 0),
+        )
+
+    def check(self, sender: str, subject: str, size: int | None) -> str | None:
+        """Check a message against the rules.
+
+        Args:
+            sender: From and List-ID header text
+            subject: Decoded subject
+            size: Message size in bytes, if known
+
+        Returns:
+            Rejection reason, or None if the message should be fetched
+        """
+        if self._matches(self.sender_deny, sender):
+            return "sender denied"
+        if self.sender_allow and not self._matches(self.sender_allow, sender):
+            return "sender not allowed"
+        if self._matches(self.subject_deny, subject):
+            return "subject denied"
+        if self.subject_allow and not self._matches(self.subject_allow, subject):
+            return "subject not allowed"
+        if size is not None:
+            if self.min_size and size < self.min_size:
+                return f"size {size} below minimum"
+            if self.max_size and size > self.max_size:
+                return f"size {size} above maximum"
+        return None
+
+    @staticmethod
+    def _compile(patterns: list[str] | None) -> list[re.Pattern]:
+        """Compile a list of patterns.
+
+        Args:
+            patterns: Regular expression strings
+
+        Returns:
+            Compiled case-insensitive patterns
+        """
+        return [re.compile(pattern, re.IGNORECASE) for pattern in patterns or []]
+
+    @staticmethod
+    def _matches(patterns: list[re.Pattern], text: str) -> bool:
+        """Check whether any pattern matches the text.
+
+        Args:
+            patterns: Compiled patterns
+            text: Text to search
+
+        Returns:
+            True if at least one pattern matches
+        """
+        return any(pattern.search(text) for pattern in patterns)
@@ -0,0 +1,307 @@
+"""TF-IDF logistic regression scoring how relevant an item is to a domain."""
+
+import itertools
+import json
+import math
+import os
+import random
+import tempfile
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from app.src.utils.logger import get_logger
+from app.src.utils.simhash import tokenize
+
+# Accepted spellings of string labels in the training history
+_LABELS = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "no": False,
+}
+
+
+def features(text: str) -> Counter:
+    """Extract unigram and bigram counts from text.
+
+    Bigrams make CJK text (tokenized per character) usable.
+
+    Args:
+        text: Text to featurize
+
+    Returns:
+        Feature counts
+    """
+    tokens = tokenize(text)
+    counts = Counter(tokens)
+    counts.update(f"{a} {b}" for a, b in itertools.pairwise(tokens))
+    return counts
+
+
+class RelevanceModel:
+    """Binary relevance classifier over L2-normalized TF-IDF vectors.
+
+    Trained with stochastic gradient descent on labeled history (relevant
+    or not), with classes weighted so an unbalanced history does not bias
+    the scores.
+    """
+
+    def __init__(self, weights: dict[str, tuple[float, float]], bias: float):
+        """Initialize a trained model.
+
+        Args:
+            weights: Feature to (idf, weight)
+            bias: Intercept
+        """
+        self.weights = weights
+        self.bias = bias
+
+    @classmethod
+    def train(
+        cls,
+        examples: list[tuple[str, bool]],
+        epochs: int = 20,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+        min_df: int = 2,
+        max_features: int = 20000,
+    ) -> "RelevanceModel":
+        """Train a model on labeled texts.
+
+        Args:
+            examples: (text, relevant) pairs
+            epochs: Passes over the examples
+            learning_rate: SGD step size
+            l2: L2 regularization strength
+            min_df: Minimum number of documents a feature must occur in
+            max_features: Maximum vocabulary size (most frequent kept)
+
+        Returns:
+            Trained RelevanceModel
+        """
+        docs = [(features(text), label) for text, label in examples]
+        df: Counter = Counter()
+        for counts, _ in docs:
+            df.update(counts.keys())
+        vocabulary = [
+            feature
+            for feature, count in df.most_common(max_features)
+            if count >= min_df
+        ]
+        idf = {
+            feature: math.log((1 + len(docs)) / (1 + df[feature])) + 1
+            for feature in vocabulary
+        }
+
+        model = cls({feature: (value, 0.0) for feature, value in idf.items()}, 0.0)
+        vectors = [(model._vectorize(counts), label) for counts, label in docs]
+        positives = sum(1 for _, label in docs if label)
+        class_weight = {
+            True: len(docs) / (2 * max(1, positives)),
+            False: len(docs) / (2 * max(1, len(docs) - positives)),
+        }
+
+        weights = dict.fromkeys(idf, 0.0)
+        bias = 0.0
+        rng = random.Random(0)
+        for epoch in range(epochs):
+            rng.shuffle(vectors)
+            step = learning_rate / (1 + epoch)
+            for vector, label in vectors:
+                z = bias + sum(weights[f] * value for f, value in vector.items())
+                error = (_sigmoid(z) - (1.0 if label else 0.0)) * class_weight[label]
+                for feature, value in vector.items():
+                    weights[feature] -= step * (error * value + l2 * weights[feature])
+                bias -= step * error
+
+        model.weights = {feature: (idf[feature], weights[feature]) for feature in idf}
+        model.bias = bias
+        return model
+
+    def score(self, text: str) -> float:
+        """Score how likely a text is relevant.
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Probability between 0 and 1
+        """
+        vector = self._vectorize(features(text))
+        z = self.bias + sum(self.weights[f][1] * value for f, value in vector.items())
+        return _sigmoid(z)
+
+    def save(self, path: str | Path) -> None:
+        """Write the model atomically as JSON.
+
+        Args:
+            path: Model file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "bias": self.bias,
+            "weights": {f: list(value) for f, value in self.weights.items()},
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RelevanceModel":
+        """Load a model written by save().
+
+        Args:
+            path: Model file path
+
+        Returns:
+            RelevanceModel instance
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid model
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        try:
+            weights = {
+                feature: (float(value[0]), float(value[1]))
+                for feature, value in data["weights"].items()
+            }
+            return cls(weights, float(data["bias"]))
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid relevance model: {path}") from e
+
+    def _vectorize(self, counts: Counter) -> dict[str, float]:
+        """Turn feature counts into an L2-normalized TF-IDF vector.
+
+        Args:
+            counts: Feature counts
+
+        Returns:
+            Sparse vector over known features
+        """
+        vector = {
+            feature: (1 + math.log(count)) * self.weights[feature][0]
+            for feature, count in counts.items()
+            if feature in self.weights
+        }
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        if norm:
+            vector = {feature: value / norm for feature, value in vector.items()}
+        return vector
+
+
+def load_examples(path: str | Path) -> list[tuple[str, bool]]:
+    """Read labeled items from a JSONL history file.
+
+    Each line is an object with a ``label`` (true/1 for relevant, false/0
+    for off-topic) and either ``text`` or ``source_title`` and ``content``,
+    the format of the relevance stage's audit log. Unlabeled lines are
+    skipped; malformed lines and unrecognized labels are skipped with a
+    warning.
+
+    Args:
+        path: JSONL file path
+
+    Returns:
+        (text, relevant) pairs
+    """
+    logger = get_logger("relevance")
+    examples = []
+    with Path(path).open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed line {line_number} of {path}")
+                continue
+            if not isinstance(record, dict) or record.get("label") is None:
+                continue
+            label = parse_label(record["label"])
+            if label is None:
+                logger.warning(
+                    f"Skipping line {line_number} of {path} with unrecognized "
+                    f"label {record['label']!r}",
+                )
+                continue
+            examples.append((item_text(record), label))
+    return examples
+
+
+def parse_label(value: Any) -> bool | None:
+    """Parse the label of a history record.
+
+    Args:
+        value: Label as written by a reviewer (true/false, 1/0, or the same
+            as strings, also "yes"/"no")
+
+    Returns:
+        Whether the item is relevant, or None if the label is not recognized
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int | float):
+        return {1: True, 0: False}.get(value)
+    if isinstance(value, str):
+        return _LABELS.get(value.strip().lower())
+    return None
+
+
+def item_text(record: dict[str, Any]) -> str:
+    """Get the text scored for an item record.
+
+    Args:
+        record: Dictionary with ``text`` or ``source_title`` and ``content``
+
+    Returns:
+        Text to featurize
+    """
+    if "text" in record:
+        return str(record["text"])
+    return f"{record.get('source_title', '')}\n{record.get('content', '')}"
+
+
+def train_from_history(
+    history: Iterable[tuple[str, bool]],
+    min_examples: int = 10,
+) -> RelevanceModel | None:
+    """Train a model if the history has enough examples of both classes.
+
+    Args:
+        history: (text, relevant) pairs
+        min_examples: Minimum examples required per class
+
+    Returns:
+        Trained model, or None if the history is too small
+    """
+    examples = list(history)
+    positives = sum(1 for _, label in examples if label)
+    if min(positives, len(examples) - positives) < min_examples:
+        return None
+    return RelevanceModel.train(examples)
+
+
+def _sigmoid(z: float) -> float:
+    """Numerically stable logistic function.
+
+    Args:
+        z: Logit
+
+    Returns:
+        Probability
+    """
+    if z >= 0:
+        return 1 / (1 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1 + e)
@@ -0,0 +1,122 @@
+"""Retry policy with exponential backoff, jitter and a total deadline."""
+
+import random
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from app.src.utils.logger import get_logger
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """Retries a call on transient errors.
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay`` with
+    full jitter, unless the error carries a server-provided delay
+    (e.g. Retry-After), which is honored as given: retrying earlier would
+    only be rejected again. No attempt is started that could not begin
+    before ``deadline`` seconds after the first one.
+    """
+
+    # Keys accepted in the configuration section
+    OPTIONS = ("max_attempts", "base_delay", "max_delay", "deadline")
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        deadline: float | None = 300.0,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Maximum number of attempts (1 disables retries)
+            base_delay: Delay cap of the first retry in seconds
+            max_delay: Upper bound of a computed backoff delay in seconds
+            deadline: Seconds after the first attempt within which retries
+                may start (None is unbounded)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.logger = get_logger("retry")
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> "RetryPolicy":
+        """Create a policy from a configuration section.
+
+        Unknown keys are ignored with a warning, so a typo does not stop
+        the processor from being created.
+
+        Args:
+            config: Dictionary with max_attempts, base_delay, max_delay and
+                deadline (all optional)
+
+        Returns:
+            RetryPolicy instance
+        """
+        config = config or {}
+        unknown = sorted(set(config) - set(cls.OPTIONS))
+        if unknown:
+            get_logger("retry").warning(
+                f"Ignoring unknown retry options: {', '.join(unknown)}",
+            )
+        return cls(**{key: config[key] for key in cls.OPTIONS if key in config})
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        retryable: Callable[[Exception], bool],
+        retry_after: Callable[[Exception], float | None] | None = None,
+        timeout: float | None = None,
+    ) -> T:
+        """Call fn, retrying transient failures.
+
+        Args:
+            fn: Function to call
+            retryable: Decides whether an exception is transient
+            retry_after: Extracts a server-requested delay from an exception
+            timeout: Seconds left to the caller's own deadline; retries are
+                bounded by the earlier of it and ``deadline``
+
+        Returns:
+            Result of fn
+
+        Raises:
+            Exception: The last error once retries are exhausted, the
+                deadline would be exceeded, or the error is not transient
+        """
+        started = time.monotonic()
+        deadline = self.deadline
+        if timeout is not None:
+            deadline = timeout if deadline is None else min(deadline, timeout)
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if not retryable(e) or attempt >= self.max_attempts:
+                    raise
+
+                delay = retry_after(e) if retry_after else None
+                if delay is None:
+                    backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+                    delay = random.uniform(0, backoff)
+                elapsed = time.monotonic() - started
+                if deadline is not None and elapsed + delay > deadline:
+                    self.logger.warning(
+                        f"Giving up after {attempt} attempts: retry in {delay:.1f}s "
+                        f"would exceed the {deadline:.0f}s deadline",
+                    )
+                    raise
+
+                self.logger.warning(
+                    f"Attempt {attempt}/{self.max_attempts} failed ({e}); "
+                    f"retrying in {delay:.1f}s",
+                )
+                time.sleep(delay)
+                attempt += 1
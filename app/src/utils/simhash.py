@@ -0,0 +1,139 @@
+"""Exact and near-duplicate fingerprints for text."""
+
+import hashlib
+import re
+
+_TOKEN_PATTERN = re.compile(r"[぀-ヿ㐀-鿿가-힯]|\w+")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+SIMHASH_BITS = 64
+
+
+def content_hash(text: str) -> str:
+    """Hash text independent of case and whitespace.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex digest
+    """
+    normalized = _SPACE_PATTERN.sub(" ", text.lower()).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens (CJK characters individually).
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Tokens in order
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def simhash(tokens: list[str], shingle_size: int = 3) -> int:
+    """Compute a 64-bit SimHash over token shingles.
+
+    Args:
+        tokens: Tokens of the text
+        shingle_size: Tokens per shingle
+
+    Returns:
+        SimHash fingerprint
+    """
+    weights = [0] * SIMHASH_BITS
+    count = max(1, len(tokens) - shingle_size + 1)
+    for i in range(count):
+        shingle = " ".join(tokens[i : i + shingle_size])
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(),
+            "big",
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count differing bits of two fingerprints.
+
+    Args:
+        a: First fingerprint
+        b: Second fingerprint
+
+    Returns:
+        Number of differing bits
+    """
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """Finds fingerprints within a Hamming distance using band buckets.
+
+    The 64 bits are split into ``max_distance + 1`` bands; two fingerprints
+    within the distance share at least one identical band, so only entries
+    in the same bucket are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        """Initialize an empty index.
+
+        Args:
+            max_distance: Maximum Hamming distance of near duplicates
+        """
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = SIMHASH_BITS // bands
+        self._bands = [
+            (i * width, SIMHASH_BITS if i == bands - 1 else (i + 1) * width)
+            for i in range(bands)
+        ]
+        self._buckets: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+    def add(self, key: int, fingerprint: int) -> None:
+        """Add a fingerprint.
+
+        Args:
+            key: Identifier returned by query()
+            fingerprint: SimHash fingerprint
+        """
+        for band, value in self._band_values(fingerprint):
+            self._buckets.setdefault((band, value), []).append((key, fingerprint))
+
+    def query(self, fingerprint: int) -> list[int]:
+        """Find keys of fingerprints within the maximum distance.
+
+        Args:
+            fingerprint: SimHash fingerprint
+
+        Returns:
+            Matching keys in ascending order
+        """
+        matches: dict[int, None] = {}
+        for band, value in self._band_values(fingerprint):
+            for key, other in self._buckets.get((band, value), []):
+                if hamming_distance(fingerprint, other) <= self.max_distance:
+                    matches[key] = None
+        return sorted(matches)
+
+    def _band_values(self, fingerprint: int) -> list[tuple[int, int]]:
+        """Split a fingerprint into its bands.
+
+        Args:
+            fingerprint: SimHash fingerprint
+
+        Returns:
+            List of (band index, band value)
+        """
+        return [
+            (band, fingerprint >> start & ((1 << (end - start)) - 1))
+            for band, (start, end) in enumerate(self._bands)
+        ]
@@ -0,0 +1,103 @@
+"""Persistent per-mailbox sync state for incremental collection."""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from app.src.utils.logger import get_logger
+
+_STATE_LOCK = threading.Lock()
+
+
+class SyncStateStore:
+    """Small JSON store for IMAP UIDVALIDITY and UID watermarks.
+
+    State is keyed by ``"<account>/<mailbox>"`` and every update is merged
+    into the file on disk, so several collectors can share one state file.
+    """
+
+    def __init__(self, state_file: str | Path):
+        """Initialize the state store.
+
+        Args:
+            state_file: Path to the JSON state file
+        """
+        self.state_file = Path(state_file)
+        self.logger = get_logger("sync_state")
+
+    @staticmethod
+    def make_key(account: str, mailbox: str) -> str:
+        """Build the state key for an account and mailbox.
+
+        Args:
+            account: Email account
+            mailbox: Mailbox name
+
+        Returns:
+            State key string
+        """
+        return f"{account}/{mailbox}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get the stored state for a mailbox.
+
+        Args:
+            key: State key from make_key()
+
+        Returns:
+            Dictionary with "uidvalidity" and "last_uid", or None
+        """
+        with _STATE_LOCK:
+            return self._read().get(key)
+
+    def update(self, key: str, uidvalidity: int, last_uid: int) -> None:
+        """Persist the watermark for a mailbox.
+
+        Args:
+            key: State key from make_key()
+            uidvalidity: Current UIDVALIDITY of the mailbox
+            last_uid: Highest UID that has been fully processed
+        """
+        with _STATE_LOCK:
+            state = self._read()
+            state[key] = {"uidvalidity": uidvalidity, "last_uid": last_uid}
+            self._write(state)
+
+    def _read(self) -> dict[str, Any]:
+        """Read the state file.
+
+        Returns:
+            State dictionary (empty if the file is missing or invalid)
+        """
+        if not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to read sync state {self.state_file}: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _write(self, state: dict[str, Any]) -> None:
+        """Atomically write the state file.
+
+        Args:
+            state: State dictionary to persist
+        """
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.state_file.parent,
+            prefix=".sync_state",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.state_file)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,22 @@
+"""Rough token estimates for LLM prompts."""
+
+import re
+
+# CJK ideographs, kana, hangul and full-width forms: about one token each
+_WIDE_PATTERN = re.compile(r"[　-〿぀-ヿ㐀-䶿一-鿿가-퟿＀-￯]")
+# Other text averages about four characters per token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text without a tokenizer.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count (rounded up)
+    """
+    wide = len(_WIDE_PATTERN.findall(text))
+    narrow = len(text) - wide
+    return wide + (narrow + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
@@ -0,0 +1,80 @@
+"""Tests for BODYSTRUCTURE parsing and text part selection."""
+
+from app.src.utils.imap_utils import find_text_parts, parse_bodystructure
+
+# multipart/mixed of (multipart/alternative of plain + (multipart/related of
+# html + inline image)) and a PDF attachment
+NESTED = (
+    b"1 (UID 42 BODYSTRUCTURE ("
+    b'(("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "QUOTED-PRINTABLE" 120 4 NIL'
+    b" NIL NIL)"
+    b'(("TEXT" "HTML" ("CHARSET" "iso-8859-1") NIL NIL "BASE64" 2048 30 NIL'
+    b' NIL NIL)("IMAGE" "PNG" ("NAME" "logo.png") "<logo>" NIL "BASE64" 512'
+    b' NIL ("INLINE" ("FILENAME" "logo.png")) NIL) "RELATED" ("BOUNDARY" "r")'
+    b' NIL NIL) "ALTERNATIVE" ("BOUNDARY" "a") NIL NIL)'
+    b'("APPLICATION" "PDF" ("NAME" "a.pdf") NIL NIL "BASE64" 9000 NIL'
+    b' ("ATTACHMENT" ("FILENAME" "a.pdf")) NIL) "MIXED" ("BOUNDARY" "m") NIL'
+    b" NIL))"
+)
+
+
+def test_parse_bodystructure_nested_multipart():
+    """Nested multiparts become nested lists with NIL as None."""
+    structure = parse_bodystructure(NESTED)
+
+    alternative, attachment = structure[0], structure[1]
+    assert structure[2] == "MIXED"
+    assert alternative[0][:2] == ["TEXT", "PLAIN"]
+    related = alternative[1]
+    assert related[0][:3] == ["TEXT", "HTML", ["CHARSET", "iso-8859-1"]]
+    assert related[1][3] == "<logo>"
+    assert related[2] == "RELATED"
+    assert attachment[0:2] == ["APPLICATION", "PDF"]
+    assert attachment[3] is None
+
+
+def test_parse_bodystructure_unescapes_quoted_strings():
+    """Backslash escapes inside quoted strings are removed."""
+    structure = parse_bodystructure(
+        b'1 (BODYSTRUCTURE ("TEXT" "PLAIN" ("NAME" "a \\"b\\" c") NIL NIL "7BIT" 3 1))',
+    )
+
+    assert structure[2] == ["NAME", 'a "b" c']
+
+
+def test_parse_bodystructure_missing():
+    """Responses without BODYSTRUCTURE return None."""
+    assert parse_bodystructure(b"1 (UID 3 FLAGS (\\Seen))") is None
+
+
+def test_find_text_parts_nested_sections():
+    """HTML then plain text are found at their nested section numbers."""
+    html, plain = find_text_parts(parse_bodystructure(NESTED))
+
+    assert (html.section, html.content_type) == ("1.2.1", "text/html")
+    assert (html.charset, html.encoding, html.size) == ("iso-8859-1", "base64", 2048)
+    assert (plain.section, plain.content_type) == ("1.1", "text/plain")
+    assert plain.encoding == "quoted-printable"
+
+
+def test_find_text_parts_skips_attachments():
+    """Text parts declared as attachments are not selected."""
+    structure = parse_bodystructure(
+        b'1 (BODYSTRUCTURE (("TEXT" "HTML" NIL NIL NIL "7BIT" 10 1 NIL'
+        b' ("ATTACHMENT" ("FILENAME" "a.html")) NIL)("TEXT" "PLAIN" NIL NIL NIL'
+        b' "7BIT" 5 1) "MIXED"))',
+    )
+
+    (plain,) = find_text_parts(structure)
+
+    assert (plain.section, plain.content_type) == ("2", "text/plain")
+
+
+def test_find_text_parts_single_part():
+    """Single-part messages have no part to select."""
+    structure = parse_bodystructure(
+        b'1 (BODYSTRUCTURE ("TEXT" "HTML" ("CHARSET" "utf-8") NIL NIL "7BIT" 10 1))',
+    )
+
+    assert find_text_parts(structure) == []
+    assert find_text_parts(None) == []
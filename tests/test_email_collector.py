@@ -0,0 +1,40 @@
+"""Tests for the email collector."""
+
+import logging
+
+from app.src.collectors.email_collector import EmailCollector
+
+
+class FakeMail:
+    """IMAP connection answering UID STORE with a status per call."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.stores = []
+
+    def uid(self, command, message_set, *args):
+        """Record a UID command and answer with the next status."""
+        self.stores.append(message_set)
+        return self.statuses.pop(0), [b"STORE failed"]
+
+
+def make_collector(tmp_path):
+    """Build an email collector with its state in a temporary directory."""
+    return EmailCollector(
+        {"email_account": "reader@example.com", "state_file": str(tmp_path / "s")},
+        "mail",
+    )
+
+
+def test_store_seen_counts_only_stored_chunks(tmp_path, monkeypatch, caplog):
+    """A chunk answered with NO is reported and not counted as marked."""
+    collector = make_collector(tmp_path)
+    monkeypatch.setattr(EmailCollector, "STORE_BATCH_SIZE", 2)
+    mail = FakeMail(["OK", "NO", "OK"])
+
+    with caplog.at_level(logging.INFO):
+        collector._store_seen(mail, [1, 2, 3, 4, 5])
+
+    assert mail.stores == ["1:2", "3:4", "5"]
+    assert "Failed to mark emails 3:4 seen: NO" in caplog.text
+    assert "Marked only 3 of 5 emails as seen" in caplog.text
@@ -0,0 +1,60 @@
+"""Tests for the shared IMAP connection pool."""
+
+import threading
+
+import pytest
+
+from app.src.utils.imap_pool import IMAPConnectionPool
+
+KEY = ("imap.example.com", 993, "reader@example.com")
+
+
+class FakeConnection:
+    """Connection that always answers NOOP."""
+
+    def noop(self):
+        """Answer a health check."""
+        return "OK", [b""]
+
+    def logout(self):
+        """Close the connection."""
+
+
+def test_acquire_is_unbounded_by_default():
+    """Parallel callers each get a connection; released ones are reused."""
+    pool = IMAPConnectionPool()
+
+    connections = [pool.acquire(KEY, FakeConnection) for _ in range(6)]
+    assert len(set(map(id, connections))) == 6
+
+    pool.release(KEY, connections[0])
+    assert pool.acquire(KEY, FakeConnection) is connections[0]
+
+
+def test_acquire_gives_up_after_timeout():
+    """A capped pool stops waiting for a free slot once the timeout expires."""
+    pool = IMAPConnectionPool(max_size=1)
+    pool.acquire(KEY, FakeConnection)
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(KEY, FakeConnection, timeout=0.05)
+
+
+def test_acquire_gives_up_when_cancelled():
+    """A cancelled caller stops waiting for a free slot."""
+    pool = IMAPConnectionPool(max_size=1)
+    pool.acquire(KEY, FakeConnection)
+    cancelled = threading.Event()
+    threading.Timer(0.05, cancelled.set).start()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(KEY, FakeConnection, timeout=5, cancelled=cancelled.is_set)
+
+
+def test_acquire_waits_for_a_released_connection():
+    """A waiting caller gets the connection another caller releases."""
+    pool = IMAPConnectionPool(max_size=1)
+    held = pool.acquire(KEY, FakeConnection)
+    threading.Timer(0.05, pool.release, (KEY, held)).start()
+
+    assert pool.acquire(KEY, FakeConnection, timeout=5) is held
@@ -0,0 +1,103 @@
+"""Tests for the IMAP FETCH response helpers."""
+
+import pytest
+
+from app.src.utils.imap_utils import compress_message_set, parse_fetch_response
+
+
+def test_parse_fetch_response_splits_messages_with_literals():
+    """Each message gets its own record with the literal payload intact."""
+    first = b"Subject: one\r\n\r\nbody ) with { braces }\r\n"
+    second = b"Subject: two\r\n\r\nbody\r\n"
+    data = [
+        (b"1 (UID 10 RFC822.SIZE 44 BODY[] {%d}" % len(first), first),
+        b")",
+        (b"2 (UID 11 RFC822.SIZE 24 BODY[] {%d}" % len(second), second),
+        b")",
+    ]
+
+    records = parse_fetch_response(data)
+
+    assert [(r.seq, r.uid) for r in records] == [(1, 10), (2, 11)]
+    assert records[0].section("BODY[]") == first
+    assert records[1].section("BODY[]") == second
+    assert records[0].size == 44
+
+
+def test_parse_fetch_response_keeps_section_names():
+    """Several literals of one message are keyed by their section name."""
+    headers = b"From: a@example.com\r\n\r\n"
+    html = b"<p>hi</p>"
+    data = [
+        (
+            b"1 (UID 7 BODY[HEADER.FIELDS (FROM)] {%d}" % len(headers),
+            headers,
+        ),
+        (b" BODY[2] {%d}" % len(html), html),
+        b")",
+    ]
+
+    (record,) = parse_fetch_response(data)
+
+    assert record.section("BODY[HEADER") == headers
+    assert record.section("BODY[2]") == html
+    assert record.section("BODY[1]") is None
+
+
+def test_parse_fetch_response_with_unsolicited_seen_flag():
+    """A \\Seen update sent between messages does not corrupt the records."""
+    body = b"Subject: one\r\n\r\ntext\r\n"
+    data = [
+        (b"1 (UID 10 BODY[] {%d}" % len(body), body),
+        b" FLAGS (\\Seen))",
+        b"3 (FLAGS (\\Seen))",
+        (b"2 (UID 11 BODY[] {%d}" % len(body), body),
+        b")",
+    ]
+
+    records = parse_fetch_response(data)
+
+    assert [(r.seq, r.uid) for r in records] == [(1, 10), (3, None), (2, 11)]
+    assert records[0].section("BODY[]") == body
+    assert records[1].sections == {}
+    assert records[2].section("BODY[]") == body
+
+
+def test_parse_fetch_response_ignores_leading_noise():
+    """Data before the first FETCH line and None entries are skipped."""
+    body = b"x"
+    data = [None, b"garbage", (b"4 (UID 2 BODY[] {1}", body), b")"]
+
+    (record,) = parse_fetch_response(data)
+
+    assert (record.seq, record.uid) == (4, 2)
+    assert record.section("BODY[]") == body
+
+
+def test_parse_fetch_response_quotes_structure_literals():
+    """Literals inside a BODYSTRUCTURE become quoted strings."""
+    data = [
+        (b'1 (UID 5 BODYSTRUCTURE ("TEXT" "HTML" ("NAME" {5}', b'a "b"'),
+        b') NIL NIL "7BIT" 10 1))',
+    ]
+
+    (record,) = parse_fetch_response(data)
+
+    assert b'("NAME" "a \\"b\\"")' in record.attributes
+    assert record.sections == {}
+
+
+@pytest.mark.parametrize(
+    ("ids", "expected"),
+    [
+        ([], ""),
+        ([5], "5"),
+        ([1, 2, 3, 7], "1:3,7"),
+        ([b"9", b"3", b"4", b"10"], "3:4,9:10"),
+        (["2", 1, b"2", 3], "1:3"),
+        ([100, 102, 104], "100,102,104"),
+    ],
+)
+def test_compress_message_set(ids, expected):
+    """Consecutive UIDs collapse into ranges, duplicates and order ignored."""
+    assert compress_message_set(ids) == expected
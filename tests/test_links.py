@@ -0,0 +1,71 @@
+"""Tests for URL canonicalization."""
+
+import pytest
+
+from app.src.utils.links import canonicalize_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        # Encoded characters inside the target survive unwrapping
+        (
+            (
+                "https://nam02.safelinks.protection.outlook.com/?url=https%3A%2F%2F"
+                "example.com%2Fa%3Fx%3D1%2520y%26id%3D5&data=05%7C01&reserved=0"
+            ),
+            "https://example.com/a?x=1%20y&id=5",
+        ),
+        (
+            (
+                "https://www.google.com/url?q=https%3A%2F%2Fexample.com%2Fsearch"
+                "%3Fq%3Dc%252B%252B&sa=D&ust=1"
+            ),
+            "https://example.com/search?q=c%2B%2B",
+        ),
+        # A target encoded twice by the wrapper
+        (
+            "https://www.google.com/url?q=https%253A%252F%252Fexample.com%252Fa",
+            "https://example.com/a",
+        ),
+        # Nested wrappers and tracking parameters of the target
+        (
+            (
+                "https://l.facebook.com/l.php?u=https%3A%2F%2Fwww.google.com%2Furl"
+                "%3Fq%3Dhttps%253A%252F%252Fexample.com%252Fa%253Futm_source%253Dn"
+                "%2526id%253D5"
+            ),
+            "https://example.com/a?id=5",
+        ),
+    ],
+)
+def test_canonicalize_url_unwraps_encoded_targets(url, expected):
+    """Known redirectors yield their target with its encoding intact."""
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_keeps_encoding_of_kept_params():
+    """Stripping tracking parameters leaves the other fields as written."""
+    url = "https://example.com/p?q=a%20b+c&utm_source=x&flag&fbclid=1&r=%2Fx"
+
+    assert canonicalize_url(url) == "https://example.com/p?q=a%20b+c&flag&r=%2Fx"
+
+
+def test_canonicalize_url_strips_extra_params():
+    """Caller-supplied parameters are stripped like tracking parameters."""
+    url = "https://example.com/p?id=1&src=mail"
+
+    assert canonicalize_url(url, {"src"}) == "https://example.com/p?id=1"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/p?b=2&a=%7E&key",
+        "https://example.com/login?url=https%3A%2F%2Fother.example.com",
+        "https://www.google.com/search?q=https%3A%2F%2Fexample.com",
+    ],
+)
+def test_canonicalize_url_leaves_other_urls_unchanged(url):
+    """URLs without tracking parameters or known wrappers are kept as is."""
+    assert canonicalize_url(url) == url
@@ -0,0 +1,46 @@
+"""Tests for the shared LLM request executor."""
+
+import logging
+import time
+
+import pytest
+
+from app.src.processors.ai_processor import AIProcessor
+from app.src.utils.deadline import Deadline
+from app.src.utils.llm_executor import LLMRequestExecutor
+
+
+def test_call_gives_up_waiting_at_the_deadline():
+    """A queued call stops waiting for capacity once the run deadline expires."""
+    executor = LLMRequestExecutor(requests_per_minute=1)
+    executor.call(lambda: None)
+    deadline = Deadline(0.1)
+    deadline.start()
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        executor.call(lambda: None, deadline=deadline)
+
+    assert time.monotonic() - started < 1
+    assert executor._waiting == []
+
+
+def test_call_runs_immediately_with_capacity():
+    """A deadline does not delay calls the limits admit right away."""
+    executor = LLMRequestExecutor()
+    deadline = Deadline(10)
+    deadline.start()
+
+    assert executor.call(lambda: "done", deadline=deadline) == "done"
+
+
+def test_unknown_rate_limit_options_are_ignored(caplog):
+    """A typo in rate_limits is reported instead of breaking the processor."""
+    with caplog.at_level(logging.WARNING):
+        processor = AIProcessor(
+            {"rate_limits": {"requests_per_minute": 60, "tokens_per_min": 1000}},
+            "ai",
+        )
+
+    assert processor.rate_limits == {"requests_per_minute": 60}
+    assert "Ignoring unknown rate_limits options: tokens_per_min" in caplog.text
@@ -0,0 +1,121 @@
+"""Tests for the streaming collection pipeline."""
+
+import threading
+import time
+
+from app.src.collectors.base import Collector
+from app.src.models import SourceItem
+from app.src.pipeline import StreamingPipeline
+from app.src.utils.deadline import Deadline
+
+
+def make_item(title):
+    """Build a minimal source item."""
+    return SourceItem(
+        source_type="test",
+        source_name="test",
+        source_title=title,
+        content=title,
+    )
+
+
+class FakeCollector(Collector):
+    """Collector yielding fixed titles, optionally stalling after them."""
+
+    def __init__(self, name, titles, stall=None, timeout=None):
+        super().__init__({"type": "test", "timeout": timeout}, name)
+        self.titles = titles
+        self.stall = stall
+
+    def collect(self):
+        """Collect all items at once."""
+        return list(self.iter_items())
+
+    def iter_items(self):
+        """Yield the titles, then block until the stall event is set."""
+        for title in self.titles:
+            yield make_item(title)
+        if self.stall is not None:
+            self.stall.wait(5)
+
+
+def test_stream_yields_items_of_finished_collectors():
+    """Every collector that finishes delivers all of its items."""
+    collectors = [
+        FakeCollector("a", ["a1", "a2"]),
+        FakeCollector("b", ["b1"]),
+    ]
+    pipeline = StreamingPipeline(collectors, [])
+
+    titles = sorted(item.source_title for item in pipeline.stream())
+
+    assert titles == ["a1", "a2", "b1"]
+    assert pipeline.delivered == collectors
+
+
+def test_timed_out_collector_is_abandoned_without_partial_items():
+    """A stalled collector is cancelled at its timeout and contributes nothing."""
+    stall = threading.Event()
+    stalled = FakeCollector("slow", ["s1", "s2"], stall=stall, timeout=0.2)
+    fast = FakeCollector("fast", ["f1"])
+    pipeline = StreamingPipeline([stalled, fast], [])
+
+    try:
+        started = time.monotonic()
+        titles = [item.source_title for item in pipeline.stream()]
+        elapsed = time.monotonic() - started
+    finally:
+        stall.set()
+
+    assert titles == ["f1"]
+    assert elapsed < 2
+    assert stalled.cancelled
+    assert pipeline.delivered == [fast]
+
+
+def test_domain_deadline_ends_the_wait():
+    """The domain deadline cancels collectors without a timeout of their own."""
+    stall = threading.Event()
+    stalled = FakeCollector("slow", ["s1"], stall=stall)
+    deadline = Deadline(0.2)
+    deadline.start()
+    pipeline = StreamingPipeline([stalled], [], default_timeout=None, deadline=deadline)
+
+    try:
+        started = time.monotonic()
+        titles = [item.source_title for item in pipeline.stream()]
+        elapsed = time.monotonic() - started
+    finally:
+        stall.set()
+
+    assert titles == []
+    assert elapsed < 2
+    assert pipeline.delivered == []
+
+
+class CommittingCollector(FakeCollector):
+    """Collector that starts committing before it stalls."""
+
+    def iter_items(self):
+        """Yield the titles after claiming the commit and stalling."""
+        assert self._begin_commit()
+        self.stall.wait(0.4)
+        for title in self.titles:
+            yield make_item(title)
+
+
+def test_committing_collector_is_waited_for():
+    """Items of a collector already committing are used despite the timeout."""
+    committing = CommittingCollector(
+        "committing",
+        ["c1"],
+        stall=threading.Event(),
+        timeout=0.1,
+    )
+    pipeline = StreamingPipeline([committing], [])
+
+    titles = [item.source_title for item in pipeline.stream()]
+
+    assert titles == ["c1"]
+    assert not committing.cancelled
+    assert pipeline.delivered == [committing]
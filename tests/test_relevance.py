@@ -0,0 +1,67 @@
+"""Tests for the relevance classifier history and the relevance stage."""
+
+import json
+
+import pytest
+
+from app.src.stages.relevance_stage import RelevanceStage
+from app.src.utils.relevance import RelevanceModel, load_examples, parse_label
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (True, True),
+        (False, False),
+        (1, True),
+        (0, False),
+        ("true", True),
+        ("False", False),
+        (" yes ", True),
+        ("0", False),
+        ("false-positive", None),
+        (2, None),
+        ([1], None),
+    ],
+)
+def test_parse_label(value, expected):
+    """Only explicit true/false spellings are accepted."""
+    assert parse_label(value) is expected
+
+
+def test_load_examples_skips_unrecognized_labels(tmp_path):
+    """A label such as "false" is not read as relevant; unknown ones are skipped."""
+    history = tmp_path / "history.jsonl"
+    records = [
+        {"text": "kept", "label": "false"},
+        {"text": "relevant", "label": 1},
+        {"text": "unknown", "label": "maybe"},
+        {"text": "unlabeled", "label": None},
+    ]
+    history.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+    assert load_examples(history) == [("kept", False), ("relevant", True)]
+
+
+def test_trained_model_is_used_when_saving_fails(tmp_path, monkeypatch):
+    """A model that cannot be written is still used for the run."""
+    history = tmp_path / "history.jsonl"
+    records = [{"text": f"rust compiler {i}", "label": 1} for i in range(3)]
+    records += [{"text": f"celebrity gossip {i}", "label": 0} for i in range(3)]
+    history.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+    def fail_save(self, path):
+        raise PermissionError(f"read-only: {path}")
+
+    monkeypatch.setattr(RelevanceModel, "save", fail_save)
+    stage = RelevanceStage(
+        {
+            "model_file": str(tmp_path / "model.json"),
+            "training_file": str(history),
+            "min_examples": 3,
+            "audit_file": "",
+        },
+        "relevance",
+    )
+
+    assert stage.model is not None
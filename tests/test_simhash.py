@@ -0,0 +1,89 @@
+"""Tests for SimHash fingerprints and the near-duplicate index."""
+
+import pytest
+
+from app.src.utils.simhash import (
+    SIMHASH_BITS,
+    SimHashIndex,
+    content_hash,
+    hamming_distance,
+    simhash,
+    tokenize,
+)
+
+BASE = 0x0123_4567_89AB_CDEF
+
+
+def flip(fingerprint: int, *bits: int) -> int:
+    """Flip the given bits of a fingerprint."""
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+@pytest.mark.parametrize("max_distance", [0, 1, 3, 6])
+def test_index_matches_up_to_max_distance(max_distance):
+    """A fingerprint exactly max_distance bits away matches, one more does not."""
+    index = SimHashIndex(max_distance)
+    index.add(1, BASE)
+
+    # Adjacent bits fall into as few bands as possible
+    assert index.query(flip(BASE, *range(max_distance))) == [1]
+    assert index.query(flip(BASE, *range(max_distance + 1))) == []
+
+
+@pytest.mark.parametrize("max_distance", [1, 3, 6])
+def test_index_matches_differences_spread_over_bands(max_distance):
+    """Differences in all but one band still leave a shared band."""
+    index = SimHashIndex(max_distance)
+    index.add(1, BASE)
+    width = SIMHASH_BITS // (max_distance + 1)
+
+    # One flipped bit in each band except the last
+    spread = flip(BASE, *(band * width for band in range(max_distance)))
+
+    assert hamming_distance(BASE, spread) == max_distance
+    assert index.query(spread) == [1]
+
+
+def test_index_checks_distance_within_shared_band():
+    """Sharing a band is not enough if the full distance is too large."""
+    index = SimHashIndex(3)
+    index.add(1, BASE)
+
+    # The first band is untouched, but 4 bits differ in the others
+    far = flip(BASE, 20, 30, 40, 50)
+
+    assert index.query(far) == []
+
+
+def test_index_returns_each_key_once_in_order():
+    """Keys matching through several bands are reported once, sorted."""
+    index = SimHashIndex(2)
+    index.add(5, BASE)
+    index.add(2, flip(BASE, 0))
+    index.add(9, flip(BASE, 0, 1, 2, 3))
+
+    assert index.query(BASE) == [2, 5]
+
+
+def test_simhash_near_duplicate_text_is_close():
+    """A one-word edit of a long text stays within a small distance."""
+    words = [f"word{i}" for i in range(200)]
+    edited = [*words[:100], "changed", *words[101:]]
+
+    distance = hamming_distance(simhash(words), simhash(edited))
+
+    assert distance <= 6
+    assert hamming_distance(simhash(words), simhash(words[::-1])) > 6
+
+
+def test_content_hash_ignores_case_and_whitespace():
+    """Exact duplicates differing in case or spacing hash the same."""
+    assert content_hash("Hello  World\n") == content_hash("hello world")
+    assert content_hash("hello world") != content_hash("hello worlds")
+
+
+def test_tokenize_splits_cjk_characters():
+    """CJK characters are tokens of their own, words are lowercased."""
+    assert tokenize("OpenAI 发布 GPT-5") == ["openai", "发", "布", "gpt", "5"]